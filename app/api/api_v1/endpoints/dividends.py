@@ -1,8 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
+import asyncio
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from typing import Optional, Dict, Any, List
 from datetime import date, datetime, timedelta
 from statistics import mean
 import structlog
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from app.api.deps import get_current_user_from_api_key
 from app.schemas.financial import DividendResponse, DividendAnalysisResponse
@@ -13,11 +18,27 @@ router = APIRouter()
 logger = structlog.get_logger()
 
 
+# The analysis payload holds NumPy scalars, dates, int-keyed year maps and read-only
+# placeholder mappings (encoded through default=dict)
+_ORJSON_OPTIONS = (orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS) if orjson is not None else 0
+
+
 def get_dividend_service() -> DividendService:
     """Get dividend service instance"""
     return DividendService()
 
 
+def _json_response(payload: Dict[str, Any]):
+    """
+    Encode a large analytics dict in one orjson pass, skipping FastAPI's
+    recursive jsonable_encoder walk; falls back to the default encoding
+    when orjson is not installed.
+    """
+    if orjson is None:
+        return payload
+    return Response(content=orjson.dumps(payload, default=dict, option=_ORJSON_OPTIONS), media_type="application/json")
+
+
 @router.get("/{ticker}/analysis")
 async def get_dividend_analysis(
     ticker: str,
@@ -75,7 +96,7 @@ async def get_dividend_analysis(
             include_peer_comparison=include_peer_comparison
         )
         
-        return analysis
+        return _json_response(analysis)
         
     except TickerNotFoundError:
         raise HTTPException(
@@ -182,8 +203,10 @@ async def get_current_dividend_info(
         end_date = date.today()
         start_date = end_date - timedelta(days=365 * 2)  # 2 years
         
-        dividends = await dividend_service._get_yfinance_dividends(ticker.upper(), start_date, end_date)
-        market_data = await dividend_service._fetch_market_data(ticker.upper())
+        dividends, market_data = await asyncio.gather(
+            dividend_service._get_yfinance_dividends(ticker.upper(), start_date, end_date),
+            dividend_service._fetch_market_data(ticker.upper())
+        )
         
         if not dividends:
             raise HTTPException(
@@ -191,7 +214,7 @@ async def get_current_dividend_info(
                 detail=f"No dividend data found for {ticker}"
             )
         
-        current_metrics = dividend_service._get_current_dividend_metrics(dividends, market_data)
+        current_metrics = dividend_service._get_current_dividend_metrics(dividends, market_data.get('current_price') or 0.0)
         
         return {
             'ticker': ticker.upper(),
@@ -236,9 +259,11 @@ async def get_dividend_forecast(
         end_date = date.today()
         start_date = end_date - timedelta(days=365 * 10)  # 10 years for robust forecasting
         
-        dividends = await dividend_service._get_yfinance_dividends(ticker.upper(), start_date, end_date)
-        financials = await dividend_service._fetch_comprehensive_financials(ticker.upper())
-        economic_context = await dividend_service._fetch_economic_context()
+        dividends, financials, economic_context = await asyncio.gather(
+            dividend_service._get_yfinance_dividends(ticker.upper(), start_date, end_date),
+            dividend_service._fetch_comprehensive_financials(ticker.upper()),
+            dividend_service._fetch_economic_context()
+        )
         
         if not dividends:
             raise HTTPException(
@@ -407,11 +432,11 @@ async def get_yield_vs_price_chart(
         end_date = date.today()
         start_date = end_date - timedelta(days=365 * years)
         
-        # Get historical data
-        import yfinance as yf
-        stock = yf.Ticker(ticker.upper())
-        hist = stock.history(start=start_date, end=end_date)
-        dividends = await dividend_service._get_yfinance_dividends(ticker.upper(), start_date, end_date)
+        # Get historical data; prices download alongside the dividend fetch
+        hist, dividends = await asyncio.gather(
+            dividend_service.get_price_history(ticker, start_date, end_date),
+            dividend_service._get_yfinance_dividends(ticker.upper(), start_date, end_date)
+        )
         
         # Calculate quarterly yield and price data
         chart_data = []
@@ -483,8 +508,10 @@ async def get_payout_ratio_chart(
         end_date = date.today()
         start_date = end_date - timedelta(days=365 * years)
         
-        dividends = await dividend_service._get_yfinance_dividends(ticker.upper(), start_date, end_date)
-        financials = await dividend_service._fetch_comprehensive_financials(ticker.upper())
+        dividends, financials = await asyncio.gather(
+            dividend_service._get_yfinance_dividends(ticker.upper(), start_date, end_date),
+            dividend_service._fetch_comprehensive_financials(ticker.upper())
+        )
         
         # Get annual data
         annual_dividends = dividend_service._aggregate_annual_dividends(dividends)
@@ -621,9 +648,8 @@ async def get_peer_comparison_chart(
             peer_list = [t.strip().upper() for t in sector_tickers.split(',') if t.strip().upper() != ticker.upper()]
         else:
             # Auto-detect peers using yfinance sector info
-            import yfinance as yf
             try:
-                target_info = yf.Ticker(ticker).info
+                target_info = await dividend_service._fetch_ticker_info(ticker)
                 target_sector = target_info.get('sector')
             except Exception:
                 target_sector = None
@@ -653,7 +679,7 @@ async def get_peer_comparison_chart(
             if not peer_list and target_sector:
                 import pandas as pd
                 try:
-                    sp500 = pd.read_html('https://en.wikipedia.org/wiki/List_of_S%26P_500_companies')[0]
+                    sp500 = (await asyncio.to_thread(pd.read_html, 'https://en.wikipedia.org/wiki/List_of_S%26P_500_companies'))[0]
                     sector_matches = sp500[sp500['GICS Sector'] == target_sector]['Symbol'].tolist()
                     peer_list = [sym for sym in sector_matches if sym != ticker.upper()][:5]
                 except Exception:
@@ -662,7 +688,7 @@ async def get_peer_comparison_chart(
             # Secondary fallback: use yfinance peers API
             if not peer_list:
                 try:
-                    peer_list = yf.Ticker(ticker).get_peers()[:5]
+                    peer_list = (await dividend_service.get_peer_tickers(ticker))[:5]
                     peer_list = [sym for sym in peer_list if sym != ticker.upper()]
                 except Exception:
                     peer_list = []
@@ -687,12 +713,14 @@ async def get_peer_comparison_chart(
         peer_list = peer_list[:5]
 
         # Get peer metrics in parallel
-        peer_metrics = {}
-        for peer in peer_list:
-            try:
-                peer_metrics[peer] = await _get_company_metrics_for_comparison(dividend_service, peer)
-            except:
-                continue
+        peer_results = await asyncio.gather(
+            *(_get_company_metrics_for_comparison(dividend_service, peer) for peer in peer_list),
+            return_exceptions=True
+        )
+        peer_metrics = {
+            peer: result for peer, result in zip(peer_list, peer_results)
+            if not isinstance(result, BaseException)
+        }
         
         # Calculate sector benchmarks based on peer set
         import statistics as _stats
@@ -774,11 +802,11 @@ async def get_total_return_breakdown_chart(
         end_date = date.today()
         start_date = end_date - timedelta(days=365 * years)
         
-        # Get dividend and price data
-        import yfinance as yf
-        stock = yf.Ticker(ticker.upper())
-        hist = stock.history(start=start_date, end=end_date)
-        dividends = await dividend_service._get_yfinance_dividends(ticker.upper(), start_date, end_date)
+        # Get dividend and price data; prices download alongside the dividend fetch
+        hist, dividends = await asyncio.gather(
+            dividend_service.get_price_history(ticker, start_date, end_date),
+            dividend_service._get_yfinance_dividends(ticker.upper(), start_date, end_date)
+        )
         
         # Calculate annual returns
         annual_data = {}
@@ -857,9 +885,11 @@ async def _get_company_metrics_for_comparison(dividend_service: DividendService,
         end_date = date.today()
         start_date = end_date - timedelta(days=365 * 5)
         
-        dividends = await dividend_service._get_yfinance_dividends(ticker, start_date, end_date)
-        market_data = await dividend_service._fetch_market_data(ticker)
-        financials = await dividend_service._fetch_comprehensive_financials(ticker)
+        dividends, market_data, financials = await asyncio.gather(
+            dividend_service._get_yfinance_dividends(ticker, start_date, end_date),
+            dividend_service._fetch_market_data(ticker),
+            dividend_service._fetch_comprehensive_financials(ticker)
+        )
         
         # Calculate metrics
         current_price = market_data.get('current_price', 0)
@@ -7,6 +7,7 @@ import structlog
 
 from app.core.config import settings, validate_api_keys
 from app.core.database import init_db, close_db
+from app.services.dividend_service import close_http_session
 from app.api.api_v1.api import api_router
 from app.utils.exceptions import YieldflowException
 
@@ -206,6 +207,13 @@ async def shutdown_event():
     except Exception as e:
         logger.error("Error closing database connections", error=str(e))
     
+    # Close the pooled provider HTTP session
+    try:
+        await close_http_session()
+        logger.info("Provider HTTP session closed")
+    except Exception as e:
+        logger.error("Error closing provider HTTP session", error=str(e))
+    
     logger.info("Yieldflow API shutdown completed")
 
 
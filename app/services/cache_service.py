@@ -1,5 +1,6 @@
 import json
 import hashlib
+import time
 from typing import Optional, Any, Dict
 import redis.asyncio as redis
 from datetime import datetime, timedelta
@@ -11,6 +12,44 @@ from app.utils.exceptions import CacheError
 logger = structlog.get_logger()
 
 
+class LocalTTLCache:
+    """Bounded in-process cache with per-entry expiry for hot per-worker data"""
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: Dict[Any, tuple] = {}
+    
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Get value if present and not expired"""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return default
+        return value
+    
+    def set(self, key: Any, value: Any) -> None:
+        """Store value, evicting expired then oldest entries when full"""
+        now = time.monotonic()
+        self._data.pop(key, None)
+        if len(self._data) >= self.maxsize:
+            for stale_key in [k for k, (expires_at, _) in self._data.items() if expires_at <= now]:
+                del self._data[stale_key]
+            while len(self._data) >= self.maxsize:
+                del self._data[next(iter(self._data))]
+        self._data[key] = (now + self.ttl, value)
+    
+    def clear(self) -> None:
+        """Drop all entries"""
+        self._data.clear()
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
+
 class CacheService:
     """Redis-based caching service with multiple TTL levels"""
     
@@ -1070,6 +1070,9 @@ class DataProvider:
     # Utility methods
     def _safe_float(self, value) -> Optional[float]:
         """Safely convert value to float"""
+        # Numbers (the common case) skip the string checks; NaN still maps to None
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return float(value) if value == value else None
         if value is None or value == '' or str(value).lower() in ['none', 'nan', 'n/a']:
             return None
         try:
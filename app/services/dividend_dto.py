@@ -0,0 +1,78 @@
+"""
+Result objects for the dividend scoring helpers.
+
+The scorers build these fixed-field objects instead of nested dicts; the
+dict payload used in API responses is produced by ``to_dict()`` only where
+the response is assembled.
+"""
+from dataclasses import dataclass
+from typing import Any, Dict, List, NamedTuple, Tuple
+
+
+class CoverageRatios(NamedTuple):
+    """TTM dividend and the coverage ratios shared by the sustainability, coverage and risk analytics"""
+    ttm_dividend: float
+    payout_ratio: float
+    eps_coverage: float
+    fcf_coverage: float
+
+
+@dataclass
+class QualityScore:
+    """Weighted dividend quality score (0-100) with its normalised components"""
+    __slots__ = ('quality_score', 'grade', 'rating', 'components', 'investment_recommendation')
+
+    quality_score: float
+    grade: str
+    rating: str
+    components: Tuple[float, float, float, float, float]  # consistency, growth, coverage, yield quality, financial strength
+    investment_recommendation: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        consistency, growth, coverage, yield_quality, financial_strength = self.components
+        return {
+            'quality_score': round(self.quality_score, 1),
+            'grade': self.grade,
+            'rating': self.rating,
+            'components': {
+                'consistency_score': round(consistency, 1),
+                'growth_score': round(growth, 1),
+                'coverage_score': round(coverage, 1),
+                'yield_quality_score': round(yield_quality, 1),
+                'financial_strength_score': round(financial_strength, 1)
+            },
+            'investment_recommendation': self.investment_recommendation
+        }
+
+
+@dataclass
+class SustainabilityAnalysis:
+    """Cash flow-based sustainability score (0-100) with its key ratios"""
+    __slots__ = ('sustainability_score', 'sustainability_rating', 'payout_ratio', 'fcf_coverage_ratio',
+                 'debt_service_coverage', 'earnings_volatility', 'working_capital_ratio',
+                 'risk_factors', 'strengths')
+
+    sustainability_score: int
+    sustainability_rating: str
+    payout_ratio: float
+    fcf_coverage_ratio: float
+    debt_service_coverage: float
+    earnings_volatility: float
+    working_capital_ratio: float
+    risk_factors: List[str]
+    strengths: List[str]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'sustainability_score': self.sustainability_score,
+            'sustainability_rating': self.sustainability_rating,
+            'key_ratios': {
+                'payout_ratio': round(self.payout_ratio, 3),
+                'fcf_coverage_ratio': round(self.fcf_coverage_ratio, 2),
+                'debt_service_coverage': round(self.debt_service_coverage, 2),
+                'earnings_volatility': round(self.earnings_volatility, 3),
+                'working_capital_ratio': round(self.working_capital_ratio, 2)
+            },
+            'risk_factors': self.risk_factors,
+            'strengths': self.strengths
+        }
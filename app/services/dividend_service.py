@@ -3,19 +3,34 @@ import aiohttp
 import yfinance as yf
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Any, Tuple
-from datetime import datetime, date, timedelta
+from typing import Dict, List, Mapping, Optional, Any, Tuple
+from datetime import datetime, date, timedelta, timezone
 import structlog
-from statistics import mean, stdev
+import copy
+import json
 import math
+from collections import defaultdict
+from operator import itemgetter
+from types import MappingProxyType
 try:
     from fredapi import Fred
 except ImportError:
     Fred = None
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from app.core.config import settings
 from app.utils.exceptions import DataSourceError, TickerNotFoundError, ValidationError
-from app.services.cache_service import CacheService
+from app.services.cache_service import CacheService, LocalTTLCache
+from app.services.dividend_dto import CoverageRatios, QualityScore, SustainabilityAnalysis
+from app.utils.calculations import (
+    score_sustainability, score_consistency, score_growth, score_coverage,
+    score_yield_quality, score_financial_strength, score_quality,
+    percentile_rank, coef_of_variation, cagr, growth_rates, growth_rate_std, growth_summary, increase_streak, pearson,
+    merge_consensus
+)
 from app.schemas.financial import (
     DividendResponse, DividendAnalysisResponse, DividendForecast,
     DividendType, DividendFrequency, ComprehensiveDividendResponse
@@ -24,6 +39,507 @@ from app.schemas.financial import (
 # Use structlog for contextual logging so we can pass keyword arguments like 'ticker' safely
 logger = structlog.get_logger()
 
+# Yahoo Finance `info` payloads shared across requests (the service is created per request),
+# stored as read-only mappings so no caller can corrupt the cached copy
+TICKER_INFO_TTL = 900  # 15 minutes
+_ticker_info_cache = LocalTTLCache(maxsize=512, ttl=TICKER_INFO_TTL)
+
+# yf.Ticker handles shared by the dividend, statement and info helpers
+YF_TICKER_TTL = 300  # 5 minutes
+_yf_ticker_cache = LocalTTLCache(maxsize=1024, ttl=YF_TICKER_TTL)
+
+# JSON decoder for provider responses: orjson when installed, otherwise the stdlib
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Concurrent FRED observation requests per indicator refresh
+FRED_MAX_CONCURRENT_REQUESTS = 5
+
+# Finished comprehensive analyses, keyed by ticker, resolved date range and optional sections.
+# Repeat requests for popular tickers skip the provider fetches; the bound keeps memory in check.
+# Only analyses built from four successful fetches are stored, and every caller gets its own
+# deep copy, so mutating a response never leaks into the cached entry.
+ANALYSIS_TTL = 900  # 15 minutes
+_analysis_cache = LocalTTLCache(maxsize=256, ttl=ANALYSIS_TTL)
+
+# Placeholders for optional analysis sections that were not requested. Shared by every
+# response, so they are read-only views rather than dicts a caller could mutate
+_NOT_REQUESTED_FORECAST = MappingProxyType({
+    'status': 'not_requested',
+    'message': 'Forecast not included in this analysis'
+})
+_NOT_REQUESTED_PEER_COMPARISON = MappingProxyType({
+    'status': 'not_requested',
+    'message': 'Peer comparison not included in this analysis'
+})
+
+# Per-provider deadline for the multi-source dividend fetch; a slow source is
+# dropped (like a failed one) instead of holding up the merge
+DIVIDEND_PROVIDER_TIMEOUT = 10.0  # seconds
+
+# FRED indicators update daily at most; one read-only snapshot is shared by every request
+FRED_INDICATORS_TTL = 3600  # 1 hour
+_fred_indicators_cache = LocalTTLCache(maxsize=1, ttl=FRED_INDICATORS_TTL)
+
+# Pooled HTTP session shared by the Alpha Vantage, FMP and FRED fetchers so warm
+# connections (TLS, DNS) are reused across requests. Created lazily on the running loop
+HTTP_CONNECTION_LIMIT = 100
+HTTP_CONNECTION_LIMIT_PER_HOST = 20
+HTTP_DNS_CACHE_TTL = 300  # 5 minutes
+_http_session: Optional[aiohttp.ClientSession] = None
+_http_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# Quality score grading on the 0-100 scale: index = number of thresholds at or below the score
+_QUALITY_GRADE_THRESHOLDS = np.array([30, 40, 50, 60, 70, 80, 90], dtype=np.float64)
+_QUALITY_GRADES = ('F', 'D', 'C', 'C+', 'B', 'B+', 'A', 'A+')
+_QUALITY_RATINGS = ('Very Poor', 'Poor', 'Below Average', 'Fair', 'Good', 'Very Good', 'Excellent', 'Exceptional')
+_RECOMMENDATION_THRESHOLDS = np.array([40, 60, 70, 80], dtype=np.float64)
+_RECOMMENDATIONS = ('Avoid', 'Weak Hold', 'Hold', 'Buy', 'Strong Buy')
+_SUSTAINABILITY_THRESHOLDS = np.array([30, 50, 70, 85], dtype=np.float64)
+_SUSTAINABILITY_RATINGS = ('Very Low', 'Low', 'Moderate', 'High', 'Very High')
+
+# Dividend risk score tables. Payout and treasury bands use side='left' (strict >),
+# coverage bands use side='right' (strict <) to match the original cut-offs.
+_PAYOUT_RISK_THRESHOLDS = np.array([0.4, 0.6, 0.8, 1.0])
+_PAYOUT_RISK_SCORES = np.array([0, 10, 20, 30, 40])
+_COVERAGE_RISK_THRESHOLDS = np.array([1.0, 1.5, 2.0, 3.0])
+_COVERAGE_RISK_SCORES = np.array([40, 30, 20, 10, 0])
+_TREASURY_RISK_THRESHOLDS = np.array([4.0, 5.0, 6.0])
+_TREASURY_RISK_SCORES = np.array([0, 10, 15, 20])
+_RISK_RATING_THRESHOLDS = np.array([20, 40, 60, 80])
+
+# Multi-factor risk analytics: four 25-point factors in five-point tiers. Payout,
+# treasury and debt/equity tiers use side='left' (strict >); FCF coverage tiers use
+# side='right' (strict <) against the descending point table.
+_ANALYTICS_PAYOUT_RISK_THRESHOLDS = np.array([0.2, 0.4, 0.6, 0.8, 1.0])
+_ANALYTICS_COVERAGE_RISK_THRESHOLDS = np.array([1.0, 1.5, 2.0, 2.5, 3.0])
+_ANALYTICS_TREASURY_RISK_THRESHOLDS = np.array([2.0, 3.0, 4.0, 5.0, 6.0])
+_ANALYTICS_DEBT_RISK_THRESHOLDS = np.array([0.1, 0.25, 0.5, 0.75, 1.0])
+_ANALYTICS_RISK_POINTS = np.array([0, 5, 10, 15, 20, 25])
+_ANALYTICS_COVERAGE_RISK_POINTS = _ANALYTICS_RISK_POINTS[::-1].copy()
+_RISK_RATINGS = ('Very Low', 'Low', 'Moderate', 'High', 'Very High')
+
+# Industry-standard coverage ratio grades (side='right': each band includes its lower bound);
+# the assessment text tops out at 2.5x, so the A and A+ tiers share it
+_COVERAGE_RATIO_THRESHOLDS = np.array([1.0, 1.5, 2.0, 2.5, 3.0])
+_COVERAGE_RATIO_GRADES = (
+    ('F', 'Very Poor'), ('D', 'Poor'), ('C', 'Fair'), ('B', 'Good'), ('A', 'Very Good'), ('A+', 'Excellent')
+)
+_COVERAGE_ASSESSMENTS = (
+    "Poor Coverage - High risk of dividend suspension",
+    "Weak Coverage - Risk of dividend cuts",
+    "Fair Coverage - Adequate but watch closely",
+    "Good Coverage - Solid dividend capacity",
+    "Excellent Coverage - Strong dividend sustainability",
+    "Excellent Coverage - Strong dividend sustainability"
+)
+
+# Coverage grade: each ratio maps to a tier (count of cut-offs it exceeds); the grade is the weaker tier
+_EPS_COVERAGE_GRADE_THRESHOLDS = np.array([1.5, 2.0, 2.5])
+_FCF_COVERAGE_GRADE_THRESHOLDS = np.array([1.2, 1.5, 2.0])
+_COVERAGE_GRADES = ('D', 'C', 'B', 'A')
+
+# Legacy 0-10 quality score: payout points per band (bands include their upper bound)
+_PAYOUT_QUALITY_THRESHOLDS = np.array([60, 80, 100])
+_PAYOUT_QUALITY_POINTS = np.array([2.0, 1.5, 1.0, 0.0])
+
+# Legacy 0-10 dividend risk: points per band and the factor reported for it. Payout and
+# debt bands use side='left' (strict >), interest coverage side='right' (strict <)
+_PAYOUT_RISK_BANDS = np.array([60, 80, 100])
+_PAYOUT_RISK_POINTS = (0.0, 1.0, 2.0, 3.0)
+_PAYOUT_RISK_FACTORS = (None, "Moderate payout ratio (>60%)", "High payout ratio (>80%)", "Payout ratio exceeds 100%")
+_DEBT_RISK_BANDS = np.array([1.0, 2.0])
+_DEBT_RISK_POINTS = (0.0, 1.5, 2.5)
+_DEBT_RISK_FACTORS = (None, "High debt-to-equity ratio", "Very high debt-to-equity ratio")
+_INTEREST_RISK_BANDS = np.array([2.0, 5.0])
+_INTEREST_RISK_POINTS = (2.0, 1.0, 0.0)
+_INTEREST_RISK_FACTORS = ("Low interest coverage ratio", "Moderate interest coverage concern", None)
+_LEGACY_RISK_RATING_THRESHOLDS = np.array([2.0, 4.0, 7.0])
+_LEGACY_RISK_RATINGS = ('LOW', 'LOW-MODERATE', 'MODERATE', 'HIGH')
+# Risk score net of quality and streak credits (side='left': bands include their upper bound)
+_ADJUSTED_RISK_THRESHOLDS = np.array([1.0, 3.0, 5.0, 7.0])
+_ADJUSTED_RISK_RATINGS = ('EXCELLENT', 'GOOD', 'FAIR', 'POOR', 'VERY_POOR')
+_LEGACY_RECOMMENDATION_THRESHOLDS = np.array([50, 60, 70, 80], dtype=np.float64)
+_LEGACY_RECOMMENDATIONS = ('Sell', 'Weak Hold', 'Hold', 'Buy', 'Strong Buy')
+
+# Coverage adequacy: like the coverage grade, the weaker of the EPS and FCF tiers (strict >)
+_EPS_ADEQUACY_THRESHOLDS = np.array([1.0, 1.5, 2.0, 2.5])
+_FCF_ADEQUACY_THRESHOLDS = np.array([1.0, 1.2, 1.5, 2.0])
+_COVERAGE_ADEQUACY = ('Poor Coverage', 'Marginal Coverage', 'Adequate Coverage', 'Good Coverage', 'Excellent Coverage')
+
+# Yield attractiveness: the yield tier, capped by the percentile (<=50 caps at 'Moderate', <=70 at 'Attractive')
+_ATTRACTIVE_YIELD_THRESHOLDS = np.array([1.0, 2.0, 3.0, 4.0])
+_ATTRACTIVE_PERCENTILE_THRESHOLDS = np.array([50, 70])
+_YIELD_ATTRACTIVENESS = ('Very Low', 'Low', 'Moderate', 'Attractive', 'Very Attractive')
+
+# Yield stability from the coefficient of variation of historical yields (side='right', strict <)
+_STABILITY_THRESHOLDS = np.array([0.15, 0.25, 0.35, 0.50])
+_STABILITY_RATINGS = ('Very Stable', 'Stable', 'Moderate', 'Volatile', 'Very Volatile')
+
+# Dividend providers queried by _fetch_multi_source_dividends, in merge priority order
+_DIVIDEND_SOURCES = ('yahoo_finance', 'alpha_vantage', 'fmp')
+# Source names (priority order) for every bitmask of agreeing sources, indexed by the mask
+_SOURCE_SETS = tuple(
+    tuple(name for bit, name in enumerate(_DIVIDEND_SOURCES) if mask >> bit & 1)
+    for mask in range(1 << len(_DIVIDEND_SOURCES))
+)
+
+# Trailing window for "last twelve months" dividend totals
+_TRAILING_YEAR = timedelta(days=365)
+_TRAILING_YEAR_DAYS = np.timedelta64(365, 'D')
+
+# CAGR windows (years of annual totals) reported by _calculate_growth_analytics
+_CAGR_PERIODS = np.array([3, 5, 10])
+
+# Look-back periods (years) reported by _calculate_growth_metrics
+_GROWTH_PERIODS = np.array([1, 3, 5, 10])
+
+# Payments per year for each frequency label produced by _infer_frequency
+_PAYMENTS_PER_YEAR = {
+    'Quarterly': 4,
+    'Semi-Annual': 2,
+    'Annual': 1,
+    'Monthly': 12,
+    'Irregular': 4  # Default assumption
+}
+
+# Industry dividend yield benchmarks (updated with more current data - Q4 2024)
+_SECTOR_BENCHMARKS = {
+    'Technology': {'yield_range': [0.3, 2.8], 'payout_target': 30, 'growth_expectation': 12, 'avg_yield': 1.8, 'payout_ratio': 30},
+    'Utilities': {'yield_range': [2.8, 6.2], 'payout_target': 75, 'growth_expectation': 2, 'avg_yield': 4.8, 'payout_ratio': 75},
+    'Real Estate': {'yield_range': [3.2, 7.5], 'payout_target': 90, 'growth_expectation': 3, 'avg_yield': 5.2, 'payout_ratio': 90},
+    'Consumer Staples': {'yield_range': [2.2, 4.5], 'payout_target': 65, 'growth_expectation': 4, 'avg_yield': 3.1, 'payout_ratio': 65},
+    'Healthcare': {'yield_range': [1.8, 4.2], 'payout_target': 50, 'growth_expectation': 8, 'avg_yield': 2.8, 'payout_ratio': 50},
+    'Financials': {'yield_range': [2.5, 5.8], 'payout_target': 45, 'growth_expectation': 6, 'avg_yield': 3.8, 'payout_ratio': 45},
+    'Energy': {'yield_range': [3.5, 8.2], 'payout_target': 40, 'growth_expectation': 1, 'avg_yield': 5.5, 'payout_ratio': 40},
+    'Industrials': {'yield_range': [1.5, 4.0], 'payout_target': 55, 'growth_expectation': 7, 'avg_yield': 2.8, 'payout_ratio': 55},
+    'Communication Services': {'yield_range': [1.2, 6.5], 'payout_target': 60, 'growth_expectation': 5, 'avg_yield': 3.5, 'payout_ratio': 60},
+    'Consumer Discretionary': {'yield_range': [0.8, 3.5], 'payout_target': 35, 'growth_expectation': 9, 'avg_yield': 2.0, 'payout_ratio': 35},
+    'Materials': {'yield_range': [2.0, 5.0], 'payout_target': 50, 'growth_expectation': 4, 'avg_yield': 3.2, 'payout_ratio': 50}
+}
+
+# Industry-standard sector benchmark ranges (p25/p50/p75) used by _get_sector_benchmarking
+_SECTOR_PERCENTILE_BENCHMARKS = {
+    'Technology': {
+        'yield': {'p25': 0.5, 'p50': 1.2, 'p75': 2.0},
+        'quality_score': {'p25': 65, 'p50': 75, 'p75': 85},
+        'growth_3y': {'p25': 8, 'p50': 15, 'p75': 25},
+        'payout_ratio': {'p25': 15, 'p50': 25, 'p75': 40},
+        'coverage_ratio': {'p25': 3.0, 'p50': 5.0, 'p75': 8.0}
+    },
+    'Utilities': {
+        'yield': {'p25': 3.0, 'p50': 4.2, 'p75': 5.5},
+        'quality_score': {'p25': 70, 'p50': 80, 'p75': 90},
+        'growth_3y': {'p25': 2, 'p50': 4, 'p75': 6},
+        'payout_ratio': {'p25': 60, 'p50': 75, 'p75': 85},
+        'coverage_ratio': {'p25': 1.2, 'p50': 1.5, 'p75': 2.0}
+    },
+    'Consumer Defensive': {
+        'yield': {'p25': 2.0, 'p50': 3.0, 'p75': 4.5},
+        'quality_score': {'p25': 75, 'p50': 85, 'p75': 95},
+        'growth_3y': {'p25': 3, 'p50': 6, 'p75': 10},
+        'payout_ratio': {'p25': 45, 'p50': 60, 'p75': 75},
+        'coverage_ratio': {'p25': 1.8, 'p50': 2.5, 'p75': 3.5}
+    },
+    'Healthcare': {
+        'yield': {'p25': 1.5, 'p50': 2.5, 'p75': 3.8},
+        'quality_score': {'p25': 70, 'p50': 80, 'p75': 90},
+        'growth_3y': {'p25': 4, 'p50': 8, 'p75': 12},
+        'payout_ratio': {'p25': 35, 'p50': 50, 'p75': 65},
+        'coverage_ratio': {'p25': 2.0, 'p50': 3.0, 'p75': 4.5}
+    },
+    'Financial Services': {
+        'yield': {'p25': 2.5, 'p50': 3.5, 'p75': 4.8},
+        'quality_score': {'p25': 60, 'p50': 70, 'p75': 80},
+        'growth_3y': {'p25': 5, 'p50': 8, 'p75': 12},
+        'payout_ratio': {'p25': 25, 'p50': 35, 'p75': 50},
+        'coverage_ratio': {'p25': 2.5, 'p50': 3.5, 'p75': 5.0}
+    }
+}
+
+# Default benchmarks for sectors not specifically defined
+_DEFAULT_PERCENTILE_BENCHMARKS = {
+    'yield': {'p25': 1.5, 'p50': 2.5, 'p75': 4.0},
+    'quality_score': {'p25': 65, 'p50': 75, 'p75': 85},
+    'growth_3y': {'p25': 3, 'p50': 7, 'p75': 12},
+    'payout_ratio': {'p25': 30, 'p50': 50, 'p75': 70},
+    'coverage_ratio': {'p25': 2.0, 'p50': 3.0, 'p75': 4.5}
+}
+
+# Latest-period statement line items read by _get_company_financial_metrics (metric -> Yahoo row label)
+_INCOME_STATEMENT_ITEMS = {
+    'net_income': 'Net Income',
+    'total_revenue': 'Total Revenue',
+    'operating_income': 'Operating Income',
+    'interest_expense': 'Interest Expense'
+}
+_BALANCE_SHEET_ITEMS = {
+    'total_assets': 'Total Assets',
+    'total_debt': 'Total Debt',
+    'shareholders_equity': 'Stockholders Equity',
+    'current_assets': 'Current Assets',
+    'current_liabilities': 'Current Liabilities'
+}
+_CASH_FLOW_ITEMS = {
+    'operating_cash_flow': 'Operating Cash Flow',
+    'capital_expenditures': 'Capital Expenditures',
+    'dividends_paid': 'Dividends Paid'
+}
+
+
+def _get_yf_ticker(ticker: str) -> yf.Ticker:
+    """Shared yf.Ticker handle; yfinance memoises fetched statements on the handle itself"""
+    cache_key = ticker.upper()
+    stock = _yf_ticker_cache.get(cache_key)
+    if stock is None:
+        stock = yf.Ticker(ticker)
+        _yf_ticker_cache.set(cache_key, stock)
+    return stock
+
+
+async def _get_http_session() -> aiohttp.ClientSession:
+    """Shared provider session; reopened if it was closed or belongs to another event loop"""
+    global _http_session, _http_session_loop
+    loop = asyncio.get_running_loop()
+    if _http_session is None or _http_session.closed or _http_session_loop is not loop:
+        if _http_session is not None and not _http_session.closed:
+            # Release the previous loop's connector; if that loop is gone its sockets can't be
+            # closed cleanly, so log and discard it rather than fail the request
+            try:
+                await _http_session.close()
+            except Exception as e:
+                logger.debug("Discarded provider session from a previous event loop", error=str(e))
+        _http_session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(
+            limit=HTTP_CONNECTION_LIMIT, limit_per_host=HTTP_CONNECTION_LIMIT_PER_HOST, ttl_dns_cache=HTTP_DNS_CACHE_TTL
+        ))
+        _http_session_loop = loop
+    return _http_session
+
+
+async def close_http_session() -> None:
+    """Close the shared provider session (application shutdown)"""
+    global _http_session, _http_session_loop
+    if _http_session is not None and not _http_session.closed:
+        await _http_session.close()
+    _http_session = _http_session_loop = None
+
+
+def _fetch_info_sync(ticker: str) -> Dict[str, Any]:
+    """Blocking Yahoo Finance info fetch, run via asyncio.to_thread"""
+    return _get_yf_ticker(ticker).info
+
+
+def _copy_analysis(value: Any) -> Any:
+    """Deep copy of a cached analysis; read-only MappingProxyType views are shared, not copied"""
+    if isinstance(value, dict):
+        return {key: _copy_analysis(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_analysis(item) for item in value]
+    if isinstance(value, MappingProxyType):
+        return value
+    return copy.deepcopy(value)
+
+
+def _chart_column(chart_data: List[Dict], field: str) -> np.ndarray:
+    """One numeric field of chart rows as a float64 array (None becomes NaN)"""
+    return np.array([row[field] for row in chart_data], dtype=np.float64)
+
+
+def _parse_ymd(value: str) -> date:
+    """Parse a 'YYYY-MM-DD' provider date; date.fromisoformat avoids strptime's per-call format parsing"""
+    return date.fromisoformat(value)
+
+
+def _compute_ttm(amounts: np.ndarray, ex_dates: np.ndarray) -> float:
+    """
+    Trailing-twelve-months total over newest-first arrays: payments in the 365 days
+    up to and including the latest ex-date, so monthly and semi-annual payers (and
+    skipped quarters) are summed by date rather than as the latest four payments.
+    """
+    if not ex_dates.size:
+        return 0.0
+    cutoff = ex_dates[0] - _TRAILING_YEAR_DAYS
+    # Ascending view; payments on or before the cutoff fall outside the window
+    older = int(np.searchsorted(ex_dates[::-1], cutoff, side='right'))
+    return float(amounts[:ex_dates.size - older].sum())
+
+
+def _cagr_by_period(values_desc: np.ndarray) -> Dict[str, float]:
+    """
+    CAGR (percent) for each _CAGR_PERIODS window the newest-first annual totals cover,
+    as one vector over the periods; windows starting at a zero total are skipped.
+    """
+    periods = _CAGR_PERIODS[_CAGR_PERIODS <= values_desc.size]
+    start_values = values_desc[periods - 1]
+    valid = start_values > 0
+    periods, start_values = periods[valid], start_values[valid]
+    cagrs = np.round(((values_desc[0] / start_values) ** (1.0 / periods) - 1) * 100, 2)
+    return dict(zip((f'{period}y_cagr' for period in periods.tolist()), cagrs.tolist()))
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as a naive ISO-8601 string, the format datetime.utcnow().isoformat() produced"""
+    return datetime.now(timezone.utc).replace(tzinfo=None).isoformat()
+
+
+def _fetch_history_sync(ticker: str, start_date: date, end_date: date) -> pd.DataFrame:
+    """Blocking Yahoo Finance price/actions history fetch, run via asyncio.to_thread"""
+    return _get_yf_ticker(ticker).history(start=start_date, end=end_date, actions=True)
+
+
+def _fetch_statement_sync(ticker: str, statement: str) -> pd.DataFrame:
+    """Blocking Yahoo Finance statement fetch ('financials', 'balance_sheet', 'cashflow'), run via asyncio.to_thread"""
+    return getattr(_get_yf_ticker(ticker), statement)
+
+
+class DividendSeries:
+    """
+    Struct-of-arrays view over a dividend history (newest first).
+    Keeps ex-dates, amounts and confidence scores in contiguous NumPy arrays so
+    TTM sums and annual aggregation run as vector reductions (and window slices
+    are views) instead of per-dict lookups.
+    """
+    
+    __slots__ = ('ex_dates', 'amounts', 'confidence')
+    
+    def __init__(self, ex_dates: np.ndarray, amounts: np.ndarray, confidence: np.ndarray):
+        self.ex_dates = ex_dates
+        self.amounts = amounts
+        self.confidence = confidence
+    
+    @classmethod
+    def from_records(cls, dividends: List[Dict]) -> 'DividendSeries':
+        """Build from dividend dicts with 'ex_date', 'amount' and optional 'confidence_score' keys"""
+        count = len(dividends)
+        ex_dates = np.array([div['ex_date'] for div in dividends], dtype='datetime64[D]')
+        amounts = np.fromiter((div.get('amount', 0) for div in dividends), dtype=np.float64, count=count)
+        confidence = np.fromiter((div.get('confidence_score', 0.5) for div in dividends), dtype=np.float64, count=count)
+        return cls(ex_dates, amounts, confidence)
+    
+    @property
+    def years(self) -> np.ndarray:
+        """Calendar year of each ex-date"""
+        return self.ex_dates.astype('datetime64[Y]').astype(np.int64) + 1970
+    
+    def ttm(self) -> float:
+        """Sum of the payments in the trailing twelve months up to the latest ex-date"""
+        return _compute_ttm(self.amounts, self.ex_dates)
+    
+    def window_totals(self, limit: int, size: int = 4) -> np.ndarray:
+        """Totals of consecutive ``size``-payment windows over the latest ``limit`` payments (last one may be partial)"""
+        recent = self.amounts[:limit]
+        padded = np.zeros(-(-recent.size // size) * size, dtype=np.float64)
+        padded[:recent.size] = recent
+        return padded.reshape(-1, size).sum(axis=1)
+    
+    def amounts_since(self, start: date) -> np.ndarray:
+        """Amounts of payments with an ex-date on or after ``start``"""
+        return self.amounts[self.ex_dates >= np.datetime64(start, 'D')]
+    
+    def amounts_oldest_first(self) -> np.ndarray:
+        """Amounts ordered by ascending ex-date (stable, so same-day payments keep their order)"""
+        return self.amounts[np.argsort(self.ex_dates, kind='stable')]
+    
+    def total_since(self, start: date) -> Optional[float]:
+        """Sum of payments with an ex-date on or after ``start`` (None when there are none)"""
+        recent = self.amounts_since(start)
+        return float(recent.sum()) if recent.size else None
+    
+    def annual_totals(self) -> 'AnnualDividends':
+        """Dividend totals per year, keyed in order of first appearance"""
+        years, first_index, inverse = np.unique(self.years, return_index=True, return_inverse=True)
+        totals = np.bincount(inverse, weights=self.amounts, minlength=years.size)
+        order = np.argsort(first_index)
+        # np.unique already returns the years ascending, so hand them over pre-sorted
+        return AnnualDividends(zip(years[order].tolist(), totals[order].tolist()), years_asc=tuple(years.tolist()))
+
+
+class AnnualDividends(dict):
+    """
+    Year -> total dividend mapping that remembers its sorted years.
+    Growth and consistency helpers read ``years_asc`` / ``years_desc`` instead of
+    re-sorting the keys on every call. Treat as read-only once built.
+    """
+    
+    __slots__ = ('_years_asc', '_values_asc', '_growth_rates')
+    
+    def __init__(self, data=(), years_asc: Optional[tuple] = None):
+        super().__init__(data)
+        self._years_asc = years_asc
+        self._values_asc = None
+        self._growth_rates = None
+    
+    @property
+    def years_asc(self) -> tuple:
+        if self._years_asc is None:
+            self._years_asc = tuple(sorted(self))
+        return self._years_asc
+    
+    @property
+    def years_desc(self) -> tuple:
+        return self.years_asc[::-1]
+    
+    @property
+    def values_asc(self) -> np.ndarray:
+        """Annual totals ordered by ascending year (built once; read-only)"""
+        if self._values_asc is None:
+            self._values_asc = np.array([self[year] for year in self.years_asc], dtype=np.float64)
+            self._values_asc.flags.writeable = False
+        return self._values_asc
+    
+    @property
+    def values_desc(self) -> np.ndarray:
+        """Annual totals ordered newest year first"""
+        return self.values_asc[::-1]
+    
+    @property
+    def growth_rates(self) -> np.ndarray:
+        """Year-over-year growth, newest first, skipping years that follow a zero total (built once; read-only)"""
+        if self._growth_rates is None:
+            self._growth_rates = growth_rates(self.values_desc)
+            self._growth_rates.flags.writeable = False
+        return self._growth_rates
+    
+    def increase_streak(self) -> int:
+        """Consecutive year-over-year increases, counted back from the latest year"""
+        return int(increase_streak(self.values_desc, 0.0))
+
+
+class DividendHistory(list):
+    """
+    Dividend records (newest first) that lazily carry their DividendSeries, TTM
+    total and annual aggregation. The records stay plain dicts for the API payload;
+    numeric helpers use the cached values. Treat as read-only once any has been built.
+    """
+    
+    __slots__ = ('_series', '_ttm', '_annual_totals')
+    
+    def __init__(self, records=()):
+        super().__init__(records)
+        self._series = None
+        self._ttm = None
+        self._annual_totals = None
+    
+    @property
+    def series(self) -> DividendSeries:
+        if self._series is None:
+            self._series = DividendSeries.from_records(self)
+        return self._series
+    
+    @property
+    def ttm(self) -> float:
+        """Trailing-twelve-months total, summed once and shared by every analytics helper"""
+        if self._ttm is None:
+            self._ttm = self.series.ttm()
+        return self._ttm
+    
+    @property
+    def annual_totals(self) -> AnnualDividends:
+        """Per-year totals, computed once and shared by every analytics helper"""
+        if self._annual_totals is None:
+            self._annual_totals = self.series.annual_totals()
+        return self._annual_totals
+
+
 
 class DividendService:
     """Professional-grade dividend analysis service with advanced financial calculations"""
@@ -63,20 +579,8 @@ class DividendService:
         self.RISK_FREE_RATE_PROXY = 'GS10'  # 10-Year Treasury
         self.MARKET_BENCHMARK = 'SP500'     # S&P 500 Index
         
-        # Industry dividend yield benchmarks (updated with more current data - Q4 2024)
-        self.sector_benchmarks = {
-            'Technology': {'yield_range': [0.3, 2.8], 'payout_target': 30, 'growth_expectation': 12, 'avg_yield': 1.8, 'payout_ratio': 30},
-            'Utilities': {'yield_range': [2.8, 6.2], 'payout_target': 75, 'growth_expectation': 2, 'avg_yield': 4.8, 'payout_ratio': 75},
-            'Real Estate': {'yield_range': [3.2, 7.5], 'payout_target': 90, 'growth_expectation': 3, 'avg_yield': 5.2, 'payout_ratio': 90},
-            'Consumer Staples': {'yield_range': [2.2, 4.5], 'payout_target': 65, 'growth_expectation': 4, 'avg_yield': 3.1, 'payout_ratio': 65},
-            'Healthcare': {'yield_range': [1.8, 4.2], 'payout_target': 50, 'growth_expectation': 8, 'avg_yield': 2.8, 'payout_ratio': 50},
-            'Financials': {'yield_range': [2.5, 5.8], 'payout_target': 45, 'growth_expectation': 6, 'avg_yield': 3.8, 'payout_ratio': 45},
-            'Energy': {'yield_range': [3.5, 8.2], 'payout_target': 40, 'growth_expectation': 1, 'avg_yield': 5.5, 'payout_ratio': 40},
-            'Industrials': {'yield_range': [1.5, 4.0], 'payout_target': 55, 'growth_expectation': 7, 'avg_yield': 2.8, 'payout_ratio': 55},
-            'Communication Services': {'yield_range': [1.2, 6.5], 'payout_target': 60, 'growth_expectation': 5, 'avg_yield': 3.5, 'payout_ratio': 60},
-            'Consumer Discretionary': {'yield_range': [0.8, 3.5], 'payout_target': 35, 'growth_expectation': 9, 'avg_yield': 2.0, 'payout_ratio': 35},
-            'Materials': {'yield_range': [2.0, 5.0], 'payout_target': 50, 'growth_expectation': 4, 'avg_yield': 3.2, 'payout_ratio': 50}
-        }
+        # Industry dividend yield benchmarks (module-level table shared by every instance)
+        self.sector_benchmarks = _SECTOR_BENCHMARKS
 
     async def get_comprehensive_dividend_analysis(
         self,
@@ -98,51 +602,72 @@ class DividendService:
             if not start_date:
                 start_date = end_date - timedelta(days=365 * 15)  # 15 years for more robust analysis
             
-            # Multi-source data aggregation with parallel processing
-            data_tasks = await asyncio.gather(
-                self._fetch_multi_source_dividends(ticker, start_date, end_date),
-                self._fetch_comprehensive_financials(ticker),
-                self._fetch_market_data(ticker),
-                self._fetch_economic_context(),
-                return_exceptions=True
-            )
-            
-            dividends, financials, market_data, economic_context = [
-                result if not isinstance(result, Exception) else {} 
-                for result in data_tasks
-            ]
-            
-            if not dividends:
-                raise TickerNotFoundError(f"No dividend data found for {ticker}")
-            
-            # PROFESSIONAL FINANCIAL CALCULATIONS
-            
-            # 1. DIVIDEND QUALITY SCORE (0-100) WITH COMPONENT WEIGHTING
-            quality_analysis = self._calculate_professional_quality_score(dividends, financials)
+            cache_key = (ticker.upper(), start_date, end_date, include_forecast, include_peer_comparison)
+            cached = _analysis_cache.get(cache_key)
+            if cached is not None:
+                return _copy_analysis(cached)
             
-            # 2. SUSTAINABILITY ANALYSIS WITH FCF METRICS
-            sustainability_analysis = self._calculate_sustainability_metrics(dividends, financials)
+            # Multi-source data aggregation: all four fetches start at once and each
+            # analytics step runs as soon as the data it needs has arrived
+            dividends_task = asyncio.ensure_future(self._fetch_multi_source_dividends(ticker, start_date, end_date))
+            financials_task = asyncio.ensure_future(self._fetch_comprehensive_financials(ticker))
+            market_task = asyncio.ensure_future(self._fetch_market_data(ticker))
+            economic_task = asyncio.ensure_future(self._fetch_economic_context())
+            data_tasks = (dividends_task, financials_task, market_task, economic_task)
             
-            # 3. GROWTH ANALYTICS WITH CAGR CALCULATIONS
-            growth_analysis = self._calculate_growth_analytics(dividends)
-            
-            # 4. COVERAGE ANALYSIS WITH PROFESSIONAL GRADING
-            coverage_analysis = self._calculate_coverage_analytics(dividends, financials)
+            try:
+                dividends = await self._result_or_empty(dividends_task)
+                if not dividends:
+                    raise TickerNotFoundError(f"No dividend data found for {ticker}")
+                
+                # PROFESSIONAL FINANCIAL CALCULATIONS
+                
+                # 3. GROWTH ANALYTICS WITH CAGR CALCULATIONS (dividends only)
+                growth_analysis = self._calculate_growth_analytics(dividends)
+                
+                # Dividend-only quality aggregates (annual totals, TTM, yield windows) are built
+                # while the financials fetch is still in flight
+                score_aggregates = self._compute_all_score_components(dividends)
+                
+                financials = await self._result_or_empty(financials_task)
+                
+                # 1. DIVIDEND QUALITY SCORE (0-100) WITH COMPONENT WEIGHTING
+                quality_analysis = self._calculate_professional_quality_score(dividends, financials, aggregates=score_aggregates)
+                
+                # TTM dividend and payout / coverage ratios are shared by every section below
+                coverage_ratios = self._coverage_ratios(dividends, financials)
+                
+                # 2. SUSTAINABILITY ANALYSIS WITH FCF METRICS
+                sustainability_analysis = self._calculate_sustainability_metrics(dividends, financials, ratios=coverage_ratios)
+                
+                # 4. COVERAGE ANALYSIS WITH PROFESSIONAL GRADING
+                coverage_analysis = self._calculate_coverage_analytics(dividends, financials, ratios=coverage_ratios)
+                
+                market_data = await self._result_or_empty(market_task)
+                # The market and macro analytics only need a couple of scalars; pull them once here
+                current_price = market_data.get('current_price') or 0.0
+                
+                # 7. PERFORMANCE ANALYTICS WITH PERCENTILE RANKINGS
+                performance_analysis = self._calculate_performance_analytics(dividends, current_price, ttm=coverage_ratios.ttm_dividend)
+                
+                # 8. CURRENT DIVIDEND METRICS
+                current_metrics = self._get_current_dividend_metrics(dividends, current_price, ttm=coverage_ratios.ttm_dividend)
+                
+                economic_context = await self._result_or_empty(economic_task)
+                treasury_10y = economic_context.get('treasury_10y', 4.5)
+            finally:
+                # Don't leave fetches running once the analysis has bailed out
+                for task in data_tasks:
+                    task.cancel()
             
             # 5. VALUATION METRICS WITH DDM CALCULATIONS
-            valuation_analysis = self._calculate_valuation_analytics(dividends, market_data, economic_context)
+            valuation_analysis = self._calculate_valuation_analytics(dividends, current_price, treasury_10y, ttm=coverage_ratios.ttm_dividend)
             
             # 6. RISK ASSESSMENT WITH MULTI-FACTOR MODEL
-            risk_analysis = self._calculate_risk_analytics(dividends, financials, economic_context)
-            
-            # 7. PERFORMANCE ANALYTICS WITH PERCENTILE RANKINGS
-            performance_analysis = self._calculate_performance_analytics(dividends, market_data)
-            
-            # 8. CURRENT DIVIDEND METRICS
-            current_metrics = self._get_current_dividend_metrics(dividends, market_data)
+            risk_analysis = self._calculate_risk_analytics(dividends, financials, treasury_10y, ratios=coverage_ratios)
             
             # CONSOLIDATED INSTITUTIONAL RESPONSE (NO REDUNDANCY)
-            return {
+            analysis = {
                 'ticker': ticker.upper(),
                 'analysis_period': {
                     'start_date': start_date.isoformat(), 
@@ -160,21 +685,21 @@ class DividendService:
                 'performance_analytics': performance_analysis,
                 'current_metrics': current_metrics,
                 
-                # OPTIONAL ADVANCED FEATURES
-                'forecast': await self._generate_professional_forecast(ticker, dividends, financials, economic_context, 3) if include_forecast else {
-                    'status': 'not_requested',
-                    'message': 'Forecast not included in this analysis'
-                },
-                'peer_benchmarking': await self._get_sector_benchmarking(ticker, quality_analysis, market_data) if include_peer_comparison else {
-                    'status': 'not_requested', 
-                    'message': 'Peer comparison not included in this analysis'
-                },
+                # OPTIONAL ADVANCED FEATURES (no coroutine is created unless the section was requested)
+                'forecast': await self._generate_professional_forecast(ticker, dividends, financials, economic_context, 3) if include_forecast else _NOT_REQUESTED_FORECAST,
+                'peer_benchmarking': await self._get_sector_benchmarking(ticker, quality_analysis, market_data) if include_peer_comparison else _NOT_REQUESTED_PEER_COMPARISON,
                 
                 # METADATA
                 'data_sources': ['yahoo_finance', 'alpha_vantage', 'fmp', 'fred'],
-                'analysis_timestamp': datetime.utcnow().isoformat(),
+                'analysis_timestamp': _utc_timestamp(),
                 'confidence_score': self._calculate_data_reliability_score(dividends, financials)
             }
+            # A degraded analysis (a failed fetch replaced by defaults) is served but not cached,
+            # so a transient outage is retried on the next request
+            if self._fetches_complete(data_tasks, financials, current_price, economic_context):
+                _analysis_cache.set(cache_key, analysis)
+                return _copy_analysis(analysis)
+            return analysis
             
             # Log unusual payout ratio scenarios
             if current_metrics.get('payout_ratio', {}).get('warning'):
@@ -186,7 +711,37 @@ class DividendService:
                 raise
             raise DataSourceError(f"Dividend analysis failed: {str(e)}")
 
-    def _calculate_professional_quality_score(self, dividends: List[Dict], financials: Dict) -> Dict[str, Any]:
+    async def get_price_history(self, ticker: str, start_date: date, end_date: date) -> pd.DataFrame:
+        """Daily Yahoo Finance price history over the shared yf.Ticker handle, downloaded off the event loop"""
+        return await asyncio.to_thread(_get_yf_ticker(ticker).history, start=start_date, end=end_date)
+
+    async def get_peer_tickers(self, ticker: str) -> List[str]:
+        """Yahoo Finance peer symbols for a ticker, fetched off the event loop"""
+        return await asyncio.to_thread(_get_yf_ticker(ticker).get_peers)
+
+    def _fetches_complete(self, data_tasks: Tuple[asyncio.Future, ...], financials: Dict, current_price: float, economic_context: Dict) -> bool:
+        """Whether every analysis fetch succeeded rather than falling back to empty or default data"""
+        if any(task.cancelled() or task.exception() is not None for task in data_tasks):
+            return False
+        # The fetchers catch their own errors and return these fallbacks instead of raising
+        if 'error' in financials or current_price <= 0:
+            return False
+        # Without a FRED key the estimates are the normal context; with one they mean FRED failed
+        return economic_context.get('data_source') == 'fred_api' or not self.fred_api_key
+
+    @staticmethod
+    async def _result_or_empty(task: asyncio.Future) -> Any:
+        """Await a data fetch, substituting an empty dict if it failed"""
+        try:
+            return await task
+        except Exception:
+            return {}
+
+    def _calculate_professional_quality_score(self, dividends: List[Dict], financials: Dict, aggregates: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Institutional dividend quality score as an API payload (see _quality_score)"""
+        return self._quality_score(dividends, financials, aggregates=aggregates).to_dict()
+
+    def _quality_score(self, dividends: List[Dict], financials: Dict, aggregates: Optional[Dict[str, Any]] = None) -> QualityScore:
         """
         INSTITUTIONAL DIVIDEND QUALITY SCORE (0-100)
         Based on Morningstar/S&P methodologies with weighted components:
@@ -198,27 +753,16 @@ class DividendService:
         """
         
         if not dividends:
-            return {
-                'quality_score': 0, 
-                'grade': 'F', 
-                'rating': 'No Dividend Data',
-                'components': {
-                    'consistency_score': 0,
-                    'growth_score': 0,
-                    'coverage_score': 0,
-                    'yield_quality_score': 0,
-                    'financial_strength_score': 0
-                },
-                'investment_recommendation': 'No Dividend'
-            }
+            return QualityScore(0, 'F', 'No Dividend Data', (0, 0, 0, 0, 0), 'No Dividend')
         
         # --- Component calculations (raw scores) ---
-        # Each helper returns a raw score on its own limited scale (0-20 or 0-15).
-        consistency_raw = self._score_dividend_consistency(dividends)      # 0 – 20
-        growth_raw = self._score_dividend_growth(dividends)                # 0 – 20
-        coverage_raw = self._score_dividend_coverage(dividends, financials)  # 0 – 20
-        yield_quality_raw = self._score_dividend_yield_quality(dividends)   # 0 – 15
-        financial_strength_raw = self._score_financial_strength(financials) # 0 – 20
+        # Each component is a raw score on its own limited scale (0-20 or 0-15).
+        (consistency_raw,       # 0 – 20
+         growth_raw,            # 0 – 20
+         coverage_raw,          # 0 – 20
+         yield_quality_raw,     # 0 – 15
+         financial_strength_raw # 0 – 20
+         ) = self._quality_components(dividends, financials, aggregates)
 
         # --- Normalise raw scores to 0-100 percentage scale ---
         # This ensures each category is comparable before applying the weightings.
@@ -237,51 +781,82 @@ class DividendService:
             financial_strength_pct * 0.10
         )
 
-        # --- Determine grades & ratings based on the new 0-100 scale ---
-        if total_score >= 90:
-            grade, rating = 'A+', 'Exceptional'
-        elif total_score >= 80:
-            grade, rating = 'A', 'Excellent'
-        elif total_score >= 70:
-            grade, rating = 'B+', 'Very Good'
-        elif total_score >= 60:
-            grade, rating = 'B', 'Good'
-        elif total_score >= 50:
-            grade, rating = 'C+', 'Fair'
-        elif total_score >= 40:
-            grade, rating = 'C', 'Below Average'
-        elif total_score >= 30:
-            grade, rating = 'D', 'Poor'
-        else:
-            grade, rating = 'F', 'Very Poor'
-
-        # --- Map total score to investment recommendation ---
-        if total_score >= 80:
-            recommendation = 'Strong Buy'
-        elif total_score >= 70:
-            recommendation = 'Buy'
-        elif total_score >= 60:
-            recommendation = 'Hold'
-        elif total_score >= 40:
-            recommendation = 'Weak Hold'
+        # --- Determine grade, rating & investment recommendation on the 0-100 scale ---
+        grade_idx = int(np.searchsorted(_QUALITY_GRADE_THRESHOLDS, total_score, side='right'))
+        grade, rating = _QUALITY_GRADES[grade_idx], _QUALITY_RATINGS[grade_idx]
+        recommendation = _RECOMMENDATIONS[int(np.searchsorted(_RECOMMENDATION_THRESHOLDS, total_score, side='right'))]
+
+        return QualityScore(
+            total_score, grade, rating,
+            (consistency_pct, growth_pct, coverage_pct, yield_quality_pct, financial_strength_pct),
+            recommendation
+        )
+
+    def _quality_components(self, dividends: List[Dict], financials: Dict, aggregates: Optional[Dict[str, Any]] = None) -> np.ndarray:
+        """Raw quality components: consistency, growth, coverage, yield quality, financial strength"""
+        if aggregates is None:
+            aggregates = self._compute_all_score_components(dividends)
+        if financials:
+            ttm = aggregates['ttm']
+            # Non-positive EPS can never produce earnings coverage
+            eps_coverage = self._calculate_eps_coverage_ratio(dividends, financials, ttm=ttm) if (financials.get('eps') or 0) > 0 else 0.0
+            fcf_coverage = self._calculate_fcf_dividend_coverage(dividends, financials, ttm=ttm)
+            roe, debt_ratio, current_ratio = self._financial_strength_inputs(financials)
         else:
-            recommendation = 'Avoid'
+            # Without financials coverage scores 0 and financial strength is forced to 0 below
+            eps_coverage = fcf_coverage = 0.0
+            roe, debt_ratio, current_ratio = 0.0, 1.0, 1.0
+        
+        components = score_quality(
+            aggregates['annual_values'], aggregates['n_dividends'],
+            float(eps_coverage), float(fcf_coverage),
+            aggregates['period_totals'],
+            roe, debt_ratio, current_ratio
+        )
+        if not financials:
+            components[4] = 0
+        return components
 
+    def _compute_all_score_components(self, dividends: List[Dict]) -> Dict[str, Any]:
+        """
+        Single pass over the dividend history producing every aggregate the
+        quality scorers need: annual totals (ascending year), TTM dividend and
+        the three trailing 4-payment totals used for yield stability.
+        """
+        n_dividends = len(dividends)
+        
+        if isinstance(dividends, DividendHistory):
+            series = dividends.series
+            annual_data = dividends.annual_totals
+            ttm = dividends.ttm
+            period_totals = series.amounts[:12].reshape(3, 4).sum(axis=1) if n_dividends >= 12 else np.empty(0, dtype=np.float64)
+        else:
+            annual_data = defaultdict(float)
+            window_totals = [0.0, 0.0, 0.0]
+            for i, dividend in enumerate(dividends):
+                amount = dividend.get('amount', 0)
+                annual_data[dividend['ex_date'].year] += amount
+                if i < 12 and amount:
+                    window_totals[i // 4] += amount
+            period_totals = np.array(window_totals if n_dividends >= 12 else [], dtype=np.float64)
+            annual_data = AnnualDividends(annual_data)
+            ttm = self._ttm_dividend(dividends)
+        
         return {
-            'quality_score': round(total_score, 1),
-            'grade': grade,
-            'rating': rating,
-            'components': {
-                'consistency_score': round(consistency_pct, 1),
-                'growth_score': round(growth_pct, 1),
-                'coverage_score': round(coverage_pct, 1),
-                'yield_quality_score': round(yield_quality_pct, 1),
-                'financial_strength_score': round(financial_strength_pct, 1)
-            },
-            'investment_recommendation': recommendation
+            'annual_values': annual_data.values_asc,
+            'ttm': ttm,
+            'period_totals': period_totals,
+            'n_dividends': n_dividends
         }
 
-    def _calculate_sustainability_metrics(self, dividends: List[Dict], financials: Dict) -> Dict[str, Any]:
+    def _calculate_sustainability_metrics(self, dividends: List[Dict], financials: Dict, ratios: Optional[CoverageRatios] = None) -> Dict[str, Any]:
+        """Cash flow-based sustainability analysis as an API payload (see _sustainability_analysis)"""
+        analysis = self._sustainability_analysis(dividends, financials, ratios=ratios)
+        if analysis is None:
+            return {'sustainability_rating': 'Unknown', 'metrics': {}}
+        return analysis.to_dict()
+
+    def _sustainability_analysis(self, dividends: List[Dict], financials: Dict, ratios: Optional[CoverageRatios] = None) -> Optional[SustainabilityAnalysis]:
         """
         CASH FLOW-BASED SUSTAINABILITY ANALYSIS
         - Free Cash Flow Coverage Ratio = FCF / Total Dividends Paid
@@ -291,67 +866,34 @@ class DividendService:
         """
         
         if not dividends or not financials:
-            return {'sustainability_rating': 'Unknown', 'metrics': {}}
-        
-        # Core sustainability calculations
-        ttm_dividend_per_share = sum(div.get('amount', 0) for div in dividends[:4])
+            return None
         
-        # Professional ratios
-        payout_ratio = self._calculate_payout_ratio(dividends, financials)  # TTM Dividends / TTM EPS
-        fcf_coverage = self._calculate_fcf_coverage_ratio(dividends, financials)  # FCF / Total Dividends
+        # Professional ratios (zero when the underlying EPS / FCF is not positive)
+        if ratios is None:
+            ratios = self._coverage_ratios(dividends, financials)
+        payout_ratio = ratios.payout_ratio  # TTM Dividends / TTM EPS
+        fcf_coverage = ratios.fcf_coverage  # FCF / Total Dividends
         debt_service_coverage = self._calculate_debt_service_coverage(financials)  # EBITDA / Debt Service
         earnings_volatility = self._calculate_earnings_volatility(financials)  # EPS volatility measure
         
         # Working capital analysis
         working_capital_ratio = financials.get('current_ratio', 1.0)
         
-        # Composite sustainability score (0-100)
-        sustainability_score = 0
-        
-        # Payout ratio scoring (30 points)
-        if payout_ratio < 0.40: sustainability_score += 30
-        elif payout_ratio < 0.60: sustainability_score += 25
-        elif payout_ratio < 0.80: sustainability_score += 15
-        elif payout_ratio < 1.00: sustainability_score += 5
-        
-        # FCF coverage scoring (30 points)  
-        if fcf_coverage > 2.5: sustainability_score += 30
-        elif fcf_coverage > 2.0: sustainability_score += 25
-        elif fcf_coverage > 1.5: sustainability_score += 20
-        elif fcf_coverage > 1.2: sustainability_score += 10
-        
-        # Debt service coverage (25 points)
-        if debt_service_coverage > 3.0: sustainability_score += 25
-        elif debt_service_coverage > 2.5: sustainability_score += 20
-        elif debt_service_coverage > 2.0: sustainability_score += 15
-        elif debt_service_coverage > 1.5: sustainability_score += 10
-        
-        # Earnings stability (15 points)
-        if earnings_volatility < 0.15: sustainability_score += 15
-        elif earnings_volatility < 0.25: sustainability_score += 12
-        elif earnings_volatility < 0.35: sustainability_score += 8
-        elif earnings_volatility < 0.50: sustainability_score += 4
+        # Composite sustainability score (0-100): payout 30, FCF 30, debt service 25, stability 15
+        sustainability_score = int(score_sustainability(
+            float(payout_ratio), float(fcf_coverage),
+            float(debt_service_coverage), float(earnings_volatility)
+        ))
         
         # Sustainability rating
-        if sustainability_score >= 85: rating = 'Very High'
-        elif sustainability_score >= 70: rating = 'High'
-        elif sustainability_score >= 50: rating = 'Moderate'
-        elif sustainability_score >= 30: rating = 'Low'
-        else: rating = 'Very Low'
+        rating = _SUSTAINABILITY_RATINGS[int(np.searchsorted(_SUSTAINABILITY_THRESHOLDS, sustainability_score, side='right'))]
         
-        return {
-            'sustainability_score': sustainability_score,
-            'sustainability_rating': rating,
-            'key_ratios': {
-                'payout_ratio': round(payout_ratio, 3),
-                'fcf_coverage_ratio': round(fcf_coverage, 2),
-                'debt_service_coverage': round(debt_service_coverage, 2),
-                'earnings_volatility': round(earnings_volatility, 3),
-                'working_capital_ratio': round(working_capital_ratio, 2)
-            },
-            'risk_factors': self._identify_sustainability_risks(payout_ratio, fcf_coverage),
-            'strengths': self._identify_sustainability_strengths(payout_ratio, fcf_coverage)
-        }
+        return SustainabilityAnalysis(
+            sustainability_score, rating,
+            payout_ratio, fcf_coverage, debt_service_coverage, earnings_volatility, working_capital_ratio,
+            self._identify_sustainability_risks(payout_ratio, fcf_coverage),
+            self._identify_sustainability_strengths(payout_ratio, fcf_coverage)
+        )
 
     def _calculate_growth_analytics(self, dividends: List[Dict]) -> Dict[str, Any]:
         """
@@ -379,7 +921,7 @@ class DividendService:
             }
         
         annual_dividends = self._aggregate_annual_dividends(dividends)
-        years = sorted(annual_dividends.keys(), reverse=True)
+        years = annual_dividends.years_desc
         
         # First check if this is a new dividend payer (started 2020 or later)
         current_year = date.today().year
@@ -412,29 +954,16 @@ class DividendService:
         # For established dividend payers with incomplete year data, still use annual analysis
         # Don't fall back to quarterly analysis as it produces inflated growth rates
         
-        # CAGR calculations for multiple periods
-        cagr_analysis = {}
-        for period in [3, 5, 10]:
-            if len(years) >= period:
-                start_value = annual_dividends[years[period-1]]
-                end_value = annual_dividends[years[0]]
-                if start_value > 0:
-                    cagr = ((end_value / start_value) ** (1/period)) - 1
-                    cagr_analysis[f'{period}y_cagr'] = round(cagr * 100, 2)
-        
-        # Year-over-year growth analysis
-        growth_rates = []
-        for i in range(len(years) - 1):
-            current = annual_dividends[years[i]]
-            previous = annual_dividends[years[i + 1]]
-            if previous > 0:
-                growth_rate = (current - previous) / previous
-                growth_rates.append(growth_rate * 100)
+        # CAGR calculations for multiple periods, as one vector over the periods the history covers
+        cagr_analysis = _cagr_by_period(annual_dividends.values_desc)
+        
+        # Year-over-year growth analysis (shared with every other helper reading these annual totals)
+        growth_rates = annual_dividends.growth_rates * 100
         
         # Growth quality metrics
-        avg_growth = mean(growth_rates) if growth_rates else 0
-        growth_volatility = stdev(growth_rates) if len(growth_rates) > 1 else 0
-        positive_growth_years = sum(1 for rate in growth_rates if rate > 0)
+        avg_growth = float(growth_rates.mean()) if growth_rates.size else 0
+        growth_volatility = float(np.std(growth_rates, ddof=1)) if growth_rates.size > 1 else 0
+        positive_growth_years = int(np.count_nonzero(growth_rates > 0))
         
         # Aristocrat status detection (25+ consecutive increases)
         consecutive_increases = self._calculate_consecutive_increases(annual_dividends)
@@ -456,7 +985,7 @@ class DividendService:
                 'is_dividend_challenger': consecutive_increases >= 5
             },
             'growth_quality': growth_quality,
-            'growth_trend': self._determine_recent_trend(growth_rates[-3:] if len(growth_rates) >= 3 else growth_rates)
+            'growth_trend': self._determine_recent_trend(growth_rates[-3:].tolist())
         }
 
     def _calculate_quarterly_growth_for_new_payers(self, dividends: List[Dict]) -> Dict[str, Any]:
@@ -471,20 +1000,13 @@ class DividendService:
                 'cagr_analysis': {}
             }
         
-        # Sort dividends by date (oldest first for proper growth calculation)
-        # Use ex_date which is the field returned by our dividend processing
-        sorted_dividends = sorted(dividends, key=lambda x: x.get('ex_date', x.get('date', '')))
+        # Amounts oldest first for proper growth calculation
+        amounts = self._amounts_oldest_first(dividends)
         
-        # Calculate quarter-over-quarter growth (oldest to newest)
-        quarterly_growth_rates = []
-        for i in range(1, len(sorted_dividends)):
-            current = sorted_dividends[i].get('amount', 0)
-            previous = sorted_dividends[i - 1].get('amount', 0)
-            if previous > 0:
-                growth_rate = ((current - previous) / previous) * 100
-                quarterly_growth_rates.append(growth_rate)
+        # Quarter-over-quarter growth (oldest to newest), skipping zero bases, summarised in one kernel pass
+        n_rates, avg_rate, rate_std, positive_quarters, first_rate = growth_summary(amounts)
         
-        if not quarterly_growth_rates:
+        if not n_rates:
             return {
                 'annualized_growth': 0,
                 'volatility': 0,
@@ -495,18 +1017,17 @@ class DividendService:
             }
         
         # Annualize the quarterly growth (compound it 4 times)
-        avg_quarterly_growth = mean(quarterly_growth_rates) / 100
+        avg_quarterly_growth = float(avg_rate) / 100
         annualized_growth = ((1 + avg_quarterly_growth) ** 4 - 1) * 100
         
         # Calculate volatility
-        volatility = stdev(quarterly_growth_rates) if len(quarterly_growth_rates) > 1 else 0
+        volatility = float(rate_std) if n_rates > 1 else 0
         
         # Calculate consistency (% of positive growth quarters)
-        positive_quarters = sum(1 for rate in quarterly_growth_rates if rate > 0)
-        consistency = (positive_quarters / len(quarterly_growth_rates)) * 100
+        consistency = (positive_quarters / n_rates) * 100
         
         # Determine trend
-        recent_trend = quarterly_growth_rates[0] if quarterly_growth_rates else 0
+        recent_trend = float(first_rate)
         if recent_trend > 5:
             trend = 'Strong Growth'
         elif recent_trend > 0:
@@ -518,11 +1039,11 @@ class DividendService:
         
         # Simple CAGR if we have at least 2 quarters
         cagr_analysis = {}
-        if len(sorted_dividends) >= 2:
-            first_div = sorted_dividends[0].get('amount', 0)  # First (oldest) dividend
-            last_div = sorted_dividends[-1].get('amount', 0)  # Last (newest) dividend
+        if amounts.size >= 2:
+            first_div = float(amounts[0])  # First (oldest) dividend
+            last_div = float(amounts[-1])  # Last (newest) dividend
             if first_div > 0:
-                quarters = len(sorted_dividends) - 1
+                quarters = amounts.size - 1
                 if quarters > 0:
                     quarterly_cagr = ((last_div / first_div) ** (1/quarters)) - 1
                     annual_cagr = ((1 + quarterly_cagr) ** 4 - 1) * 100
@@ -538,7 +1059,7 @@ class DividendService:
             'cagr_analysis': cagr_analysis
         }
 
-    def _calculate_coverage_analytics(self, dividends: List[Dict], financials: Dict) -> Dict[str, Any]:
+    def _calculate_coverage_analytics(self, dividends: List[Dict], financials: Dict, ratios: Optional[CoverageRatios] = None) -> Dict[str, Any]:
         """
         INDUSTRY-STANDARD DIVIDEND COVERAGE ANALYSIS
         
@@ -572,7 +1093,9 @@ class DividendService:
             }
         
         # Calculate TTM dividend per share
-        ttm_dividend_per_share = sum(div.get('amount', 0) for div in dividends[:4])
+        if ratios is None:
+            ratios = self._coverage_ratios(dividends, financials)
+        ttm_dividend_per_share = ratios.ttm_dividend
         
         if ttm_dividend_per_share <= 0:
             return {
@@ -595,16 +1118,7 @@ class DividendService:
         # Net Income ÷ Total Dividends Paid (preferred)
         # Falls back to EPS Coverage when net income unavailable
         net_income = financials.get('net_income', 0)
-        shares_outstanding = financials.get('shares_outstanding', 0)
-        
-        if shares_outstanding <= 0:
-            # Estimate from market cap and price if available
-            market_cap = financials.get('market_cap', 0)
-            price = financials.get('price', 0)
-            if market_cap > 0 and price > 0:
-                shares_outstanding = market_cap / price
-        
-        total_dividends_paid = ttm_dividend_per_share * shares_outstanding if shares_outstanding > 0 else 0
+        total_dividends_paid = ttm_dividend_per_share * self._shares_outstanding(financials, default=0.0)
         
         primary_coverage = 0
         primary_method = "Net Income Coverage"
@@ -615,55 +1129,34 @@ class DividendService:
             primary_method = "Net Income Coverage"
         else:
             # Fallback to EPS Coverage (industry standard when net income unavailable)
-            eps = financials.get('eps', 0)
+            eps = financials.get('eps') or 0
             if ttm_dividend_per_share > 0 and eps and eps > 0:
                 primary_coverage = eps / ttm_dividend_per_share
                 primary_method = "EPS Coverage (fallback)"
         
         # 2. EPS COVERAGE RATIO (Supporting or Primary if fallback used)
-        eps = financials.get('eps', 0)
+        eps = financials.get('eps') or 0
         eps_coverage = 0
         if ttm_dividend_per_share > 0 and eps and eps > 0:
             eps_coverage = eps / ttm_dividend_per_share
         
         # 3. FCF COVERAGE RATIO (Supporting)
-        fcf_coverage = self._calculate_fcf_coverage_ratio(dividends, financials)
-        
-        # GRADE EACH RATIO (Industry Standard Scale)
-        def grade_coverage(ratio):
-            """Grade coverage ratios using industry standard scale"""
-            if ratio >= 3.0:
-                return 'A+', 'Excellent'
-            elif ratio >= 2.5:
-                return 'A', 'Very Good'
-            elif ratio >= 2.0:
-                return 'B', 'Good'
-            elif ratio >= 1.5:
-                return 'C', 'Fair'
-            elif ratio >= 1.0:
-                return 'D', 'Poor'
-            else:
-                return 'F', 'Very Poor'
+        fcf_coverage = ratios.fcf_coverage
         
-        primary_grade, primary_desc = grade_coverage(primary_coverage)
-        eps_grade, eps_desc = grade_coverage(eps_coverage)
-        fcf_grade, fcf_desc = grade_coverage(fcf_coverage)
+        # GRADE EACH RATIO (Industry Standard Scale), one table lookup for all three
+        primary_tier, eps_tier, fcf_tier = np.searchsorted(
+            _COVERAGE_RATIO_THRESHOLDS, [primary_coverage, eps_coverage, fcf_coverage], side='right'
+        ).tolist()
+        primary_grade, primary_desc = _COVERAGE_RATIO_GRADES[primary_tier]
+        eps_grade, eps_desc = _COVERAGE_RATIO_GRADES[eps_tier]
+        fcf_grade, fcf_desc = _COVERAGE_RATIO_GRADES[fcf_tier]
         
         # COMPOSITE GRADE: Use primary coverage as the main indicator
         # This follows industry standard where the main dividend coverage ratio is the primary metric
         composite_grade = primary_grade
         
         # Assessment based on primary coverage ratio
-        if primary_coverage >= 2.5:
-            assessment = "Excellent Coverage - Strong dividend sustainability"
-        elif primary_coverage >= 2.0:
-            assessment = "Good Coverage - Solid dividend capacity"
-        elif primary_coverage >= 1.5:
-            assessment = "Fair Coverage - Adequate but watch closely"
-        elif primary_coverage >= 1.0:
-            assessment = "Weak Coverage - Risk of dividend cuts"
-        else:
-            assessment = "Poor Coverage - High risk of dividend suspension"
+        assessment = _COVERAGE_ASSESSMENTS[primary_tier]
         
         return {
             'coverage_ratios': {
@@ -682,7 +1175,7 @@ class DividendService:
             'grading_scale': 'A+ (3.0x+), A (2.5x+), B (2.0x+), C (1.5x+), D (1.0x+), F (<1.0x)'
         }
 
-    def _calculate_valuation_analytics(self, dividends: List[Dict], market_data: Dict, economic_context: Dict) -> Dict[str, Any]:
+    def _calculate_valuation_analytics(self, dividends: List[Dict], current_price: float, treasury_10y: float, ttm: Optional[float] = None) -> Dict[str, Any]:
         """
         VALUATION METRICS WITH DDM CALCULATIONS
         - Yield Spread = Current Yield - 10Y Treasury Rate
@@ -691,21 +1184,19 @@ class DividendService:
         - Price-to-dividend ratio analysis
         """
         
-        if not dividends or not market_data:
+        if not dividends or current_price <= 0:
             return {'status': 'Insufficient data for valuation'}
         
-        current_price = market_data.get('current_price', 0)
-        ttm_dividend = sum(div.get('amount', 0) for div in dividends[:4])
+        ttm_dividend = self._ttm_dividend(dividends) if ttm is None else ttm
         
         # Current yield calculation
-        current_yield = (ttm_dividend / current_price * 100) if current_price > 0 else 0
+        current_yield = ttm_dividend / current_price * 100
         
         # Yield spread vs risk-free rate
-        treasury_10y = economic_context.get('treasury_10y', 4.5)
         yield_spread = current_yield - treasury_10y
         
         # Dividend Discount Model calculation
-        ddm_value = self._calculate_ddm_value(dividends, market_data, economic_context)
+        ddm_value = self._calculate_ddm_value(dividends)
         
         # Price-to-dividend ratio
         price_to_dividend = current_price / ttm_dividend if ttm_dividend > 0 else 0
@@ -727,7 +1218,7 @@ class DividendService:
             'yield_attractiveness': 'Attractive' if yield_spread > 1.0 else 'Neutral' if yield_spread > -0.5 else 'Unattractive'
         }
 
-    def _calculate_risk_analytics(self, dividends: List[Dict], financials: Dict, economic_context: Dict) -> Dict[str, Any]:
+    def _calculate_risk_analytics(self, dividends: List[Dict], financials: Dict, treasury_rate: float, ratios: Optional[CoverageRatios] = None) -> Dict[str, Any]:
         """
         MULTI-FACTOR RISK ASSESSMENT (0-100 SCALE)
         - Payout ratio risk assessment
@@ -739,46 +1230,20 @@ class DividendService:
         if not dividends:
             return {'risk_score': 100, 'risk_rating': 'Very High'}
         
-        risk_score = 0
-        
-        # Payout ratio risk (25 points)
-        payout_ratio = self._calculate_payout_ratio(dividends, financials)
-        if payout_ratio > 1.0: risk_score += 25
-        elif payout_ratio > 0.8: risk_score += 20
-        elif payout_ratio > 0.6: risk_score += 15
-        elif payout_ratio > 0.4: risk_score += 10
-        elif payout_ratio > 0.2: risk_score += 5
-        
-        # Coverage risk (25 points)
-        fcf_coverage = self._calculate_fcf_coverage_ratio(dividends, financials)
-        if fcf_coverage < 1.0: risk_score += 25
-        elif fcf_coverage < 1.5: risk_score += 20
-        elif fcf_coverage < 2.0: risk_score += 15
-        elif fcf_coverage < 2.5: risk_score += 10
-        elif fcf_coverage < 3.0: risk_score += 5
-        
-        # Economic sensitivity (25 points)
-        treasury_rate = economic_context.get('treasury_10y', 4.5)
-        if treasury_rate > 6.0: risk_score += 25
-        elif treasury_rate > 5.0: risk_score += 20
-        elif treasury_rate > 4.0: risk_score += 15
-        elif treasury_rate > 3.0: risk_score += 10
-        elif treasury_rate > 2.0: risk_score += 5
-        
-        # Financial stability (25 points)
+        if ratios is None:
+            ratios = self._coverage_ratios(dividends, financials)
+        payout_ratio = ratios.payout_ratio
+        fcf_coverage = ratios.fcf_coverage
         debt_to_equity = financials.get('debt_to_equity', 50) / 100
-        if debt_to_equity > 1.0: risk_score += 25
-        elif debt_to_equity > 0.75: risk_score += 20
-        elif debt_to_equity > 0.5: risk_score += 15
-        elif debt_to_equity > 0.25: risk_score += 10
-        elif debt_to_equity > 0.1: risk_score += 5
-        
-        # Risk rating
-        if risk_score <= 20: risk_rating = 'Very Low'
-        elif risk_score <= 40: risk_rating = 'Low' 
-        elif risk_score <= 60: risk_rating = 'Moderate'
-        elif risk_score <= 80: risk_rating = 'High'
-        else: risk_rating = 'Very High'
+        
+        # Payout ratio, coverage, economic sensitivity and financial stability risk (25 points each)
+        risk_score = int(self._calculate_risk_analytics_batch(
+            np.array([payout_ratio]), np.array([fcf_coverage]),
+            np.array([treasury_rate]), np.array([debt_to_equity])
+        )[0])
+        
+        # Risk rating (bands include their upper bound, hence side='left')
+        risk_rating = _RISK_RATINGS[int(np.searchsorted(_RISK_RATING_THRESHOLDS, risk_score, side='left'))]
         
         return {
             'risk_score': risk_score,
@@ -792,7 +1257,22 @@ class DividendService:
             'risk_mitigation': self._suggest_risk_mitigation(risk_score)
         }
 
-    def _calculate_performance_analytics(self, dividends: List[Dict], market_data: Dict) -> Dict[str, Any]:
+    def _calculate_risk_analytics_batch(
+        self,
+        payout_ratios: np.ndarray,
+        fcf_coverages: np.ndarray,
+        treasury_rates: np.ndarray,
+        debt_to_equity: np.ndarray
+    ) -> np.ndarray:
+        """Multi-factor risk scores (0-100, higher is riskier) for arrays of tickers; debt/equity as a fraction"""
+        return (
+            _ANALYTICS_RISK_POINTS[np.searchsorted(_ANALYTICS_PAYOUT_RISK_THRESHOLDS, payout_ratios, side='left')] +
+            _ANALYTICS_COVERAGE_RISK_POINTS[np.searchsorted(_ANALYTICS_COVERAGE_RISK_THRESHOLDS, fcf_coverages, side='right')] +
+            _ANALYTICS_RISK_POINTS[np.searchsorted(_ANALYTICS_TREASURY_RISK_THRESHOLDS, treasury_rates, side='left')] +
+            _ANALYTICS_RISK_POINTS[np.searchsorted(_ANALYTICS_DEBT_RISK_THRESHOLDS, debt_to_equity, side='left')]
+        )
+
+    def _calculate_performance_analytics(self, dividends: List[Dict], current_price: float, ttm: Optional[float] = None) -> Dict[str, Any]:
         """
         PERFORMANCE ANALYTICS WITH PERCENTILE RANKINGS
         - Current yield vs historical percentiles
@@ -803,20 +1283,14 @@ class DividendService:
         if not dividends:
             return {'status': 'No dividend data available'}
         
-        current_price = market_data.get('current_price', 0)
-        ttm_dividend = sum(div.get('amount', 0) for div in dividends[:4])
+        ttm_dividend = self._ttm_dividend(dividends) if ttm is None else ttm
         current_yield = (ttm_dividend / current_price * 100) if current_price > 0 else 0
         
-        # Historical yield analysis for percentile ranking
-        historical_yields = []
-        for i in range(0, min(len(dividends), 20), 4):  # 5 years of data
-            period_dividend = sum(div.get('amount', 0) for div in dividends[i:i+4])
-            if period_dividend > 0 and current_price > 0:
-                yield_pct = (period_dividend / current_price) * 100
-                historical_yields.append(yield_pct)
+        # Historical yield analysis for percentile ranking, sorted once for the rank and the range
+        sorted_yields = np.sort(self._historical_yields(dividends, current_price))
         
         # Percentile calculations
-        yield_percentile = self._calculate_percentile(current_yield, historical_yields)
+        yield_percentile = self._calculate_percentile(current_yield, sorted_yields)
         
         # Performance scoring
         performance_score = 0
@@ -825,13 +1299,21 @@ class DividendService:
         elif yield_percentile > 40: performance_score += 15
         elif yield_percentile > 20: performance_score += 10
         
+        # Range read off the sorted yields; the median is the upper middle value, as before
+        if sorted_yields.size:
+            yield_min, yield_max, yield_median = np.round(
+                sorted_yields[[0, -1, sorted_yields.size // 2]], 2
+            ).tolist()
+        else:
+            yield_min = yield_max = yield_median = 0
+        
         return {
             'current_yield': round(current_yield, 2),
             'yield_percentile_ranking': round(yield_percentile, 1),
             'historical_yield_range': {
-                'min': round(min(historical_yields), 2) if historical_yields else 0,
-                'max': round(max(historical_yields), 2) if historical_yields else 0,
-                'median': round(sorted(historical_yields)[len(historical_yields)//2], 2) if historical_yields else 0
+                'min': yield_min,
+                'max': yield_max,
+                'median': yield_median
             },
             'performance_score': performance_score,
             'yield_attractiveness': self._assess_yield_attractiveness(current_yield, yield_percentile)
@@ -857,35 +1339,27 @@ class DividendService:
         logger.info("Initiating institutional-grade multi-source dividend aggregation", 
                    ticker=ticker, 
                    date_range=f"{start_date} to {end_date}",
-                   sources=["yahoo_finance", "alpha_vantage", "fmp"])
+                   sources=list(_DIVIDEND_SOURCES))
         
         # Parallel data fetching with comprehensive error handling
         try:
             sources = await asyncio.gather(
-                self._get_yfinance_dividends(ticker, start_date, end_date),
-                self._get_alpha_vantage_dividends(ticker),
-                self._get_fmp_dividends(ticker),
+                asyncio.wait_for(self._get_yfinance_dividends(ticker, start_date, end_date), DIVIDEND_PROVIDER_TIMEOUT),
+                asyncio.wait_for(self._get_alpha_vantage_dividends(ticker), DIVIDEND_PROVIDER_TIMEOUT),
+                asyncio.wait_for(self._get_fmp_dividends(ticker), DIVIDEND_PROVIDER_TIMEOUT),
                 return_exceptions=True
             )
             
-            yf_data, av_data, fmp_data = [], [], []
-            
-            # Process results with detailed logging
-            for i, result in enumerate(sources):
-                source_name = ["yahoo_finance", "alpha_vantage", "fmp"][i]
-                if isinstance(result, Exception):
+            # Process results with detailed logging; a failed source contributes no rows
+            for source_name, result in zip(_DIVIDEND_SOURCES, sources):
+                if isinstance(result, BaseException):
                     logger.warning(f"Failed to fetch from {source_name}", error=str(result))
-                    if i == 0: yf_data = []
-                    elif i == 1: av_data = []
-                    else: fmp_data = []
                 else:
-                    if i == 0: yf_data = result
-                    elif i == 1: av_data = result
-                    else: fmp_data = result
                     logger.info(f"Successfully fetched from {source_name}", count=len(result))
+            yf_data, av_data, fmp_data = [[] if isinstance(result, BaseException) else result for result in sources]
             
             # Data quality assessment
-            total_sources = sum(1 for data in [yf_data, av_data, fmp_data] if data)
+            total_sources = sum(1 for data in (yf_data, av_data, fmp_data) if data)
             logger.info("Multi-source data aggregation complete", 
                        yf_count=len(yf_data), 
                        av_count=len(av_data), 
@@ -909,7 +1383,7 @@ class DividendService:
                        final_count=len(merged_data),
                        confidence_score=self._calculate_data_reliability_score(merged_data, {}))
             
-            return sorted(merged_data, key=lambda x: x.get('ex_date', date.min), reverse=True)
+            return DividendHistory(sorted(merged_data, key=itemgetter('ex_date'), reverse=True))
             
         except Exception as e:
             if isinstance(e, (DataSourceError, TickerNotFoundError)):
@@ -923,76 +1397,47 @@ class DividendService:
         Institutional-grade data validation and confidence scoring
         """
         
-        dividend_map = {}  # Key: ex_date, Value: {amounts: [], sources: []}
-        
-        # Process YFinance data (highest priority for recent data)
-        for div in yf_data:
-            ex_date = div.get('ex_date')
-            if start_date <= ex_date <= end_date:
-                key = ex_date.isoformat()
-                if key not in dividend_map:
-                    dividend_map[key] = {'amounts': [], 'sources': [], 'dates': []}
-                dividend_map[key]['amounts'].append(div['amount'])
-                dividend_map[key]['sources'].append('yahoo_finance')
-                dividend_map[key]['dates'].append(ex_date)
-        
-        # Process Alpha Vantage data (good for historical validation)
-        for div in av_data:
-            ex_date = div.get('ex_date')
-            if start_date <= ex_date <= end_date:
-                key = ex_date.isoformat()
-                if key not in dividend_map:
-                    dividend_map[key] = {'amounts': [], 'sources': [], 'dates': []}
-                dividend_map[key]['amounts'].append(div['amount'])
-                dividend_map[key]['sources'].append('alpha_vantage')
-                dividend_map[key]['dates'].append(ex_date)
-        
-        # Process FMP data (additional validation)
-        for div in fmp_data:
-            ex_date = div.get('ex_date')
-            if start_date <= ex_date <= end_date:
-                key = ex_date.isoformat()
-                if key not in dividend_map:
-                    dividend_map[key] = {'amounts': [], 'sources': [], 'dates': []}
-                dividend_map[key]['amounts'].append(div['amount'])
-                dividend_map[key]['sources'].append('fmp')
-                dividend_map[key]['dates'].append(ex_date)
-        
-        # Create consensus dividends with confidence scores
+        # Single pass over every source in priority order, collecting the in-range rows column-wise
+        ex_dates, ordinals, amounts, source_bits = [], [], [], []
+        for bit, data in enumerate((yf_data, av_data, fmp_data)):
+            for div in data:
+                ex_date = div.get('ex_date')
+                if start_date <= ex_date <= end_date:
+                    ex_dates.append(ex_date)
+                    ordinals.append(ex_date.toordinal())
+                    amounts.append(div['amount'])
+                    source_bits.append(1 << bit)
+        if not ex_dates:
+            return []
+        
+        # Numeric core runs in one compiled pass over the rows stably sorted by ex-date ordinal,
+        # so within each group the rows keep source priority order
+        ordinals = np.array(ordinals, dtype=np.int64)
+        order = np.argsort(ordinals, kind='stable')
+        starts, consensus_amounts, confidences, variances = merge_consensus(
+            ordinals[order], np.array(amounts, dtype=np.float64)[order]
+        )
+        
+        # Agreeing sources per group as one bitmask, OR-reduced over each group's rows
+        group_starts = starts[:-1]
+        source_masks = np.bitwise_or.reduceat(np.array(source_bits, dtype=np.uint8)[order], group_starts).tolist()
+        
+        # Emit the groups in first-seen order (the stable sort puts each group's earliest row first)
         consensus_dividends = []
-        for ex_date_str, data in dividend_map.items():
-            amounts = data['amounts']
-            sources = data['sources']
-            ex_date = data['dates'][0]
-            
-            # Calculate consensus amount and confidence
-            if len(amounts) == 1:
-                consensus_amount = amounts[0]
-                confidence = 0.8
-            elif len(amounts) == 2:
-                if abs(amounts[0] - amounts[1]) / max(amounts) < 0.01:  # <1% difference
-                    consensus_amount = mean(amounts)
-                    confidence = 0.95
-                else:
-                    consensus_amount = amounts[0]  # Prefer first source
-                    confidence = 0.7
-            else:  # 3+ sources
-                consensus_amount = np.median(amounts)  # Use median for robustness
-                confidence = 0.98
-            
-            dividend_record = {
+        for g in np.argsort(order[group_starts], kind='stable').tolist():
+            ex_date = ex_dates[order[group_starts[g]]]
+            unique_sources = _SOURCE_SETS[source_masks[g]]
+            consensus_dividends.append({
                 'ex_date': ex_date,
                 'date': ex_date,  # Add both for compatibility
-                'amount': round(consensus_amount, 4),
+                'amount': round(float(consensus_amounts[g]), 4),
                 'dividend_type': 'regular',
                 'currency': 'USD',
-                'data_sources': list(set(sources)),
-                'confidence_score': confidence,
-                'source_agreement': len(set(sources)),
-                'amount_variance': stdev(amounts) if len(amounts) > 1 else 0
-            }
-            
-            consensus_dividends.append(dividend_record)
+                'data_sources': list(unique_sources),
+                'confidence_score': float(confidences[g]),
+                'source_agreement': len(unique_sources),
+                'amount_variance': float(variances[g])
+            })
         
         return consensus_dividends
 
@@ -1006,17 +1451,19 @@ class DividendService:
             return {'quality_score': 0, 'grade': 'F', 'components': {}}
         
         # Component scores (each 0-20 points)
+        ttm = self._ttm_dividend(dividends)
         consistency_score = self._score_dividend_consistency(dividends)  # 20 points
         growth_score = self._score_dividend_growth(dividends)           # 20 points
-        coverage_score = self._score_dividend_coverage(dividends, financials)  # 20 points
+        # Coverage is zero without positive earnings or free cash flow
+        has_coverage_inputs = bool(financials) and ((financials.get('eps') or 0) > 0 or (financials.get('free_cash_flow') or 0) > 0)
+        coverage_score = self._score_dividend_coverage(dividends, financials, ttm=ttm) if has_coverage_inputs else 0  # 20 points
         yield_score = self._score_dividend_yield_quality(dividends)     # 20 points
         stability_score = self._score_earnings_stability(financials)    # 20 points
         
         total_score = consistency_score + growth_score + coverage_score + yield_score + stability_score
         
-        # Grade assignment
-        grade_map = {90: 'A+', 80: 'A', 70: 'B+', 60: 'B', 50: 'C+', 40: 'C', 30: 'D', 0: 'F'}
-        grade = next(grade for threshold, grade in grade_map.items() if total_score >= threshold)
+        # Grade assignment (same 0-100 grade table as the professional quality score)
+        grade = _QUALITY_GRADES[int(np.searchsorted(_QUALITY_GRADE_THRESHOLDS, total_score, side='right'))]
         
         return {
             'quality_score': round(total_score, 1),
@@ -1039,9 +1486,10 @@ class DividendService:
         if not dividends or not financials:
             return {'sustainability_rating': 'Unknown', 'risk_level': 'High'}
         
-        # Key sustainability ratios
-        payout_ratio = self._calculate_payout_ratio(dividends, financials)
-        fcf_coverage = self._calculate_fcf_dividend_coverage(dividends, financials)
+        # Key sustainability ratios (zero when the underlying EPS / FCF is not positive)
+        ttm = self._ttm_dividend(dividends)
+        payout_ratio = self._calculate_payout_ratio(dividends, financials, ttm=ttm) if (financials.get('eps') or 0) > 0 else 0
+        fcf_coverage = self._calculate_fcf_dividend_coverage(dividends, financials, ttm=ttm) if (financials.get('free_cash_flow') or 0) > 0 else 0
         debt_coverage = self._calculate_debt_service_coverage(financials)
         earnings_volatility = self._calculate_earnings_volatility(financials)
         
@@ -1128,30 +1576,16 @@ class DividendService:
             return {'insufficient_data': True}
         
         # CAGR calculations for different periods
-        cagr_metrics = {}
-        years = sorted(annual_dividends.keys(), reverse=True)
-        
-        for period in [3, 5, 10]:
-            if len(years) >= period:
-                start_div = annual_dividends[years[period-1]]
-                end_div = annual_dividends[years[0]]
-                if start_div > 0:
-                    cagr = ((end_div / start_div) ** (1/period)) - 1
-                    cagr_metrics[f'{period}y_cagr'] = round(cagr * 100, 2)
-        
-        # Dividend growth consistency analysis
-        growth_rates = []
-        for i in range(len(years) - 1):
-            current_year = annual_dividends[years[i]]
-            prev_year = annual_dividends[years[i + 1]]
-            if prev_year > 0:
-                growth_rate = (current_year - prev_year) / prev_year
-                growth_rates.append(growth_rate)
+        cagr_metrics = _cagr_by_period(annual_dividends.values_desc)
+        
+        # Dividend growth consistency analysis (newest first, years after a zero total skipped)
+        growth_array = annual_dividends.growth_rates
+        growth_rates = growth_array.tolist()
         
         # Growth quality metrics
-        avg_growth = mean(growth_rates) if growth_rates else 0
-        growth_volatility = stdev(growth_rates) if len(growth_rates) > 1 else 0
-        positive_years = sum(1 for gr in growth_rates if gr > 0)
+        avg_growth = float(growth_array.mean()) if growth_array.size else 0
+        growth_volatility = float(np.std(growth_array, ddof=1)) if growth_array.size > 1 else 0
+        positive_years = int(np.count_nonzero(growth_array > 0))
         
         # Dividend aristocrat analysis
         consecutive_increases = self._calculate_consecutive_increases(annual_dividends)
@@ -1205,7 +1639,7 @@ class DividendService:
             }
         
         # Calculate TTM dividend per share
-        ttm_dividend_per_share = sum(div.get('amount', 0) for div in dividends[:4])
+        ttm_dividend_per_share = self._ttm_dividend(dividends)
         
         if ttm_dividend_per_share <= 0:
             return {
@@ -1228,16 +1662,7 @@ class DividendService:
         # Net Income ÷ Total Dividends Paid (preferred)
         # Falls back to EPS Coverage when net income unavailable
         net_income = financials.get('net_income', 0)
-        shares_outstanding = financials.get('shares_outstanding', 0)
-        
-        if shares_outstanding <= 0:
-            # Estimate from market cap and price if available
-            market_cap = financials.get('market_cap', 0)
-            price = financials.get('price', 0)
-            if market_cap > 0 and price > 0:
-                shares_outstanding = market_cap / price
-        
-        total_dividends_paid = ttm_dividend_per_share * shares_outstanding if shares_outstanding > 0 else 0
+        total_dividends_paid = ttm_dividend_per_share * self._shares_outstanding(financials, default=0.0)
         
         primary_coverage = 0
         primary_method = "Net Income Coverage"
@@ -1248,55 +1673,34 @@ class DividendService:
             primary_method = "Net Income Coverage"
         else:
             # Fallback to EPS Coverage (industry standard when net income unavailable)
-            eps = financials.get('eps', 0)
+            eps = financials.get('eps') or 0
             if ttm_dividend_per_share > 0 and eps and eps > 0:
                 primary_coverage = eps / ttm_dividend_per_share
                 primary_method = "EPS Coverage (fallback)"
         
         # 2. EPS COVERAGE RATIO (Supporting or Primary if fallback used)
-        eps = financials.get('eps', 0)
+        eps = financials.get('eps') or 0
         eps_coverage = 0
         if ttm_dividend_per_share > 0 and eps and eps > 0:
             eps_coverage = eps / ttm_dividend_per_share
         
         # 3. FCF COVERAGE RATIO (Supporting)
-        fcf_coverage = self._calculate_fcf_coverage_ratio(dividends, financials)
-        
-        # GRADE EACH RATIO (Industry Standard Scale)
-        def grade_coverage(ratio):
-            """Grade coverage ratios using industry standard scale"""
-            if ratio >= 3.0:
-                return 'A+', 'Excellent'
-            elif ratio >= 2.5:
-                return 'A', 'Very Good'
-            elif ratio >= 2.0:
-                return 'B', 'Good'
-            elif ratio >= 1.5:
-                return 'C', 'Fair'
-            elif ratio >= 1.0:
-                return 'D', 'Poor'
-            else:
-                return 'F', 'Very Poor'
+        fcf_coverage = self._calculate_fcf_coverage_ratio(dividends, financials, ttm=ttm_dividend_per_share)
         
-        primary_grade, primary_desc = grade_coverage(primary_coverage)
-        eps_grade, eps_desc = grade_coverage(eps_coverage)
-        fcf_grade, fcf_desc = grade_coverage(fcf_coverage)
+        # GRADE EACH RATIO (Industry Standard Scale), same table as the comprehensive coverage analytics
+        primary_tier, eps_tier, fcf_tier = np.searchsorted(
+            _COVERAGE_RATIO_THRESHOLDS, [primary_coverage, eps_coverage, fcf_coverage], side='right'
+        ).tolist()
+        primary_grade, primary_desc = _COVERAGE_RATIO_GRADES[primary_tier]
+        eps_grade, eps_desc = _COVERAGE_RATIO_GRADES[eps_tier]
+        fcf_grade, fcf_desc = _COVERAGE_RATIO_GRADES[fcf_tier]
         
         # COMPOSITE GRADE: Use primary coverage as the main indicator
         # This follows industry standard where the main dividend coverage ratio is the primary metric
         composite_grade = primary_grade
         
         # Assessment based on primary coverage ratio
-        if primary_coverage >= 2.5:
-            assessment = "Excellent Coverage - Strong dividend sustainability"
-        elif primary_coverage >= 2.0:
-            assessment = "Good Coverage - Solid dividend capacity"
-        elif primary_coverage >= 1.5:
-            assessment = "Fair Coverage - Adequate but watch closely"
-        elif primary_coverage >= 1.0:
-            assessment = "Weak Coverage - Risk of dividend cuts"
-        else:
-            assessment = "Poor Coverage - High risk of dividend suspension"
+        assessment = _COVERAGE_ASSESSMENTS[primary_tier]
         
         return {
             'coverage_ratios': {
@@ -1364,98 +1768,49 @@ class DividendService:
         if len(dividends) < 8:  # Need 2+ years of quarterly data
             return 0
         
-        annual_dividends = self._aggregate_annual_dividends(dividends)
-        years = sorted(annual_dividends.keys())
-        
-        if len(years) < 3:
-            return 0
-        
-        # Count years with maintained or increased dividends
-        consistent_years = 0
-        for i in range(1, len(years)):
-            if annual_dividends[years[i]] >= annual_dividends[years[i-1]]:
-                consistent_years += 1
-        
-        consistency_ratio = consistent_years / (len(years) - 1) if len(years) > 1 else 0
-        return consistency_ratio * 20
+        return score_consistency(self._annual_values(dividends), len(dividends))
 
     def _score_dividend_growth(self, dividends: List[Dict]) -> float:
         """Score dividend growth quality (0-20 points)"""
-        annual_dividends = self._aggregate_annual_dividends(dividends)
-        years = sorted(annual_dividends.keys())
-        
-        if len(years) < 3:
-            return 0
-        
-        # Calculate 5-year CAGR (or available period)
-        period = min(5, len(years) - 1)
-        start_div = annual_dividends[years[0]]
-        end_div = annual_dividends[years[period]]
-        
-        if start_div <= 0:
-            return 0
-        
-        cagr = ((end_div / start_div) ** (1/period)) - 1
-        
-        # Professional scoring: optimal growth 5-15% annually
-        if 0.05 <= cagr <= 0.15:
-            return 20
-        elif 0.03 <= cagr < 0.05 or 0.15 < cagr <= 0.20:
-            return 15
-        elif 0.01 <= cagr < 0.03 or 0.20 < cagr <= 0.25:
-            return 10
-        elif 0 <= cagr < 0.01:
-            return 5
-        else:
-            return 0
+        # 5-year CAGR (or available period), optimal growth 5-15% annually
+        return score_growth(self._annual_values(dividends))
 
-    def _score_dividend_coverage(self, dividends: List[Dict], financials: Dict) -> float:
+    def _score_dividend_coverage(self, dividends: List[Dict], financials: Dict, ttm: Optional[float] = None) -> float:
         """Score dividend coverage quality (0-20 points)"""
         if not dividends or not financials:
             return 0
         
         # Calculate multiple coverage ratios
-        eps_coverage = self._calculate_eps_coverage_ratio(dividends, financials)
-        fcf_coverage = self._calculate_fcf_dividend_coverage(dividends, financials)
+        if ttm is None:
+            ttm = self._ttm_dividend(dividends)
+        eps_coverage = self._calculate_eps_coverage_ratio(dividends, financials, ttm=ttm)
+        fcf_coverage = self._calculate_fcf_dividend_coverage(dividends, financials, ttm=ttm)
         
         # Weight EPS coverage 60%, FCF coverage 40%
-        eps_score = min(eps_coverage / 2.5 * 12, 12)  # Optimal at 2.5x coverage
-        fcf_score = min(fcf_coverage / 2.0 * 8, 8)    # Optimal at 2.0x coverage
-        
-        return eps_score + fcf_score
+        return score_coverage(float(eps_coverage), float(fcf_coverage))
 
     def _score_dividend_yield_quality(self, dividends: List[Dict]) -> float:
         """Score dividend yield quality vs volatility (0-15 points)"""
+        # Score based on yield consistency (lower volatility = higher score)
+        return score_yield_quality(self._yield_period_totals(dividends))
+
+    def _yield_period_totals(self, dividends: List[Dict]) -> np.ndarray:
+        """Trailing 4-payment dividend totals over the last 3 years (empty if < 12 payments)"""
         if len(dividends) < 12:  # Need 3+ years of quarterly data
-            return 0
-        
-        # Calculate yield stability over time
-        quarterly_yields = []
-        for i in range(0, min(12, len(dividends)), 4):
-            ttm_div = sum(div['amount'] for div in dividends[i:i+4] if div.get('amount'))
-            quarterly_yields.append(ttm_div)
-        
-        if len(quarterly_yields) < 3:
-            return 0
+            return np.empty(0, dtype=np.float64)
         
-        # Score based on yield consistency (lower volatility = higher score)
-        yield_volatility = stdev(quarterly_yields) / mean(quarterly_yields) if mean(quarterly_yields) > 0 else 1
+        if isinstance(dividends, DividendHistory):
+            return dividends.series.window_totals(12)
         
-        if yield_volatility < 0.1:
-            return 15
-        elif yield_volatility < 0.2:
-            return 12
-        elif yield_volatility < 0.3:
-            return 8
-        elif yield_volatility < 0.5:
-            return 5
-        else:
-            return 0
+        return np.array([
+            sum(div['amount'] for div in dividends[i:i+4] if div.get('amount'))
+            for i in range(0, 12, 4)
+        ], dtype=np.float64)
 
     def _score_earnings_stability(self, financials: Dict) -> float:
         """Score earnings stability (0-15 points)"""
         # This would need historical earnings data - simplified for now
-        eps = financials.get('eps', 0)
+        eps = financials.get('eps') or 0
         roe = financials.get('roe', 0)
         
         # Basic scoring based on available metrics
@@ -1468,13 +1823,13 @@ class DividendService:
         else:
             return 0
 
-    def _calculate_eps_coverage_ratio(self, dividends: List[Dict], financials: Dict) -> float:
+    def _calculate_eps_coverage_ratio(self, dividends: List[Dict], financials: Dict, ttm: Optional[float] = None) -> float:
         """Calculate earnings per share dividend coverage ratio"""
         if not dividends or not financials:
             return 0
         
-        ttm_dividends = sum(div.get('amount', 0) for div in dividends[:4])
-        eps = financials.get('eps', 0)
+        ttm_dividends = self._ttm_dividend(dividends) if ttm is None else ttm
+        eps = financials.get('eps') or 0
         
         return eps / ttm_dividends if ttm_dividends > 0 and eps > 0 else 0
 
@@ -1506,19 +1861,32 @@ class DividendService:
         else:
             return 0.4  # Low/negative ROE indicates instability
 
-    def _aggregate_annual_dividends(self, dividends: List[Dict]) -> Dict[int, float]:
+    def _aggregate_annual_dividends(self, dividends: List[Dict]) -> AnnualDividends:
         """Aggregate dividends by year for analysis"""
-        annual_data = {}
+        if isinstance(dividends, DividendHistory):
+            return dividends.annual_totals
+        
+        annual_data = defaultdict(float)
         
         for dividend in dividends:
-            year = dividend['ex_date'].year
-            amount = dividend.get('amount', 0)
-            
-            if year not in annual_data:
-                annual_data[year] = 0
-            annual_data[year] += amount
+            annual_data[dividend['ex_date'].year] += dividend.get('amount', 0)
         
-        return annual_data
+        return AnnualDividends(annual_data)
+
+    def _ttm_dividend(self, dividends: List[Dict]) -> float:
+        """Trailing twelve months dividend per share (payments within a year of the latest ex-date)"""
+        if isinstance(dividends, DividendHistory):
+            return dividends.ttm
+        return DividendSeries.from_records(dividends).ttm()
+
+    def _amounts_oldest_first(self, dividends: List[Dict]) -> np.ndarray:
+        """Dividend amounts ordered by ascending ex-date"""
+        series = dividends.series if isinstance(dividends, DividendHistory) else DividendSeries.from_records(dividends)
+        return series.amounts_oldest_first()
+
+    def _annual_values(self, dividends: List[Dict]) -> np.ndarray:
+        """Annual dividend totals ordered by ascending year"""
+        return self._aggregate_annual_dividends(dividends).values_asc
 
     def _interpret_quality_score(self, score: float) -> str:
         """Interpret dividend quality score for investors"""
@@ -1535,15 +1903,13 @@ class DividendService:
         else:
             return "Poor dividend quality. High risk of dividend reduction or elimination."
 
-    def _get_current_dividend_metrics(self, dividends: List[Dict], market_data: Dict) -> Dict[str, Any]:
+    def _get_current_dividend_metrics(self, dividends: List[Dict], current_price: float, ttm: Optional[float] = None) -> Dict[str, Any]:
         """Calculate current dividend metrics"""
         if not dividends:
             return {}
         
-        current_price = market_data.get('current_price', 0)
-        
         # Get TTM (trailing twelve months) dividend
-        ttm_dividend = sum(div.get('amount', 0) for div in dividends[:4])
+        ttm_dividend = self._ttm_dividend(dividends) if ttm is None else ttm
         
         # Calculate yield
         current_yield = (ttm_dividend / current_price * 100) if current_price > 0 else 0
@@ -1551,11 +1917,10 @@ class DividendService:
         # Get last payment
         last_payment = dividends[0] if dividends else {}
         
-        # Estimate payment frequency
-        payment_dates = [div['ex_date'] for div in dividends[:8]]
-        if len(payment_dates) >= 2:
-            avg_days_between = sum((payment_dates[i-1] - payment_dates[i]).days 
-                                 for i in range(1, min(5, len(payment_dates)))) / min(4, len(payment_dates)-1)
+        # Estimate payment frequency from the last 4 gaps between ex-dates
+        payment_gaps = self._payment_gaps(dividends, 4)
+        if payment_gaps.size:
+            avg_days_between = payment_gaps.mean()
             
             if avg_days_between < 100:
                 frequency = "Quarterly"
@@ -1592,30 +1957,32 @@ class DividendService:
             return 'Unknown'
         
         # Calculate average days between payments
-        date_diffs = []
-        for i in range(min(8, len(dividends) - 1)):  # Look at last 8 payments
-            date1 = dividends[i].get('ex_date')
-            date2 = dividends[i + 1].get('ex_date')
-            
-            if date1 and date2:
-                diff = abs((date1 - date2).days)
-                date_diffs.append(diff)
+        date_diffs = self._payment_gaps(dividends, 8)  # Look at last 8 payments
         
-        if not date_diffs:
+        if not date_diffs.size:
             return 'Unknown'
         
-        avg_days = mean(date_diffs)
-        
+        return self._infer_frequency(date_diffs.mean())[0]
+
+    def _payment_gaps(self, dividends: List[Dict], max_gaps: int) -> np.ndarray:
+        """Days between consecutive ex-dates for the most recent payments (missing dates skipped)"""
+        ex_dates = np.array([div.get('ex_date') for div in dividends[:max_gaps + 1]], dtype='datetime64[D]')
+        gaps = np.abs(np.diff(ex_dates))
+        return gaps[~np.isnat(gaps)].astype(np.int64)
+
+    def _infer_frequency(self, avg_days: float) -> Tuple[str, int]:
+        """Map the average days between payments to a frequency label and payments per year"""
         if 80 <= avg_days <= 100:
-            return 'Quarterly'
+            frequency = 'Quarterly'
         elif 160 <= avg_days <= 200:
-            return 'Semi-Annual'
+            frequency = 'Semi-Annual'
         elif 350 <= avg_days <= 380:
-            return 'Annual'
+            frequency = 'Annual'
         elif 25 <= avg_days <= 35:
-            return 'Monthly'
+            frequency = 'Monthly'
         else:
-            return 'Irregular'
+            frequency = 'Irregular'
+        return frequency, _PAYMENTS_PER_YEAR[frequency]
 
     def _estimate_annual_dividend(self, dividends: List[Dict], frequency: str) -> float:
         """Estimate annual dividend based on recent payments"""
@@ -1624,15 +1991,7 @@ class DividendService:
         
         latest_amount = dividends[0].get('amount', 0)
         
-        frequency_multipliers = {
-            'Quarterly': 4,
-            'Semi-Annual': 2,
-            'Annual': 1,
-            'Monthly': 12,
-            'Irregular': 4  # Default assumption
-        }
-        
-        multiplier = frequency_multipliers.get(frequency, 4)
+        multiplier = _PAYMENTS_PER_YEAR.get(frequency, 4)
         return round(latest_amount * multiplier, 4)
 
     def _calculate_yield_spread(self, ttm_dividend: float, current_price: float) -> float:
@@ -1658,7 +2017,6 @@ class DividendService:
         
         Data Sources:
         - Yahoo Finance: Real-time market data and key ratios
-        - Financial statements: Income, balance sheet, cash flow
         - Derived calculations: Per-share metrics, coverage ratios
         """
         
@@ -1666,17 +2024,7 @@ class DividendService:
             logger.info("Fetching comprehensive financial data", ticker=ticker)
             
             # Primary data source: Yahoo Finance
-            stock = yf.Ticker(ticker)
-            info = stock.info
-            
-            # Get financial statements with error handling
-            try:
-                income_stmt = stock.financials
-                balance_sheet = stock.balance_sheet
-                cash_flow = stock.cashflow
-            except Exception as e:
-                logger.warning("Error fetching financial statements", ticker=ticker, error=str(e))
-                income_stmt = balance_sheet = cash_flow = None
+            info = await self._fetch_ticker_info(ticker)
             
             # Core financial metrics for dividend analysis
             financials = {
@@ -1706,6 +2054,7 @@ class DividendService:
                 # Market & Company Info
                 'shares_outstanding': self._safe_float(info.get('sharesOutstanding')),
                 'market_cap': self._safe_float(info.get('marketCap')),
+                'current_price': self._safe_float(info.get('currentPrice', info.get('regularMarketPrice'))),
                 'enterprise_value': self._safe_float(info.get('enterpriseValue')),
                 'sector': info.get('sector', 'Unknown'),
                 'industry': info.get('industry', 'Unknown'),
@@ -1746,18 +2095,6 @@ class DividendService:
                 if shares_outstanding > 0:
                     financials['net_debt_per_share'] = financials['net_debt'] / shares_outstanding
             
-            # Interest coverage ratio calculation
-            if hasattr(income_stmt, 'empty') and not income_stmt.empty:
-                try:
-                    latest_financials = income_stmt.iloc[:, 0]
-                    operating_income = self._safe_float(latest_financials.get('Operating Income'))
-                    interest_expense = self._safe_float(latest_financials.get('Interest Expense'))
-                    
-                    if operating_income and interest_expense and interest_expense > 0:
-                        financials['interest_coverage'] = operating_income / interest_expense
-                except Exception as e:
-                    logger.debug("Could not calculate interest coverage", error=str(e))
-            
             # Data quality assessment
             key_metrics = ['eps', 'free_cash_flow', 'market_cap', 'sector']
             available_metrics = sum(1 for metric in key_metrics if financials.get(metric) not in [None, 0, 'Unknown'])
@@ -1778,12 +2115,20 @@ class DividendService:
                 'error': str(e)
             }
 
+    async def _fetch_ticker_info(self, ticker: str) -> Mapping[str, Any]:
+        """Fetch Yahoo Finance info for a ticker (read-only), cached across requests for 15 minutes"""
+        cache_key = ticker.upper()
+        info = _ticker_info_cache.get(cache_key)
+        if info is None:
+            # yfinance is blocking; keep the event loop free while it scrapes
+            info = MappingProxyType(await asyncio.to_thread(_fetch_info_sync, ticker))
+            _ticker_info_cache.set(cache_key, info)
+        return info
+
     async def _fetch_market_data(self, ticker: str) -> Dict[str, Any]:
         """Fetch current market data for a ticker"""
         try:
-            import yfinance as yf
-            stock = yf.Ticker(ticker)
-            info = stock.info
+            info = await self._fetch_ticker_info(ticker)
             
             return {
                 'current_price': info.get('currentPrice', info.get('regularMarketPrice', 0)),
@@ -1835,7 +2180,7 @@ class DividendService:
                 
                 # Add metadata about data freshness
                 economic_context['data_source'] = 'fred_api'
-                economic_context['last_updated'] = datetime.utcnow().isoformat()
+                economic_context['last_updated'] = _utc_timestamp()
                 
                 logger.info("Successfully fetched FRED economic data", indicators=list(fred_data.keys()))
                 return economic_context
@@ -1849,7 +2194,7 @@ class DividendService:
                     'gdp_growth': 2.1,
                     'unemployment_rate': 3.7,
                     'data_source': 'fallback_estimates',
-                    'last_updated': datetime.utcnow().isoformat()
+                    'last_updated': _utc_timestamp()
                 }
                 
         except Exception as e:
@@ -1862,44 +2207,32 @@ class DividendService:
                 'gdp_growth': 2.1,
                 'unemployment_rate': 3.7,
                 'data_source': 'error_fallback',
-                'last_updated': datetime.utcnow().isoformat()
+                'last_updated': _utc_timestamp()
             }
 
-    def _calculate_payout_ratio(self, dividends: List[Dict], financials: Dict) -> float:
+    def _calculate_payout_ratio(self, dividends: List[Dict], financials: Dict, ttm: Optional[float] = None) -> float:
         """Calculate dividend payout ratio"""
         if not dividends or not financials:
             return 0
         
-        ttm_dividend = sum(div.get('amount', 0) for div in dividends[:4])
-        eps = financials.get('eps', 0)
+        ttm_dividend = self._ttm_dividend(dividends) if ttm is None else ttm
+        eps = financials.get('eps') or 0
         
         return ttm_dividend / eps if eps > 0 else 0
 
-    def _calculate_fcf_dividend_coverage(self, dividends: List[Dict], financials: Dict) -> float:
+    def _calculate_fcf_dividend_coverage(self, dividends: List[Dict], financials: Dict, ttm: Optional[float] = None) -> float:
         """Calculate Free Cash Flow dividend coverage"""
         if not dividends or not financials:
             return 0
         
-        ttm_dividend_per_share = sum(div.get('amount', 0) for div in dividends[:4])
-        free_cash_flow = financials.get('free_cash_flow', 0)
+        ttm_dividend_per_share = self._ttm_dividend(dividends) if ttm is None else ttm
+        free_cash_flow = financials.get('free_cash_flow') or 0
         
         if ttm_dividend_per_share <= 0 or free_cash_flow <= 0:
             return 0
         
-        # Get shares outstanding from financials
-        shares_outstanding = financials.get('shares_outstanding', 0)
-        
-        # If shares_outstanding not available, estimate from market cap and price
-        if shares_outstanding <= 0:
-            market_cap = financials.get('market_cap', 0)
-            current_price = financials.get('current_price', 0)
-            if market_cap > 0 and current_price > 0:
-                shares_outstanding = market_cap / current_price
-            else:
-                # Fallback: assume reasonable share count for calculation
-                shares_outstanding = 1_000_000_000  # 1B shares as fallback
-        
         # Calculate FCF per share
+        shares_outstanding = self._shares_outstanding(financials)
         fcf_per_share = free_cash_flow / shares_outstanding if shares_outstanding > 0 else 0
         
         # Coverage ratio = FCF per share / Dividend per share
@@ -1912,8 +2245,10 @@ class DividendService:
         
         # Dividend data quality
         if dividends:
-            confidence_scores = [div.get('confidence_score', 0.5) for div in dividends]
-            avg_confidence = mean(confidence_scores)
+            if isinstance(dividends, DividendHistory):
+                avg_confidence = float(dividends.series.confidence.mean())
+            else:
+                avg_confidence = float(np.mean([div.get('confidence_score', 0.5) for div in dividends]))
             reliability_factors.append(avg_confidence)
         
         # Financial data completeness
@@ -1928,7 +2263,7 @@ class DividendService:
             multi_source_score = min(multi_source_count / 10, 1.0)
             reliability_factors.append(multi_source_score)
         
-        overall_reliability = mean(reliability_factors) if reliability_factors else 0.5
+        overall_reliability = float(np.mean(reliability_factors)) if reliability_factors else 0.5
         return round(overall_reliability, 3)
 
     # Missing Methods Implementation
@@ -1939,7 +2274,7 @@ class DividendService:
             return {'status': 'Insufficient data for growth analysis'}
         
         annual_dividends = self._aggregate_annual_dividends(dividends)
-        years = sorted(annual_dividends.keys(), reverse=True)
+        years = annual_dividends.years_desc
         
         # Check if we have incomplete current year data (for new dividend payers)
         current_year = date.today().year
@@ -1957,95 +2292,58 @@ class DividendService:
             return self._calculate_quarterly_growth_for_new_payers(dividends)
         
         # Calculate CAGR for different periods
-        cagr_metrics = {}
-        for period in [3, 5, 10]:
-            if len(years) >= period:
-                start_value = annual_dividends[years[period-1]]
-                end_value = annual_dividends[years[0]]
-                if start_value > 0:
-                    cagr = ((end_value / start_value) ** (1/period)) - 1
-                    cagr_metrics[f'{period}y_cagr'] = round(cagr * 100, 2)
+        cagr_metrics = _cagr_by_period(annual_dividends.values_desc)
         
         # Growth consistency analysis
-        growth_rates = []
-        for i in range(len(years) - 1):
-            current = annual_dividends[years[i]]
-            previous = annual_dividends[years[i + 1]]
-            if previous > 0:
-                growth_rate = (current - previous) / previous
-                growth_rates.append(growth_rate)
+        growth_rates = annual_dividends.growth_rates
         
         return {
             'cagr_analysis': cagr_metrics,
-            'average_growth': round(mean(growth_rates) * 100, 2) if growth_rates else 0,
-            'growth_volatility': round(stdev(growth_rates) * 100, 2) if len(growth_rates) > 1 else 0,
-            'positive_growth_years': sum(1 for rate in growth_rates if rate > 0),
-            'total_years': len(growth_rates)
+            'average_growth': round(float(growth_rates.mean()) * 100, 2) if growth_rates.size else 0,
+            'growth_volatility': round(float(np.std(growth_rates, ddof=1)) * 100, 2) if growth_rates.size > 1 else 0,
+            'positive_growth_years': int(np.count_nonzero(growth_rates > 0)),
+            'total_years': int(growth_rates.size)
         }
 
-    def _analyze_dividend_coverage(self, dividends: List[Dict], financials: Dict) -> Dict[str, Any]:
+    def _analyze_dividend_coverage(self, dividends: List[Dict], financials: Dict, ratios: Optional[CoverageRatios] = None) -> Dict[str, Any]:
         """Professional dividend coverage analysis"""
         if not dividends or not financials:
             return {'status': 'Insufficient data'}
         
-        eps_coverage = self._calculate_eps_coverage_ratio(dividends, financials)
-        fcf_coverage = self._calculate_fcf_dividend_coverage(dividends, financials)
+        if ratios is None:
+            ratios = self._coverage_ratios(dividends, financials)
+        eps_coverage = ratios.eps_coverage
+        fcf_coverage = ratios.fcf_coverage
         
-        coverage_grade = 'A' if eps_coverage > 2.5 and fcf_coverage > 2.0 else \
-                        'B' if eps_coverage > 2.0 and fcf_coverage > 1.5 else \
-                        'C' if eps_coverage > 1.5 and fcf_coverage > 1.2 else 'D'
+        coverage_grade = _COVERAGE_GRADES[min(
+            int(np.searchsorted(_EPS_COVERAGE_GRADE_THRESHOLDS, eps_coverage, side='left')),
+            int(np.searchsorted(_FCF_COVERAGE_GRADE_THRESHOLDS, fcf_coverage, side='left'))
+        )]
         
         return {
             'eps_coverage': eps_coverage,
             'fcf_coverage': fcf_coverage,
             'coverage_grade': coverage_grade,
-            'payout_ratio': self._calculate_payout_ratio(dividends, financials)
+            'payout_ratio': ratios.payout_ratio
         }
 
-    def _calculate_dividend_risk_metrics(self, dividends: List[Dict], financials: Dict, economic_context: Dict) -> Dict[str, Any]:
+    def _calculate_dividend_risk_metrics(self, dividends: List[Dict], financials: Dict, economic_context: Dict, ratios: Optional[CoverageRatios] = None) -> Dict[str, Any]:
         """Calculate comprehensive dividend risk metrics"""
         if not dividends:
             return {'risk_score': 100, 'risk_rating': 'Very High'}
         
         # Basic risk scoring
-        payout_ratio = self._calculate_payout_ratio(dividends, financials)
-        fcf_coverage = self._calculate_fcf_dividend_coverage(dividends, financials)
-        
-        risk_score = 0
-        
-        # Payout ratio risk (40% of total)
-        if payout_ratio > 1.0:
-            risk_score += 40
-        elif payout_ratio > 0.8:
-            risk_score += 30
-        elif payout_ratio > 0.6:
-            risk_score += 20
-        elif payout_ratio > 0.4:
-            risk_score += 10
-        
-        # Coverage risk (40% of total)
-        if fcf_coverage < 1.0:
-            risk_score += 40
-        elif fcf_coverage < 1.5:
-            risk_score += 30
-        elif fcf_coverage < 2.0:
-            risk_score += 20
-        elif fcf_coverage < 3.0:
-            risk_score += 10
-        
-        # Economic risk (20% of total)
+        if ratios is None:
+            ratios = self._coverage_ratios(dividends, financials)
+        payout_ratio = ratios.payout_ratio
+        fcf_coverage = ratios.fcf_coverage
         treasury_rate = economic_context.get('treasury_10y', 4.5)
-        if treasury_rate > 6.0:
-            risk_score += 20
-        elif treasury_rate > 5.0:
-            risk_score += 15
-        elif treasury_rate > 4.0:
-            risk_score += 10
-        
-        risk_rating = 'Very Low' if risk_score < 20 else \
-                     'Low' if risk_score < 40 else \
-                     'Moderate' if risk_score < 60 else \
-                     'High' if risk_score < 80 else 'Very High'
+        
+        # Payout ratio (40) + coverage (40) + economic (20) risk
+        risk_score = int(self._calculate_dividend_risk_metrics_batch(
+            np.array([payout_ratio]), np.array([fcf_coverage]), np.array([treasury_rate])
+        )[0])
+        risk_rating = _RISK_RATINGS[int(np.searchsorted(_RISK_RATING_THRESHOLDS, risk_score, side='right'))]
         
         return {
             'risk_score': risk_score,
@@ -2054,13 +2352,42 @@ class DividendService:
             'fcf_coverage': fcf_coverage
         }
 
+    def _coverage_ratios(self, dividends: List[Dict], financials: Dict) -> CoverageRatios:
+        """TTM dividend with payout, EPS and FCF coverage ratios, computed once per analysis"""
+        ttm = self._ttm_dividend(dividends)
+        if not financials:
+            return CoverageRatios(ttm, 0, 0, 0)
+        
+        # Non-positive EPS / FCF can never produce a ratio, so skip the calculators
+        has_earnings = (financials.get('eps') or 0) > 0
+        has_cash_flow = (financials.get('free_cash_flow') or 0) > 0
+        return CoverageRatios(
+            ttm,
+            self._calculate_payout_ratio(dividends, financials, ttm=ttm) if has_earnings else 0,
+            self._calculate_eps_coverage_ratio(dividends, financials, ttm=ttm) if has_earnings else 0,
+            self._calculate_fcf_coverage_ratio(dividends, financials, ttm=ttm) if has_cash_flow else 0
+        )
+
+    def _calculate_dividend_risk_metrics_batch(
+        self,
+        payout_ratios: np.ndarray,
+        fcf_coverages: np.ndarray,
+        treasury_rates: np.ndarray
+    ) -> np.ndarray:
+        """Dividend risk scores (0-100, higher is riskier) for arrays of tickers"""
+        return (
+            _PAYOUT_RISK_SCORES[np.searchsorted(_PAYOUT_RISK_THRESHOLDS, payout_ratios, side='left')] +
+            _COVERAGE_RISK_SCORES[np.searchsorted(_COVERAGE_RISK_THRESHOLDS, fcf_coverages, side='right')] +
+            _TREASURY_RISK_SCORES[np.searchsorted(_TREASURY_RISK_THRESHOLDS, treasury_rates, side='left')]
+        )
+
     def _calculate_dividend_valuation_metrics(self, dividends: List[Dict], market_data: Dict, economic_context: Dict) -> Dict[str, Any]:
         """Calculate dividend valuation metrics"""
         if not dividends or not market_data:
             return {}
         
         current_price = market_data.get('current_price', 0)
-        ttm_dividend = sum(div.get('amount', 0) for div in dividends[:4])
+        ttm_dividend = self._ttm_dividend(dividends)
         
         current_yield = (ttm_dividend / current_price * 100) if current_price > 0 else 0
         treasury_rate = economic_context.get('treasury_10y', 4.5)
@@ -2069,31 +2396,25 @@ class DividendService:
         return {
             'current_yield': round(current_yield, 2),
             'yield_vs_treasury': round(risk_premium, 2),
-            'dividend_discount_model': self._calculate_ddm_value(dividends, market_data, economic_context)
+            'dividend_discount_model': self._calculate_ddm_value(dividends)
         }
 
-    def _calculate_ddm_value(self, dividends: List[Dict], market_data: Dict, economic_context: Dict) -> float:
+    def _calculate_ddm_value(self, dividends: List[Dict]) -> float:
         """Simple Dividend Discount Model calculation"""
         if len(dividends) < 8:
             return 0
         
         # Calculate growth rate from recent dividends
         annual_dividends = self._aggregate_annual_dividends(dividends)
-        years = sorted(annual_dividends.keys(), reverse=True)
+        years = annual_dividends.years_desc
         
         if len(years) < 3:
             return 0
         
         # 3-year average growth rate
-        growth_rates = []
-        for i in range(min(3, len(years) - 1)):
-            current = annual_dividends[years[i]]
-            previous = annual_dividends[years[i + 1]]
-            if previous > 0:
-                growth_rate = (current - previous) / previous
-                growth_rates.append(growth_rate)
+        recent_growth = growth_rates(annual_dividends.values_desc[:min(3, len(years) - 1) + 1])
         
-        avg_growth = mean(growth_rates) if growth_rates else 0.03
+        avg_growth = float(recent_growth.mean()) if recent_growth.size else 0.03
         
         # Simple DDM: D1 / (r - g)
         last_dividend = annual_dividends[years[0]]
@@ -2112,21 +2433,16 @@ class DividendService:
             return {}
         
         current_price = market_data.get('current_price', 0)
-        ttm_dividend = sum(div.get('amount', 0) for div in dividends[:4])
+        ttm_dividend = self._ttm_dividend(dividends)
         
         # Calculate yield metrics
         current_yield = (ttm_dividend / current_price * 100) if current_price > 0 else 0
         
         # Historical yield analysis
-        historical_yields = []
-        for i in range(0, min(20, len(dividends)), 4):  # 5 years of quarterly data
-            period_dividend = sum(div.get('amount', 0) for div in dividends[i:i+4])
-            if period_dividend > 0 and current_price > 0:
-                yield_pct = (period_dividend / current_price) * 100
-                historical_yields.append(yield_pct)
+        historical_yields = self._historical_yields(dividends, current_price)
         
-        avg_historical_yield = mean(historical_yields) if historical_yields else current_yield
-        yield_percentile = self._calculate_percentile(current_yield, historical_yields) if historical_yields else 50
+        avg_historical_yield = float(historical_yields.mean()) if historical_yields.size else current_yield
+        yield_percentile = self._calculate_percentile(current_yield, np.sort(historical_yields))
         
         return {
             'current_yield': round(current_yield, 2),
@@ -2135,33 +2451,29 @@ class DividendService:
             'yield_stability': self._calculate_yield_stability(historical_yields)
         }
 
-    def _calculate_percentile(self, value: float, data_list: List[float]) -> float:
-        """Calculate percentile ranking of value in data list"""
-        if not data_list:
+    def _historical_yields(self, dividends: List[Dict], current_price: float) -> np.ndarray:
+        """Yields (%) of each 4-payment window over the latest 5 years of quarterly data"""
+        if current_price <= 0 or not dividends:
+            return np.empty(0, dtype=np.float64)
+        
+        series = dividends.series if isinstance(dividends, DividendHistory) else DividendSeries.from_records(dividends)
+        period_dividends = series.window_totals(20)
+        return period_dividends[period_dividends > 0] / current_price * 100
+
+    def _calculate_percentile(self, value: float, sorted_values: np.ndarray) -> float:
+        """Percentile ranking of value (share strictly below it) in an ascending array; 50 when empty"""
+        if sorted_values.size == 0:
             return 50.0
         
-        sorted_data = sorted(data_list)
-        below_count = sum(1 for x in sorted_data if x < value)
-        percentile = (below_count / len(sorted_data)) * 100
-        return percentile
+        return float(np.searchsorted(sorted_values, value, side='left')) / sorted_values.size * 100
 
     def _calculate_yield_stability(self, yields: List[float]) -> str:
         """Calculate yield stability rating"""
         if len(yields) < 3:
             return 'Unknown'
         
-        volatility = stdev(yields) / mean(yields) if mean(yields) > 0 else 1
-        
-        if volatility < 0.15:
-            return 'Very Stable'
-        elif volatility < 0.25:
-            return 'Stable'
-        elif volatility < 0.35:
-            return 'Moderate'
-        elif volatility < 0.50:
-            return 'Volatile'
-        else:
-            return 'Very Volatile'
+        volatility = coef_of_variation(np.asarray(yields, dtype=np.float64))
+        return _STABILITY_RATINGS[int(np.searchsorted(_STABILITY_THRESHOLDS, volatility, side='right'))]
 
     async def _generate_professional_forecast(self, ticker: str, dividends: List[Dict], financials: Dict, economic_context: Dict, years: int) -> List[Dict[str, Any]]:
         """Generate professional dividend forecast with enhanced news analysis"""
@@ -2216,25 +2528,22 @@ class DividendService:
         
         # Calculate growth trend
         annual_dividends = self._aggregate_annual_dividends(dividends)
-        years_data = sorted(annual_dividends.keys(), reverse=True)
+        years_data = annual_dividends.years_desc
         
         # For companies with less than 3 years, use quarterly data
         if len(years_data) < 2:
             return self._generate_quarterly_based_forecast(dividends, financials, economic_context, years)
         
-        # Calculate average growth rate
-        growth_rates = []
-        for i in range(min(5, len(years_data) - 1)):
-            current = annual_dividends[years_data[i]]
-            previous = annual_dividends[years_data[i + 1]]
-            if previous > 0:
-                growth_rate = (current - previous) / previous
-                growth_rates.append(growth_rate)
+        # Calculate average growth rate over the latest (up to) five year-on-year changes
+        window = annual_dividends.values_desc[:min(5, len(years_data) - 1) + 1]
+        recent_growth = growth_rates(window)
+        
+        avg_growth = float(recent_growth.mean()) if recent_growth.size else 0.03
+        last_dividend = float(window[0])
         
-        avg_growth = mean(growth_rates) if growth_rates else 0.03
-        last_dividend = annual_dividends[years_data[0]]
+        # Generate forecast (scalar pow keeps the rounded projections identical to libm's results)
+        growth_rate_pct = round(avg_growth * 100, 2)
         
-        # Generate forecast
         forecast = []
         for year in range(1, years + 1):
             projected_dividend = last_dividend * ((1 + avg_growth) ** year)
@@ -2243,7 +2552,7 @@ class DividendService:
             forecast.append({
                 'year': years_data[0] + year,
                 'projected_dividend': round(projected_dividend, 4),
-                'growth_rate': round(avg_growth * 100, 2),
+                'growth_rate': growth_rate_pct,
                 'confidence_level': round(confidence, 2),
                 'methodology': 'Traditional Historical Analysis'
             })
@@ -2261,7 +2570,7 @@ class DividendService:
             return []
         
         # Conservative growth assumption for new payers (3-7%)
-        eps = financials.get('eps', 0)
+        eps = financials.get('eps') or 0
         if eps > 0:
             payout_ratio = latest_dividend / eps
             # Growth based on earnings capacity
@@ -2297,20 +2606,15 @@ class DividendService:
         if len(dividends) < 2:
             return self._generate_new_payer_forecast(dividends, financials, economic_context, years)
         
-        # Calculate quarterly growth rate
-        sorted_dividends = sorted(dividends, key=lambda x: x.get('ex_date', x.get('date', '')))
-        
-        quarterly_growth_rates = []
-        for i in range(len(sorted_dividends) - 1):
-            current = sorted_dividends[i].get('amount', 0)
-            previous = sorted_dividends[i + 1].get('amount', 0)
-            if previous > 0:
-                growth_rate = (current - previous) / previous
-                quarterly_growth_rates.append(growth_rate)
+        # Calculate quarterly growth rate (amounts oldest first)
+        amounts = self._amounts_oldest_first(dividends)
+        current, previous = amounts[:-1], amounts[1:]
+        has_base = previous > 0
+        quarterly_growth_rates = (current[has_base] - previous[has_base]) / previous[has_base]
         
         # Use average quarterly growth or conservative default
-        if quarterly_growth_rates:
-            avg_quarterly_growth = mean(quarterly_growth_rates)
+        if quarterly_growth_rates.size:
+            avg_quarterly_growth = float(quarterly_growth_rates.mean())
             # Convert to annual growth (compound quarterly growth)
             annual_growth = (1 + avg_quarterly_growth) ** 4 - 1
             # Cap growth at reasonable levels for new payers
@@ -2320,7 +2624,7 @@ class DividendService:
             annual_growth = 0.04  # 4% default
         
         # Use most recent quarterly dividend (now the last in the sorted list)
-        latest_quarterly = sorted_dividends[-1].get('amount', 0)
+        latest_quarterly = float(amounts[-1])
         estimated_annual = latest_quarterly * 4  # Assume quarterly payments
         
         forecast = []
@@ -2424,56 +2728,7 @@ class DividendService:
 
     def _get_sector_benchmarks(self, sector: str) -> Dict[str, Dict[str, float]]:
         """Get sector-specific benchmark ranges for dividend metrics"""
-        
-        # Industry-standard benchmark ranges based on historical data
-        sector_benchmarks = {
-            'Technology': {
-                'yield': {'p25': 0.5, 'p50': 1.2, 'p75': 2.0},
-                'quality_score': {'p25': 65, 'p50': 75, 'p75': 85},
-                'growth_3y': {'p25': 8, 'p50': 15, 'p75': 25},
-                'payout_ratio': {'p25': 15, 'p50': 25, 'p75': 40},
-                'coverage_ratio': {'p25': 3.0, 'p50': 5.0, 'p75': 8.0}
-            },
-            'Utilities': {
-                'yield': {'p25': 3.0, 'p50': 4.2, 'p75': 5.5},
-                'quality_score': {'p25': 70, 'p50': 80, 'p75': 90},
-                'growth_3y': {'p25': 2, 'p50': 4, 'p75': 6},
-                'payout_ratio': {'p25': 60, 'p50': 75, 'p75': 85},
-                'coverage_ratio': {'p25': 1.2, 'p50': 1.5, 'p75': 2.0}
-            },
-            'Consumer Defensive': {
-                'yield': {'p25': 2.0, 'p50': 3.0, 'p75': 4.5},
-                'quality_score': {'p25': 75, 'p50': 85, 'p75': 95},
-                'growth_3y': {'p25': 3, 'p50': 6, 'p75': 10},
-                'payout_ratio': {'p25': 45, 'p50': 60, 'p75': 75},
-                'coverage_ratio': {'p25': 1.8, 'p50': 2.5, 'p75': 3.5}
-            },
-            'Healthcare': {
-                'yield': {'p25': 1.5, 'p50': 2.5, 'p75': 3.8},
-                'quality_score': {'p25': 70, 'p50': 80, 'p75': 90},
-                'growth_3y': {'p25': 4, 'p50': 8, 'p75': 12},
-                'payout_ratio': {'p25': 35, 'p50': 50, 'p75': 65},
-                'coverage_ratio': {'p25': 2.0, 'p50': 3.0, 'p75': 4.5}
-            },
-            'Financial Services': {
-                'yield': {'p25': 2.5, 'p50': 3.5, 'p75': 4.8},
-                'quality_score': {'p25': 60, 'p50': 70, 'p75': 80},
-                'growth_3y': {'p25': 5, 'p50': 8, 'p75': 12},
-                'payout_ratio': {'p25': 25, 'p50': 35, 'p75': 50},
-                'coverage_ratio': {'p25': 2.5, 'p50': 3.5, 'p75': 5.0}
-            }
-        }
-        
-        # Default benchmarks for sectors not specifically defined
-        default_benchmarks = {
-            'yield': {'p25': 1.5, 'p50': 2.5, 'p75': 4.0},
-            'quality_score': {'p25': 65, 'p50': 75, 'p75': 85},
-            'growth_3y': {'p25': 3, 'p50': 7, 'p75': 12},
-            'payout_ratio': {'p25': 30, 'p50': 50, 'p75': 70},
-            'coverage_ratio': {'p25': 2.0, 'p50': 3.0, 'p75': 4.5}
-        }
-        
-        return sector_benchmarks.get(sector, default_benchmarks)
+        return _SECTOR_PERCENTILE_BENCHMARKS.get(sector, _DEFAULT_PERCENTILE_BENCHMARKS)
 
     def _calculate_sector_percentile(self, value: float, benchmark: Dict[str, float]) -> float:
         """Calculate percentile rank within sector benchmarks"""
@@ -2530,24 +2785,28 @@ class DividendService:
     async def _get_yfinance_dividends(self, ticker: str, start_date: date, end_date: date) -> List[Dict[str, Any]]:
         """Get dividends from yfinance with enhanced data"""
         try:
-            stock = yf.Ticker(ticker)
-            hist = stock.history(start=start_date, end=end_date, actions=True)
-            
-            dividend_data = []
-            if 'Dividends' in hist.columns:
-                dividends = hist[hist['Dividends'] > 0]['Dividends']
-                
-                for date_idx, amount in dividends.items():
-                    dividend_data.append({
-                        'ex_date': date_idx.date(),
-                        'amount': float(amount),
-                        'dividend_type': 'regular',
-                        'currency': 'USD',
-                        'data_source': 'yahoo_finance',
-                        'confidence_score': 0.95
-                    })
-            
-            return sorted(dividend_data, key=lambda x: x['ex_date'], reverse=True)
+            # yfinance is blocking; keep the event loop free while it downloads the history
+            hist = await asyncio.to_thread(_fetch_history_sync, ticker, start_date, end_date)
+            
+            if 'Dividends' not in hist.columns:
+                return []
+            
+            # History is ascending by date, so reversing the arrays yields newest first without a sort
+            dividends = hist.loc[hist['Dividends'] > 0, 'Dividends']
+            ex_dates = dividends.index.date[::-1]
+            amounts = dividends.to_numpy(dtype=np.float64)[::-1].tolist()
+            
+            return [
+                {
+                    'ex_date': ex_date,
+                    'amount': amount,
+                    'dividend_type': 'regular',
+                    'currency': 'USD',
+                    'data_source': 'yahoo_finance',
+                    'confidence_score': 0.95
+                }
+                for ex_date, amount in zip(ex_dates, amounts)
+            ]
             
         except Exception as e:
             logger.error("YFinance dividend fetch failed", ticker=ticker, error=str(e))
@@ -2566,12 +2825,12 @@ class DividendService:
                 'apikey': self.alpha_vantage_key
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        # Process Alpha Vantage dividend data
-                        return self._process_av_dividend_data(data)
+            session = await _get_http_session()
+            async with session.get(url, params=params) as response:
+                if response.status == 200:
+                    data = await response.json(loads=_json_loads)
+                    # Process Alpha Vantage dividend data
+                    return self._process_av_dividend_data(data)
             
             return []
             
@@ -2592,7 +2851,7 @@ class DividendService:
                 
                 if dividend_amount > 0:
                     # Parse date
-                    ex_date = datetime.strptime(date_str, '%Y-%m-%d').date()
+                    ex_date = _parse_ymd(date_str)
                     
                     dividends.append({
                         'ex_date': ex_date,
@@ -2607,7 +2866,8 @@ class DividendService:
             logger.error("Error processing Alpha Vantage data", error=str(e))
             return []
         
-        return sorted(dividends, key=lambda x: x['ex_date'], reverse=True)
+        # Alpha Vantage usually lists months newest first, so this is a near-linear timsort pass
+        return sorted(dividends, key=itemgetter('ex_date'), reverse=True)
 
     # ... [Additional methods would continue] ...
 
@@ -2618,121 +2878,129 @@ class DividendService:
             url = f"{self.fmp_base_url}/historical-price-full/stock_dividend/{ticker}"
             params = {'apikey': self.fmp_key}
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params) as response:
-                    if response.status != 200:
-                        return []
-                    
-                    data = await response.json()
-                    
-                    if 'historical' not in data:
-                        return []
-                    
-                    dividend_list = []
-                    for div_data in data['historical']:
-                        dividend_list.append({
-                            'ex_date': datetime.strptime(div_data['date'], '%Y-%m-%d').date(),
-                            'record_date': datetime.strptime(div_data.get('recordDate', div_data['date']), '%Y-%m-%d').date() if div_data.get('recordDate') else None,
-                            'payment_date': datetime.strptime(div_data.get('paymentDate', div_data['date']), '%Y-%m-%d').date() if div_data.get('paymentDate') else None,
-                            'declaration_date': datetime.strptime(div_data.get('declarationDate', div_data['date']), '%Y-%m-%d').date() if div_data.get('declarationDate') else None,
-                            'amount': float(div_data['dividend']),
-                            'adjusted_amount': float(div_data.get('adjDividend', div_data['dividend'])),
-                            'dividend_type': DividendType.REGULAR,
-                            'currency': 'USD',
-                            'data_source': 'financial_modeling_prep',
-                            'confidence_score': 0.85
-                        })
-                    
-                    return dividend_list
-                    
+            session = await _get_http_session()
+            async with session.get(url, params=params) as response:
+                if response.status != 200:
+                    return []
+                
+                data = await response.json(loads=_json_loads)
+                
+                if 'historical' not in data:
+                    return []
+                
+                dividend_list = []
+                for div_data in data['historical']:
+                    record_date = div_data.get('recordDate')
+                    payment_date = div_data.get('paymentDate')
+                    declaration_date = div_data.get('declarationDate')
+                    dividend_list.append({
+                        'ex_date': _parse_ymd(div_data['date']),
+                        'record_date': _parse_ymd(record_date) if record_date else None,
+                        'payment_date': _parse_ymd(payment_date) if payment_date else None,
+                        'declaration_date': _parse_ymd(declaration_date) if declaration_date else None,
+                        'amount': float(div_data['dividend']),
+                        'adjusted_amount': float(div_data.get('adjDividend', div_data['dividend'])),
+                        'dividend_type': DividendType.REGULAR,
+                        'currency': 'USD',
+                        'data_source': 'financial_modeling_prep',
+                        'confidence_score': 0.85
+                    })
+                
+                return dividend_list
+                
         except Exception as e:
             logger.error("Error fetching FMP dividends", ticker=ticker, error=str(e))
             return []
     
-    async def _get_fred_economic_indicators(self) -> Dict[str, Any]:
-        """Get relevant economic indicators from FRED"""
+    async def _get_fred_economic_indicators(self) -> Mapping[str, Any]:
+        """Get relevant economic indicators from FRED (read-only), cached across requests for an hour"""
         
         if not self.fred_api_key:
             return {}
         
+        indicators = _fred_indicators_cache.get('indicators')
+        if indicators is not None:
+            return indicators
+        
         try:
-            indicators = {}
-            
-            for indicator_name, series_id in self.fred_indicators.items():
-                try:
-                    url = f"{self.fred_base_url}/series/observations"
-                    params = {
-                        'series_id': series_id,
-                        'api_key': self.fred_api_key,
-                        'file_type': 'json',
-                        'limit': 12,  # Last 12 observations
-                        'sort_order': 'desc'
-                    }
-                    
-                    async with aiohttp.ClientSession() as session:
-                        async with session.get(url, params=params) as response:
-                            if response.status == 200:
-                                data = await response.json()
-                                if 'observations' in data and data['observations']:
-                                    latest_obs = data['observations'][0]
-                                    if latest_obs['value'] != '.':
-                                        indicators[indicator_name] = {
-                                            'value': float(latest_obs['value']),
-                                            'date': latest_obs['date'],
-                                            'series_id': series_id
-                                        }
-                except Exception as e:
-                    logger.warning(f"Error fetching FRED indicator {indicator_name}", error=str(e))
-                    continue
-                
-                # Rate limiting for FRED API
-                await asyncio.sleep(0.1)
-            
+            # Every series goes through the shared pooled session; the semaphore keeps FRED's rate limit
+            semaphore = asyncio.Semaphore(FRED_MAX_CONCURRENT_REQUESTS)
+            session = await _get_http_session()
+            observations = await asyncio.gather(*(
+                self._fetch_fred_series(session, semaphore, indicator_name, series_id)
+                for indicator_name, series_id in self.fred_indicators.items()
+            ))
+            
+            indicators = MappingProxyType({
+                indicator_name: MappingProxyType(observation)
+                for indicator_name, observation in zip(self.fred_indicators, observations)
+                if observation is not None
+            })
+            # Only cache usable snapshots so an outage is retried on the next request
+            if indicators:
+                _fred_indicators_cache.set('indicators', indicators)
             return indicators
             
         except Exception as e:
             logger.error("Error fetching FRED economic indicators", error=str(e))
             return {}
     
+    async def _fetch_fred_series(
+        self,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore,
+        indicator_name: str,
+        series_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """Latest observation for one FRED series (None when unavailable)"""
+        url = f"{self.fred_base_url}/series/observations"
+        params = {
+            'series_id': series_id,
+            'api_key': self.fred_api_key,
+            'file_type': 'json',
+            'limit': 12,  # Last 12 observations
+            'sort_order': 'desc'
+        }
+        
+        try:
+            async with semaphore:
+                async with session.get(url, params=params) as response:
+                    if response.status != 200:
+                        return None
+                    data = await response.json(loads=_json_loads)
+        except Exception as e:
+            logger.warning(f"Error fetching FRED indicator {indicator_name}", error=str(e))
+            return None
+        
+        if 'observations' in data and data['observations']:
+            latest_obs = data['observations'][0]
+            if latest_obs['value'] != '.':
+                return {
+                    'value': float(latest_obs['value']),
+                    'date': latest_obs['date'],
+                    'series_id': series_id
+                }
+        return None
+    
     async def _get_company_financial_metrics(self, ticker: str) -> Dict[str, Any]:
         """Get company financial metrics for dividend analysis"""
         
         try:
-            stock = yf.Ticker(ticker)
-            
-            # Get financial statements
-            financials = stock.financials
-            balance_sheet = stock.balance_sheet
-            cash_flow = stock.cashflow
+            # Get financial statements (each is a separate blocking scrape)
+            financials, balance_sheet, cash_flow = await asyncio.gather(
+                asyncio.to_thread(_fetch_statement_sync, ticker, 'financials'),
+                asyncio.to_thread(_fetch_statement_sync, ticker, 'balance_sheet'),
+                asyncio.to_thread(_fetch_statement_sync, ticker, 'cashflow')
+            )
             
             metrics = {}
             
-            if not financials.empty:
-                latest_financials = financials.iloc[:, 0]
-                
-                # Income statement metrics
-                metrics['net_income'] = self._safe_float(latest_financials.get('Net Income'))
-                metrics['total_revenue'] = self._safe_float(latest_financials.get('Total Revenue'))
-                metrics['operating_income'] = self._safe_float(latest_financials.get('Operating Income'))
-                metrics['interest_expense'] = self._safe_float(latest_financials.get('Interest Expense'))
-            
-            if not balance_sheet.empty:
-                latest_balance = balance_sheet.iloc[:, 0]
-                
-                # Balance sheet metrics
-                metrics['total_assets'] = self._safe_float(latest_balance.get('Total Assets'))
-                metrics['total_debt'] = self._safe_float(latest_balance.get('Total Debt'))
-                metrics['shareholders_equity'] = self._safe_float(latest_balance.get('Stockholders Equity'))
-                metrics['current_assets'] = self._safe_float(latest_balance.get('Current Assets'))
-                metrics['current_liabilities'] = self._safe_float(latest_balance.get('Current Liabilities'))
+            # Income statement, balance sheet and cash flow metrics from the latest period
+            metrics.update(self._latest_statement_items(financials, _INCOME_STATEMENT_ITEMS))
+            metrics.update(self._latest_statement_items(balance_sheet, _BALANCE_SHEET_ITEMS))
             
             if not cash_flow.empty:
-                latest_cashflow = cash_flow.iloc[:, 0]
-                
-                # Cash flow metrics
-                metrics['operating_cash_flow'] = self._safe_float(latest_cashflow.get('Operating Cash Flow'))
-                metrics['capital_expenditures'] = self._safe_float(latest_cashflow.get('Capital Expenditures'))
-                metrics['dividends_paid'] = self._safe_float(latest_cashflow.get('Dividends Paid'))
+                metrics.update(self._latest_statement_items(cash_flow, _CASH_FLOW_ITEMS))
                 
                 # Calculate free cash flow
                 if metrics.get('operating_cash_flow') and metrics.get('capital_expenditures'):
@@ -2744,12 +3012,18 @@ class DividendService:
             logger.error("Error fetching company financial metrics", ticker=ticker, error=str(e))
             return {}
     
+    def _latest_statement_items(self, statement: pd.DataFrame, items: Dict[str, str]) -> Dict[str, Optional[float]]:
+        """Latest-period line items of a yfinance statement, converted to a dict once instead of per-label Series lookups"""
+        if statement.empty:
+            return {}
+        latest = statement.iloc[:, 0].to_dict()
+        return {metric: self._safe_float(latest.get(label)) for metric, label in items.items()}
+    
     async def _get_current_stock_info(self, ticker: str) -> Dict[str, Any]:
         """Get current stock information"""
         
         try:
-            stock = yf.Ticker(ticker)
-            info = stock.info
+            info = await self._fetch_ticker_info(ticker)
             
             return {
                 'current_price': info.get('currentPrice', info.get('regularMarketPrice')),
@@ -2785,14 +3059,21 @@ class DividendService:
         try:
             analysis = {}
             
+            # Array-backed view so the metric helpers slice and sum amounts without per-dict lookups
+            if not isinstance(dividend_history, DividendHistory):
+                dividend_history = DividendHistory(dividend_history)
+            
+            # Aggregate by year once; growth, consistency and aristocrat checks share it
+            annual_dividends = self._aggregate_annual_dividends(dividend_history)
+            
             # Calculate yield metrics
             analysis.update(self._calculate_yield_metrics(dividend_history, stock_info))
             
             # Calculate growth metrics
-            analysis.update(self._calculate_growth_metrics(dividend_history))
+            analysis.update(self._calculate_growth_metrics(dividend_history, annual_dividends))
             
             # Calculate consistency metrics
-            analysis.update(self._calculate_consistency_metrics(dividend_history))
+            analysis.update(self._calculate_consistency_metrics(dividend_history, annual_dividends))
             
             # Calculate coverage and sustainability metrics
             analysis.update(self._calculate_coverage_metrics(dividend_history, financial_metrics, stock_info))
@@ -2801,7 +3082,7 @@ class DividendService:
             analysis.update(self._calculate_financial_strength(financial_metrics))
             
             # Determine dividend aristocrat status
-            analysis.update(self._determine_aristocrat_status(dividend_history))
+            analysis.update(self._determine_aristocrat_status(dividend_history, annual_dividends))
             
             # Calculate overall dividend score
             analysis['dividend_quality_score'] = self._calculate_dividend_quality_score(analysis)
@@ -2825,13 +3106,14 @@ class DividendService:
             current_yield *= 100  # Convert to percentage
         
         # Calculate trailing 12-month yield
-        trailing_12m_dividends = [
-            div for div in dividend_history
-            if div['ex_date'] >= (date.today() - timedelta(days=365))
-        ]
+        year_ago = date.today() - _TRAILING_YEAR
+        if isinstance(dividend_history, DividendHistory):
+            trailing_12m_amount = dividend_history.series.total_since(year_ago)
+        else:
+            trailing_12m_amounts = [div['amount'] for div in dividend_history if div['ex_date'] >= year_ago]
+            trailing_12m_amount = sum(trailing_12m_amounts) if trailing_12m_amounts else None
         
-        if trailing_12m_dividends:
-            trailing_12m_amount = sum(div['amount'] for div in trailing_12m_dividends)
+        if trailing_12m_amount is not None:
             trailing_12m_yield = (trailing_12m_amount / current_price) * 100
         else:
             trailing_12m_yield = None
@@ -2841,82 +3123,60 @@ class DividendService:
             'trailing_12m_yield': trailing_12m_yield
         }
     
-    def _calculate_growth_metrics(self, dividend_history: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _calculate_growth_metrics(
+        self,
+        dividend_history: List[Dict[str, Any]],
+        annual_dividends: Optional[AnnualDividends] = None
+    ) -> Dict[str, Any]:
         """Calculate dividend growth metrics"""
         
         if len(dividend_history) < 2:
             return {}
         
         # Group dividends by year and calculate annual dividends
-        annual_dividends = {}
-        for div in dividend_history:
-            year = div['ex_date'].year
-            if year not in annual_dividends:
-                annual_dividends[year] = 0
-            annual_dividends[year] += div['amount']
-        
-        years = sorted(annual_dividends.keys(), reverse=True)
-        
-        # Calculate growth rates
-        growth_rates = {}
-        
-        for period_years, key in [(1, '1y'), (3, '3y'), (5, '5y'), (10, '10y')]:
-            if len(years) >= period_years + 1:
-                current_dividend = annual_dividends[years[0]]
-                past_dividend = annual_dividends[years[period_years]]
-                
-                if past_dividend > 0:
-                    if period_years == 1:
-                        growth_rate = ((current_dividend / past_dividend) - 1) * 100
-                    else:
-                        # Annualized growth rate
-                        growth_rate = (((current_dividend / past_dividend) ** (1/period_years)) - 1) * 100
-                    
-                    growth_rates[f'dividend_growth_rate_{key}'] = growth_rate
+        if annual_dividends is None:
+            annual_dividends = self._aggregate_annual_dividends(dividend_history)
+        
+        amounts = annual_dividends.values_desc
         
-        return growth_rates
+        # Annualized growth rates over every period the history covers (1y is the plain change)
+        periods = _GROWTH_PERIODS[_GROWTH_PERIODS < amounts.size]
+        past_dividends = amounts[periods]
+        valid = past_dividends > 0
+        periods, past_dividends = periods[valid], past_dividends[valid]
+        rates = ((amounts[0] / past_dividends) ** (1.0 / periods) - 1) * 100
+        
+        return {
+            f'dividend_growth_rate_{period}y': float(rate)
+            for period, rate in zip(periods.tolist(), rates)
+        }
     
-    def _calculate_consistency_metrics(self, dividend_history: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _calculate_consistency_metrics(
+        self,
+        dividend_history: List[Dict[str, Any]],
+        annual_dividends: Optional[AnnualDividends] = None
+    ) -> Dict[str, Any]:
         """Calculate dividend consistency metrics"""
         
         if not dividend_history:
             return {}
         
         # Group by year and calculate annual dividends
-        annual_dividends = {}
-        for div in dividend_history:
-            year = div['ex_date'].year
-            if year not in annual_dividends:
-                annual_dividends[year] = 0
-            annual_dividends[year] += div['amount']
+        if annual_dividends is None:
+            annual_dividends = self._aggregate_annual_dividends(dividend_history)
         
-        years = sorted(annual_dividends.keys())
+        years = annual_dividends.years_asc
         
         if len(years) < 2:
             return {}
         
-        # Count consecutive increases and payments
-        consecutive_increases = 0
+        consecutive_increases = annual_dividends.increase_streak()
         consecutive_payments = len(years)  # All years with dividends are payments
         
-        for i in range(len(years) - 1, 0, -1):
-            current_year = years[i]
-            previous_year = years[i - 1]
-            
-            if annual_dividends[current_year] > annual_dividends[previous_year]:
-                consecutive_increases += 1
-            else:
-                break
-        
         # Calculate consistency score (0-10)
         # Based on payment regularity, growth consistency, and volatility
-        dividend_amounts = [annual_dividends[year] for year in years]
-        
-        if len(dividend_amounts) > 1:
-            volatility = stdev(dividend_amounts) / mean(dividend_amounts) if mean(dividend_amounts) > 0 else 1
-            consistency_score = max(0, min(10, 10 - (volatility * 5)))
-        else:
-            consistency_score = 5.0
+        volatility = coef_of_variation(annual_dividends.values_asc)
+        consistency_score = max(0, min(10, 10 - (volatility * 5)))
         
         return {
             'dividend_consistency_score': consistency_score,
@@ -2939,34 +3199,44 @@ class DividendService:
         if payout_ratio:
             metrics['payout_ratio'] = payout_ratio * 100
         
-        # Calculate payout ratio from financial data if not available
-        net_income = financial_metrics.get('net_income')
-        dividends_paid = financial_metrics.get('dividends_paid')
-        
-        if net_income and dividends_paid and net_income > 0:
-            calculated_payout_ratio = (abs(dividends_paid) / net_income) * 100
-            if 'payout_ratio' not in metrics:
-                metrics['payout_ratio'] = calculated_payout_ratio
-        
-        # Free cash flow payout ratio
-        free_cash_flow = financial_metrics.get('free_cash_flow')
-        if free_cash_flow and dividends_paid and free_cash_flow > 0:
-            metrics['free_cash_flow_payout_ratio'] = (abs(dividends_paid) / free_cash_flow) * 100
-        
-        # Debt-to-equity ratio
-        total_debt = financial_metrics.get('total_debt')
-        shareholders_equity = financial_metrics.get('shareholders_equity')
-        if total_debt is not None and shareholders_equity and shareholders_equity > 0:
-            metrics['debt_to_equity_ratio'] = total_debt / shareholders_equity
+        # Statement-based ratios via the batch path (missing inputs become NaN)
+        ratios = self._calculate_coverage_metrics_batch(**{
+            name: np.array([financial_metrics.get(name)], dtype=np.float64)
+            for name in ('net_income', 'dividends_paid', 'free_cash_flow', 'total_debt',
+                         'shareholders_equity', 'operating_income', 'interest_expense')
+        })
         
-        # Interest coverage ratio
-        operating_income = financial_metrics.get('operating_income')
-        interest_expense = financial_metrics.get('interest_expense')
-        if operating_income and interest_expense and interest_expense > 0:
-            metrics['interest_coverage_ratio'] = operating_income / interest_expense
+        # The calculated payout ratio is only a fallback for the reported one
+        for name, values in ratios.items():
+            if not np.isnan(values[0]) and name not in metrics:
+                metrics[name] = float(values[0])
         
         return metrics
     
+    def _calculate_coverage_metrics_batch(
+        self,
+        net_income: np.ndarray,
+        dividends_paid: np.ndarray,
+        free_cash_flow: np.ndarray,
+        total_debt: np.ndarray,
+        shareholders_equity: np.ndarray,
+        operating_income: np.ndarray,
+        interest_expense: np.ndarray
+    ) -> Dict[str, np.ndarray]:
+        """
+        Payout, FCF payout, debt-to-equity and interest coverage ratios for arrays of tickers.
+        Each ratio is NaN where its inputs are missing or its denominator is not positive.
+        """
+        dividends_paid = np.abs(dividends_paid)
+        has_dividends = dividends_paid > 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return {
+                'payout_ratio': np.where(has_dividends & (net_income > 0), dividends_paid / net_income * 100, np.nan),
+                'free_cash_flow_payout_ratio': np.where(has_dividends & (free_cash_flow > 0), dividends_paid / free_cash_flow * 100, np.nan),
+                'debt_to_equity_ratio': np.where(shareholders_equity > 0, total_debt / shareholders_equity, np.nan),
+                'interest_coverage_ratio': np.where((operating_income != 0) & (interest_expense > 0), operating_income / interest_expense, np.nan)
+            }
+    
     def _calculate_financial_strength(self, financial_metrics: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate financial strength indicators"""
         
@@ -2991,28 +3261,17 @@ class DividendService:
         
         return metrics
     
-    def _determine_aristocrat_status(self, dividend_history: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _determine_aristocrat_status(
+        self,
+        dividend_history: List[Dict[str, Any]],
+        annual_dividends: Optional[AnnualDividends] = None
+    ) -> Dict[str, Any]:
         """Determine dividend aristocrat status"""
         
         # Calculate years of consecutive increases
-        annual_dividends = {}
-        for div in dividend_history:
-            year = div['ex_date'].year
-            if year not in annual_dividends:
-                annual_dividends[year] = 0
-            annual_dividends[year] += div['amount']
-        
-        years = sorted(annual_dividends.keys())
-        consecutive_increases = 0
-        
-        for i in range(len(years) - 1, 0, -1):
-            current_year = years[i]
-            previous_year = years[i - 1]
-            
-            if annual_dividends[current_year] > annual_dividends[previous_year]:
-                consecutive_increases += 1
-            else:
-                break
+        if annual_dividends is None:
+            annual_dividends = self._aggregate_annual_dividends(dividend_history)
+        consecutive_increases = annual_dividends.increase_streak()
         
         return {
             'is_dividend_aristocrat': consecutive_increases >= 25,  # S&P 500 requirement
@@ -3023,52 +3282,51 @@ class DividendService:
     def _calculate_dividend_quality_score(self, analysis: Dict[str, Any]) -> float:
         """Calculate overall dividend quality score (0-10)"""
         
-        score = 0.0
-        max_score = 10.0
-        
-        # Yield component (2 points max)
-        current_yield = analysis.get('current_dividend_yield', 0)
-        if current_yield:
-            if 2 <= current_yield <= 6:  # Sweet spot
-                score += 2.0
-            elif 1 <= current_yield < 2 or 6 < current_yield <= 8:
-                score += 1.5
-            elif current_yield > 0:
-                score += 1.0
-        
+        # Missing (or zero) yield, growth and payout inputs earn no points, so they become NaN
+        def metric(key: str, default: float) -> np.ndarray:
+            value = analysis.get(key, default)
+            return np.array([float(value) if value else np.nan])
+        
+        scores = self._calculate_dividend_quality_score_batch(
+            metric('current_dividend_yield', 0),
+            metric('dividend_growth_rate_5y', 0),
+            metric('payout_ratio', 100),
+            np.array([float(analysis.get('dividend_consistency_score', 0))]),
+            np.array([analysis.get('years_of_consecutive_increases', 0)]),
+            np.array([bool(analysis.get('is_dividend_king'))]),
+            np.array([bool(analysis.get('is_dividend_aristocrat'))])
+        )
+        return float(scores[0])
+    
+    def _calculate_dividend_quality_score_batch(
+        self,
+        current_yields: np.ndarray,
+        growth_rates_5y: np.ndarray,
+        payout_ratios: np.ndarray,
+        consistency_scores: np.ndarray,
+        consecutive_increases: np.ndarray,
+        is_king: np.ndarray,
+        is_aristocrat: np.ndarray
+    ) -> np.ndarray:
+        """Dividend quality scores (0-10) for arrays of tickers; NaN yield, growth or payout earns 0 points"""
+        y = current_yields
+        # Yield component (2 points max), with a 2-6% sweet spot
+        yield_points = np.select(
+            [(y >= 2) & (y <= 6), ((y >= 1) & (y < 2)) | ((y > 6) & (y <= 8)), y > 0],
+            [2.0, 1.5, 1.0], default=0.0
+        )
         # Growth component (2 points max)
-        growth_5y = analysis.get('dividend_growth_rate_5y', 0)
-        if growth_5y:
-            if growth_5y >= 10:
-                score += 2.0
-            elif growth_5y >= 5:
-                score += 1.5
-            elif growth_5y > 0:
-                score += 1.0
-        
-        # Coverage component (2 points max)
-        payout_ratio = analysis.get('payout_ratio', 100)
-        if payout_ratio:
-            if payout_ratio <= 60:
-                score += 2.0
-            elif payout_ratio <= 80:
-                score += 1.5
-            elif payout_ratio <= 100:
-                score += 1.0
-        
+        g = growth_rates_5y
+        growth_points = np.select([g >= 10, g >= 5, g > 0], [2.0, 1.5, 1.0], default=0.0)
+        # Coverage component (2 points max); NaN sorts past every threshold
+        payout_points = _PAYOUT_QUALITY_POINTS[np.searchsorted(_PAYOUT_QUALITY_THRESHOLDS, payout_ratios, side='left')]
         # Consistency component (2 points max)
-        consistency_score = analysis.get('dividend_consistency_score', 0)
-        score += (consistency_score / 10) * 2
-        
+        consistency_points = (consistency_scores / 10) * 2
         # Aristocrat bonus (2 points max)
-        if analysis.get('is_dividend_king'):
-            score += 2.0
-        elif analysis.get('is_dividend_aristocrat'):
-            score += 1.5
-        elif analysis.get('years_of_consecutive_increases', 0) >= 10:
-            score += 1.0
-        
-        return min(score, max_score)
+        streak_points = np.select([is_king, is_aristocrat, consecutive_increases >= 10], [2.0, 1.5, 1.0], default=0.0)
+        
+        score = yield_points + growth_points + payout_points + consistency_points + streak_points
+        return np.minimum(score, 10.0)
     
     def _get_current_dividend_info(self, stock_info: Dict[str, Any], dividend_history: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Get current dividend information"""
@@ -3088,20 +3346,18 @@ class DividendService:
             current_info['last_dividend_amount'] = latest_div['amount']
             current_info['last_ex_date'] = latest_div['ex_date']
             
-            # Estimate annual dividend and frequency
-            recent_dividends = [
-                div for div in dividend_history
-                if div['ex_date'] >= (date.today() - timedelta(days=365))
-            ]
+            # Estimate annual dividend and frequency from the last year's payments
+            if not isinstance(dividend_history, DividendHistory):
+                dividend_history = DividendHistory(dividend_history)
+            recent_amounts = dividend_history.series.amounts_since(date.today() - _TRAILING_YEAR)
             
-            if recent_dividends:
-                annual_amount = sum(div['amount'] for div in recent_dividends)
-                current_info['estimated_annual_dividend'] = annual_amount
+            if recent_amounts.size:
+                current_info['estimated_annual_dividend'] = float(recent_amounts.sum())
                 
                 # Estimate frequency
-                if len(recent_dividends) >= 4:
+                if recent_amounts.size >= 4:
                     current_info['frequency'] = DividendFrequency.QUARTERLY
-                elif len(recent_dividends) >= 2:
+                elif recent_amounts.size >= 2:
                     current_info['frequency'] = DividendFrequency.SEMI_ANNUAL
                 else:
                     current_info['frequency'] = DividendFrequency.ANNUAL
@@ -3133,38 +3389,17 @@ class DividendService:
     ) -> Dict[str, Any]:
         """Assess dividend sustainability risk"""
         
-        risk_factors = []
-        risk_score = 0.0  # 0 = low risk, 10 = high risk
-        
-        # Payout ratio risk
-        payout_ratio = analysis.get('payout_ratio', 0)
-        if payout_ratio > 100:
-            risk_factors.append("Payout ratio exceeds 100%")
-            risk_score += 3.0
-        elif payout_ratio > 80:
-            risk_factors.append("High payout ratio (>80%)")
-            risk_score += 2.0
-        elif payout_ratio > 60:
-            risk_factors.append("Moderate payout ratio (>60%)")
-            risk_score += 1.0
+        # Payout ratio, debt level and interest coverage risk bands (0 = low risk, 10 = high risk)
+        payout_band = int(np.searchsorted(_PAYOUT_RISK_BANDS, analysis.get('payout_ratio', 0), side='left'))
+        debt_band = int(np.searchsorted(_DEBT_RISK_BANDS, analysis.get('debt_to_equity_ratio', 0), side='left'))
+        interest_band = int(np.searchsorted(_INTEREST_RISK_BANDS, analysis.get('interest_coverage_ratio', float('inf')), side='right'))
         
-        # Debt level risk
-        debt_to_equity = analysis.get('debt_to_equity_ratio', 0)
-        if debt_to_equity > 2.0:
-            risk_factors.append("Very high debt-to-equity ratio")
-            risk_score += 2.5
-        elif debt_to_equity > 1.0:
-            risk_factors.append("High debt-to-equity ratio")
-            risk_score += 1.5
-        
-        # Interest coverage risk
-        interest_coverage = analysis.get('interest_coverage_ratio', float('inf'))
-        if interest_coverage < 2.0:
-            risk_factors.append("Low interest coverage ratio")
-            risk_score += 2.0
-        elif interest_coverage < 5.0:
-            risk_factors.append("Moderate interest coverage concern")
-            risk_score += 1.0
+        risk_score = _PAYOUT_RISK_POINTS[payout_band] + _DEBT_RISK_POINTS[debt_band] + _INTEREST_RISK_POINTS[interest_band]
+        risk_factors = [
+            factor for factor in (
+                _PAYOUT_RISK_FACTORS[payout_band], _DEBT_RISK_FACTORS[debt_band], _INTEREST_RISK_FACTORS[interest_band]
+            ) if factor
+        ]
         
         # Economic environment risk
         fed_funds_rate = economic_indicators.get('fed_funds_rate', {}).get('value', 0)
@@ -3179,14 +3414,7 @@ class DividendService:
             risk_score += 2.0
         
         # Determine overall risk rating
-        if risk_score >= 7.0:
-            risk_rating = "HIGH"
-        elif risk_score >= 4.0:
-            risk_rating = "MODERATE"
-        elif risk_score >= 2.0:
-            risk_rating = "LOW-MODERATE"
-        else:
-            risk_rating = "LOW"
+        risk_rating = _LEGACY_RISK_RATINGS[int(np.searchsorted(_LEGACY_RISK_RATING_THRESHOLDS, risk_score, side='right'))]
         
         return {
             'dividend_risk_score': min(risk_score, 10.0),
@@ -3205,23 +3433,15 @@ class DividendService:
         # Adjust for positive factors
         adjusted_score = risk_score - (quality_score / 10 * 2) - (min(years_increases, 25) / 25 * 2)
         
-        if adjusted_score <= 1.0:
-            return "EXCELLENT"
-        elif adjusted_score <= 3.0:
-            return "GOOD"
-        elif adjusted_score <= 5.0:
-            return "FAIR"
-        elif adjusted_score <= 7.0:
-            return "POOR"
-        else:
-            return "VERY_POOR"
+        return _ADJUSTED_RISK_RATINGS[int(np.searchsorted(_ADJUSTED_RISK_THRESHOLDS, adjusted_score, side='left'))]
     
     async def _generate_dividend_forecast(
         self,
         ticker: str,
         dividend_history: List[Dict[str, Any]],
         financial_metrics: Dict[str, Any],
-        economic_indicators: Dict[str, Any]
+        economic_indicators: Dict[str, Any],
+        annual_dividends: Optional[AnnualDividends] = None
     ) -> List[Dict[str, Any]]:
         """Generate dividend forecasts"""
         
@@ -3229,39 +3449,33 @@ class DividendService:
             return []
         
         # Simple forecast based on historical growth
-        annual_dividends = {}
-        for div in dividend_history:
-            year = div['ex_date'].year
-            if year not in annual_dividends:
-                annual_dividends[year] = 0
-            annual_dividends[year] += div['amount']
-        
-        years = sorted(annual_dividends.keys())
+        if annual_dividends is None:
+            annual_dividends = self._aggregate_annual_dividends(DividendHistory(dividend_history))
+        
+        years = annual_dividends.years_asc
         if len(years) < 3:
             return []
         
-        # Calculate average growth rate
-        growth_rates = []
-        for i in range(1, len(years)):
-            if annual_dividends[years[i-1]] > 0:
-                growth_rate = (annual_dividends[years[i]] / annual_dividends[years[i-1]]) - 1
-                growth_rates.append(growth_rate)
+        # Year-over-year growth rates, skipping years that follow a zero total
+        totals = annual_dividends.values_asc
+        has_base = totals[:-1] > 0
+        growth_rates = totals[1:][has_base] / totals[:-1][has_base] - 1
         
-        if not growth_rates:
+        if not growth_rates.size:
             return []
         
-        avg_growth_rate = mean(growth_rates)
-        latest_dividend = annual_dividends[years[-1]]
+        avg_growth_rate = float(growth_rates.mean())
+        latest_dividend = float(totals[-1])
+        
+        # Adjust confidence based on growth consistency
+        growth_std = float(np.std(growth_rates, ddof=1)) if growth_rates.size > 1 else 0.2
+        confidence = max(0.3, min(0.9, 0.8 - (growth_std * 2)))
         
         forecasts = []
         for year_ahead in range(1, 4):  # 3-year forecast
             forecast_date = date(years[-1] + year_ahead, 12, 31)
             estimated_amount = latest_dividend * ((1 + avg_growth_rate) ** year_ahead)
             
-            # Adjust confidence based on growth consistency
-            growth_std = stdev(growth_rates) if len(growth_rates) > 1 else 0.2
-            confidence = max(0.3, min(0.9, 0.8 - (growth_std * 2)))
-            
             forecasts.append({
                 'forecast_date': forecast_date,
                 'estimated_amount': round(estimated_amount, 4),
@@ -3287,62 +3501,11 @@ class DividendService:
             'comparison_summary': "Peer comparison requires sector database implementation"
         }
     
-    def _merge_dividend_data(
-        self,
-        yf_dividends: List[Dict[str, Any]],
-        av_dividends: List[Dict[str, Any]],
-        fmp_dividends: List[Dict[str, Any]]
-    ) -> List[Dict[str, Any]]:
-        """Merge dividend data from multiple sources"""
-        
-        # Create a comprehensive list with cross-validation
-        all_dividends = {}
-        
-        # Add all dividends with date as key
-        for source_dividends in [yf_dividends, av_dividends, fmp_dividends]:
-            for div in source_dividends:
-                date_key = div['ex_date']
-                if date_key not in all_dividends:
-                    all_dividends[date_key] = []
-                all_dividends[date_key].append(div)
-        
-        # Merge and validate dividends for each date
-        merged_dividends = []
-        for ex_date, divs in all_dividends.items():
-            if len(divs) == 1:
-                merged_dividends.append(divs[0])
-            else:
-                # Multiple sources - validate and merge
-                amounts = [div['amount'] for div in divs]
-                avg_amount = mean(amounts)
-                
-                # Use the dividend with amount closest to average
-                best_div = min(divs, key=lambda d: abs(d['amount'] - avg_amount))
-                
-                # Enhance with additional data from other sources
-                merged_div = best_div.copy()
-                for div in divs:
-                    if div != best_div:
-                        # Add any additional fields
-                        for key, value in div.items():
-                            if key not in merged_div and value is not None:
-                                merged_div[key] = value
-                
-                # Update confidence score based on agreement
-                variance = stdev(amounts) if len(amounts) > 1 else 0
-                if variance < 0.01:  # Very close agreement
-                    merged_div['confidence_score'] = 0.95
-                elif variance < 0.05:
-                    merged_div['confidence_score'] = 0.85
-                else:
-                    merged_div['confidence_score'] = 0.75
-                
-                merged_dividends.append(merged_div)
-        
-        return merged_dividends
-    
     def _safe_float(self, value) -> Optional[float]:
         """Safely convert value to float"""
+        # Numbers (the common case for yfinance fields) convert without entering the try block
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return float(value)
         try:
             return float(value) if value is not None else None
         except (ValueError, TypeError):
@@ -3357,27 +3520,23 @@ class DividendService:
         
         start_value = chart_data[0]['dividend_amount']
         end_value = chart_data[-1]['dividend_amount']
-        years = len(chart_data) - 1
         
         if start_value <= 0:
             return 0
         
-        cagr = ((end_value / start_value) ** (1/years)) - 1
-        return round(cagr * 100, 2)
+        growth = cagr(float(start_value), float(end_value), len(chart_data) - 1)
+        return round(growth * 100, 2)
 
     def _calculate_correlation(self, chart_data: List[Dict]) -> float:
         """Calculate correlation between yield and price"""
         if len(chart_data) < 3:
             return 0
         
-        yields = [d['dividend_yield'] for d in chart_data]
-        prices = [d['stock_price'] for d in chart_data]
-        
         try:
-            correlation = np.corrcoef(yields, prices)[0, 1]
-            return round(correlation, 3) if not np.isnan(correlation) else 0
-        except:
-            return 0
+            correlation = pearson(_chart_column(chart_data, 'dividend_yield'), _chart_column(chart_data, 'stock_price'))
+        except (KeyError, TypeError, ValueError):
+            return 0.0
+        return round(correlation, 3) if not np.isnan(correlation) else 0.0
 
     def _compare_current_vs_average(self, chart_data: List[Dict]) -> Dict[str, Any]:
         """Compare current metrics vs historical average"""
@@ -3385,13 +3544,14 @@ class DividendService:
             return {}
         
         current = chart_data[-1]
-        avg_yield = mean([d['dividend_yield'] for d in chart_data])
-        avg_price = mean([d['stock_price'] for d in chart_data])
+        yields = _chart_column(chart_data, 'dividend_yield')
+        avg_yield = float(yields.mean())
+        avg_price = float(_chart_column(chart_data, 'stock_price').mean())
         
         return {
             'current_yield_vs_avg': round(current['dividend_yield'] - avg_yield, 2),
             'current_price_vs_avg': round(current['stock_price'] - avg_price, 2),
-            'yield_percentile': self._calculate_percentile(current['dividend_yield'], [d['dividend_yield'] for d in chart_data])
+            'yield_percentile': percentile_rank(float(current['dividend_yield']), yields)
         }
 
     def _calculate_growth_sustainability_score(self, chart_data: List[Dict]) -> int:
@@ -3399,17 +3559,18 @@ class DividendService:
         if not chart_data:
             return 0
         
-        growth_rates = [d['dividend_growth'] for d in chart_data if d['dividend_growth'] is not None]
+        growth_rates = _chart_column(chart_data, 'dividend_growth')
+        growth_rates = growth_rates[~np.isnan(growth_rates)]
         
-        if not growth_rates:
+        if not growth_rates.size:
             return 0
         
         # Score based on consistency and moderation of growth
-        positive_growth = sum(1 for gr in growth_rates if gr > 0)
-        consistency = (positive_growth / len(growth_rates)) * 50
+        positive_growth = int((growth_rates > 0).sum())
+        consistency = (positive_growth / growth_rates.size) * 50
         
         # Penalize excessive growth (unsustainable)
-        avg_growth = mean(growth_rates)
+        avg_growth = float(growth_rates.mean())
         moderation = 50 if 3 <= avg_growth <= 12 else max(0, 50 - abs(avg_growth - 7.5) * 2)
         
         return int(consistency + moderation)
@@ -3421,62 +3582,33 @@ class DividendService:
         if not financials:
             return 0
         
-        score = 0
-        
-        # ROE scoring (8 points)
+        # ROE (8 points), debt-to-equity (6 points), current ratio (6 points)
+        return score_financial_strength(*self._financial_strength_inputs(financials))
+
+    def _financial_strength_inputs(self, financials: Dict) -> Tuple[float, float, float]:
+        """Normalised ROE, debt ratio and current ratio for financial strength scoring"""
         roe = financials.get('roe', 0) / 100 if financials.get('roe') else 0
-        if roe > 0.20: score += 8
-        elif roe > 0.15: score += 6
-        elif roe > 0.10: score += 4
-        elif roe > 0.05: score += 2
-        
-        # Debt-to-equity scoring (6 points)
         debt_ratio = financials.get('debt_to_equity', 50) / 100
-        if debt_ratio < 0.25: score += 6
-        elif debt_ratio < 0.50: score += 4
-        elif debt_ratio < 0.75: score += 2
-        
-        # Current ratio scoring (6 points)
         current_ratio = financials.get('current_ratio', 1.0)
-        if current_ratio > 2.0: score += 6
-        elif current_ratio > 1.5: score += 4
-        elif current_ratio > 1.0: score += 2
-        
-        return score
+        return float(roe), float(debt_ratio), float(current_ratio)
 
     def _get_investment_recommendation(self, quality_score: float) -> str:
         """Get investment recommendation based on quality score"""
-        if quality_score >= 80: return 'Strong Buy'
-        elif quality_score >= 70: return 'Buy'
-        elif quality_score >= 60: return 'Hold'
-        elif quality_score >= 50: return 'Weak Hold'
-        else: return 'Sell'
+        return _LEGACY_RECOMMENDATIONS[int(np.searchsorted(_LEGACY_RECOMMENDATION_THRESHOLDS, quality_score, side='right'))]
 
-    def _calculate_fcf_coverage_ratio(self, dividends: List[Dict], financials: Dict) -> float:
+    def _calculate_fcf_coverage_ratio(self, dividends: List[Dict], financials: Dict, ttm: Optional[float] = None) -> float:
         """Calculate Free Cash Flow coverage ratio"""
         if not dividends or not financials:
             return 0
         
-        ttm_dividend_per_share = sum(div.get('amount', 0) for div in dividends[:4])
-        free_cash_flow = financials.get('free_cash_flow', 0)
+        ttm_dividend_per_share = self._ttm_dividend(dividends) if ttm is None else ttm
+        free_cash_flow = financials.get('free_cash_flow') or 0
         
         if ttm_dividend_per_share <= 0 or free_cash_flow <= 0:
             return 0
         
-        # Get shares outstanding from financials
-        shares_outstanding = financials.get('shares_outstanding', 0)
-        
-        # If shares_outstanding not available, estimate from market cap and price
-        if shares_outstanding <= 0:
-            market_cap = financials.get('market_cap', 0)
-            current_price = financials.get('current_price', 0)
-            if market_cap > 0 and current_price > 0:
-                shares_outstanding = market_cap / current_price
-            else:
-                # Fallback: assume reasonable share count for calculation
-                shares_outstanding = 1_000_000_000  # 1B shares as fallback
-        
         # Calculate FCF per share
+        shares_outstanding = self._shares_outstanding(financials)
         fcf_per_share = free_cash_flow / shares_outstanding if shares_outstanding > 0 else 0
         
         # Coverage ratio = FCF per share / Dividend per share
@@ -3531,34 +3663,26 @@ class DividendService:
             return 0
             
         years = sorted(filtered_dividends.keys(), reverse=True)
-        consecutive = 0
-        
-        # Start from the most recent complete year and go backwards
-        for i in range(len(years) - 1):
-            current_year_dividend = filtered_dividends[years[i]]
-            previous_year_dividend = filtered_dividends[years[i + 1]]
-            
-            # Check if current year dividend is greater than previous year
-            # Use a small tolerance for floating point comparison
-            increase_threshold = 0.0001  # $0.0001 threshold
-            if current_year_dividend > (previous_year_dividend + increase_threshold):
-                consecutive += 1
-            else:
-                break
         
-        # Enhanced debug logging
+        # Start from the most recent complete year and go backwards, counting increases
+        # beyond a small tolerance for floating point comparison ($0.0001 threshold)
+        values = np.array([filtered_dividends[year] for year in years], dtype=np.float64)
+        consecutive = int(increase_streak(values, 0.0001))
+        
+        # Enhanced debug logging (the five logged amounts are rounded in one array call)
+        recent = np.round(values[:5], 4).tolist()
         logger.info(f"Consecutive increases calculation detailed", 
                    ticker="N/A",
                    filtered_years=years[:5], 
                    consecutive=consecutive,
-                   annual_data={year: round(filtered_dividends[year], 4) for year in years[:5]},
+                   annual_data=dict(zip(years[:5], recent)),
                    recent_comparisons=[
                        {
                            'year': years[i], 
-                           'dividend': round(filtered_dividends[years[i]], 4),
-                           'prev_year': years[i+1] if i+1 < len(years) else None,
-                           'prev_dividend': round(filtered_dividends[years[i+1]], 4) if i+1 < len(years) else None,
-                           'is_increase': filtered_dividends[years[i]] > filtered_dividends[years[i+1]] + 0.0001 if i+1 < len(years) else None
+                           'dividend': recent[i],
+                           'prev_year': years[i+1],
+                           'prev_dividend': recent[i+1],
+                           'is_increase': bool(values[i] > values[i+1] + 0.0001)
                        } for i in range(min(3, len(years) - 1))
                    ])
                 
@@ -3575,7 +3699,7 @@ class DividendService:
             elif recent_growth_rates[-1] < recent_growth_rates[0]:
                 return 'Decelerating'
         
-        avg_growth = mean(recent_growth_rates)
+        avg_growth = float(np.mean(recent_growth_rates))
         if avg_growth > 5:
             return 'Strong Growth'
         elif avg_growth > 0:
@@ -3583,12 +3707,27 @@ class DividendService:
         else:
             return 'Declining'
 
-    def _calculate_ebitda_coverage_ratio(self, dividends: List[Dict], financials: Dict) -> float:
+    def _shares_outstanding(self, financials: Dict, default: float = 1_000_000_000) -> float:
+        """
+        Reported share count, else market cap / current price, else ``default``: a
+        1B-share estimate for the per-share ratios, 0 where coverage must not guess.
+        """
+        shares_outstanding = financials.get('shares_outstanding') or 0
+        if shares_outstanding > 0:
+            return shares_outstanding
+        
+        market_cap = financials.get('market_cap') or 0
+        current_price = financials.get('current_price') or 0
+        if market_cap > 0 and current_price > 0:
+            return market_cap / current_price
+        return default
+    
+    def _calculate_ebitda_coverage_ratio(self, dividends: List[Dict], financials: Dict, ttm: Optional[float] = None) -> float:
         """Calculate EBITDA coverage ratio"""
         if not dividends or not financials:
             return 0
         
-        ttm_dividend_per_share = sum(div.get('amount', 0) for div in dividends[:4])
+        ttm_dividend_per_share = self._ttm_dividend(dividends) if ttm is None else ttm
         
         # Use actual EBITDA if available, otherwise estimate
         ebitda = financials.get('ebitda', 0)
@@ -3601,18 +3740,8 @@ class DividendService:
         if ttm_dividend_per_share <= 0 or ebitda <= 0:
             return 0
         
-        # Get shares outstanding
-        shares_outstanding = financials.get('shares_outstanding', 0)
-        
-        if shares_outstanding <= 0:
-            market_cap = financials.get('market_cap', 0)
-            current_price = financials.get('current_price', 0)
-            if market_cap > 0 and current_price > 0:
-                shares_outstanding = market_cap / current_price
-            else:
-                shares_outstanding = 1_000_000_000  # Fallback
-        
         # Calculate EBITDA per share
+        shares_outstanding = self._shares_outstanding(financials)
         ebitda_per_share = ebitda / shares_outstanding if shares_outstanding > 0 else 0
         
         # Coverage ratio = EBITDA per share / Dividend per share
@@ -3620,16 +3749,11 @@ class DividendService:
 
     def _assess_coverage_adequacy(self, eps_coverage: float, fcf_coverage: float) -> str:
         """Assess overall coverage adequacy"""
-        if eps_coverage > 2.5 and fcf_coverage > 2.0:
-            return 'Excellent Coverage'
-        elif eps_coverage > 2.0 and fcf_coverage > 1.5:
-            return 'Good Coverage'
-        elif eps_coverage > 1.5 and fcf_coverage > 1.2:
-            return 'Adequate Coverage'
-        elif eps_coverage > 1.0 and fcf_coverage > 1.0:
-            return 'Marginal Coverage'
-        else:
-            return 'Poor Coverage'
+        tier = min(
+            int(np.searchsorted(_EPS_ADEQUACY_THRESHOLDS, eps_coverage, side='left')),
+            int(np.searchsorted(_FCF_ADEQUACY_THRESHOLDS, fcf_coverage, side='left'))
+        )
+        return _COVERAGE_ADEQUACY[tier]
 
     def _analyze_coverage_trend(self, dividends: List[Dict], financials: Dict) -> str:
         """Analyze coverage trend (simplified)"""
@@ -3647,18 +3771,15 @@ class DividendService:
         if len(dividends) < 8:
             return 1.0
         
-        # Calculate quarterly dividend changes
-        quarterly_changes = []
-        for i in range(len(dividends) - 1):
-            current = dividends[i].get('amount', 0)
-            previous = dividends[i + 1].get('amount', 0)
-            if previous > 0:
-                change = (current - previous) / previous
-                quarterly_changes.append(change)
+        # Volatility of quarterly dividend changes
+        if isinstance(dividends, DividendHistory):
+            amounts = dividends.series.amounts
+        else:
+            amounts = np.array([div.get('amount', 0) for div in dividends], dtype=np.float64)
+        volatility = growth_rate_std(amounts)
         
-        if len(quarterly_changes) > 1:
-            volatility = stdev(quarterly_changes)
-            return min(2.0, volatility * 10)  # Scale and cap at 2.0
+        if not np.isnan(volatility):
+            return min(2.0, float(volatility) * 10)  # Scale and cap at 2.0
         
         return 1.0
 
@@ -3690,13 +3811,8 @@ class DividendService:
 
     def _assess_yield_attractiveness(self, current_yield: float, yield_percentile: float) -> str:
         """Assess yield attractiveness"""
-        if current_yield > 4.0 and yield_percentile > 70:
-            return 'Very Attractive'
-        elif current_yield > 3.0 and yield_percentile > 50:
-            return 'Attractive'
-        elif current_yield > 2.0:
-            return 'Moderate'
-        elif current_yield > 1.0:
-            return 'Low'
-        else:
-            return 'Very Low'
\ No newline at end of file
+        tier = min(
+            int(np.searchsorted(_ATTRACTIVE_YIELD_THRESHOLDS, current_yield, side='left')),
+            int(np.searchsorted(_ATTRACTIVE_PERCENTILE_THRESHOLDS, yield_percentile, side='left')) + 2
+        )
+        return _YIELD_ATTRACTIVENESS[tier]
\ No newline at end of file
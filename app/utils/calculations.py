@@ -0,0 +1,393 @@
+"""
+Numeric kernels for dividend analytics.
+
+The scoring arithmetic used by the dividend service is kept here as plain
+functions over floats and NumPy arrays so it can be JIT-compiled with Numba
+when it is installed (``pip install yieldflow-api[perf]``). Numba is optional:
+without it the same functions run as ordinary Python.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _kernel(func):
+    """Compile ``func`` with Numba when available, otherwise return it unchanged"""
+    if njit is None:
+        return func
+    return njit(cache=True)(func)
+
+
+# Sustainability bands: one threshold/points table per ratio, looked up with
+# searchsorted(side='right'). Higher-is-better ratios are negated so every table
+# ascends and a NaN ratio (sorted past the end) falls in the zero-point band.
+_SUSTAINABILITY_PAYOUT_THRESHOLDS = np.array([0.40, 0.60, 0.80, 1.00])
+_SUSTAINABILITY_PAYOUT_POINTS = np.array([30, 25, 15, 5, 0])
+_SUSTAINABILITY_FCF_THRESHOLDS = -np.array([2.5, 2.0, 1.5, 1.2])
+_SUSTAINABILITY_FCF_POINTS = np.array([30, 25, 20, 10, 0])
+_SUSTAINABILITY_DSCR_THRESHOLDS = -np.array([3.0, 2.5, 2.0, 1.5])
+_SUSTAINABILITY_DSCR_POINTS = np.array([25, 20, 15, 10, 0])
+_SUSTAINABILITY_VOLATILITY_THRESHOLDS = np.array([0.15, 0.25, 0.35, 0.50])
+_SUSTAINABILITY_VOLATILITY_POINTS = np.array([15, 12, 8, 4, 0])
+
+
+@_kernel
+def score_sustainability(payout_ratio, fcf_coverage, debt_service_coverage, earnings_volatility):
+    """Composite sustainability score (0-100): payout 30, FCF coverage 30, debt service 25, earnings stability 15"""
+    return (
+        _SUSTAINABILITY_PAYOUT_POINTS[np.searchsorted(_SUSTAINABILITY_PAYOUT_THRESHOLDS, payout_ratio, side='right')]
+        + _SUSTAINABILITY_FCF_POINTS[np.searchsorted(_SUSTAINABILITY_FCF_THRESHOLDS, -fcf_coverage, side='right')]
+        + _SUSTAINABILITY_DSCR_POINTS[np.searchsorted(_SUSTAINABILITY_DSCR_THRESHOLDS, -debt_service_coverage, side='right')]
+        + _SUSTAINABILITY_VOLATILITY_POINTS[np.searchsorted(_SUSTAINABILITY_VOLATILITY_THRESHOLDS, earnings_volatility, side='right')]
+    )
+
+
+@_kernel
+def score_consistency(annual_values, n_dividends):
+    """Share of years with maintained or increased dividends (0-20 points)"""
+    if n_dividends < 8:
+        return 0.0
+    n_years = annual_values.shape[0]
+    if n_years < 3:
+        return 0.0
+
+    consistent_years = 0
+    for i in range(1, n_years):
+        if annual_values[i] >= annual_values[i - 1]:
+            consistent_years += 1
+
+    return consistent_years / (n_years - 1) * 20
+
+
+@_kernel
+def score_growth(annual_values):
+    """Score the up-to-5-year dividend CAGR, optimal at 5-15% (0-20 points)"""
+    n_years = annual_values.shape[0]
+    if n_years < 3:
+        return 0.0
+
+    period = min(5, n_years - 1)
+    start_div = annual_values[0]
+    end_div = annual_values[period]
+    if start_div <= 0:
+        return 0.0
+
+    cagr = (end_div / start_div) ** (1.0 / period) - 1
+
+    if 0.05 <= cagr <= 0.15:
+        return 20.0
+    elif 0.03 <= cagr < 0.05 or 0.15 < cagr <= 0.20:
+        return 15.0
+    elif 0.01 <= cagr < 0.03 or 0.20 < cagr <= 0.25:
+        return 10.0
+    elif 0 <= cagr < 0.01:
+        return 5.0
+    return 0.0
+
+
+@_kernel
+def score_coverage(eps_coverage, fcf_coverage):
+    """Weighted EPS (60%) and FCF (40%) coverage score (0-20 points)"""
+    eps_score = min(eps_coverage / 2.5 * 12, 12.0)  # Optimal at 2.5x coverage
+    fcf_score = min(fcf_coverage / 2.0 * 8, 8.0)    # Optimal at 2.0x coverage
+    return eps_score + fcf_score
+
+
+@_kernel
+def score_yield_quality(period_totals):
+    """Score stability of trailing dividend totals (0-15 points)"""
+    n = period_totals.shape[0]
+    if n < 3:
+        return 0.0
+
+    avg = 0.0
+    for i in range(n):
+        avg += period_totals[i]
+    avg /= n
+    if avg <= 0:
+        return 0.0
+
+    sq = 0.0
+    for i in range(n):
+        sq += (period_totals[i] - avg) ** 2
+    volatility = (sq / (n - 1)) ** 0.5 / avg
+
+    if volatility < 0.1:
+        return 15.0
+    elif volatility < 0.2:
+        return 12.0
+    elif volatility < 0.3:
+        return 8.0
+    elif volatility < 0.5:
+        return 5.0
+    return 0.0
+
+
+@_kernel
+def score_financial_strength(roe, debt_ratio, current_ratio):
+    """ROE, leverage and liquidity score (0-20 points)"""
+    score = 0
+
+    # ROE scoring (8 points)
+    if roe > 0.20:
+        score += 8
+    elif roe > 0.15:
+        score += 6
+    elif roe > 0.10:
+        score += 4
+    elif roe > 0.05:
+        score += 2
+
+    # Debt-to-equity scoring (6 points)
+    if debt_ratio < 0.25:
+        score += 6
+    elif debt_ratio < 0.50:
+        score += 4
+    elif debt_ratio < 0.75:
+        score += 2
+
+    # Current ratio scoring (6 points)
+    if current_ratio > 2.0:
+        score += 6
+    elif current_ratio > 1.5:
+        score += 4
+    elif current_ratio > 1.0:
+        score += 2
+
+    return score
+
+
+@_kernel
+def score_quality(annual_values, n_dividends, eps_coverage, fcf_coverage,
+                  period_totals, roe, debt_ratio, current_ratio):
+    """Raw quality components: consistency, growth, coverage, yield quality, financial strength"""
+    components = np.empty(5, dtype=np.float64)
+    components[0] = score_consistency(annual_values, n_dividends)
+    components[1] = score_growth(annual_values)
+    components[2] = score_coverage(eps_coverage, fcf_coverage)
+    components[3] = score_yield_quality(period_totals)
+    components[4] = score_financial_strength(roe, debt_ratio, current_ratio)
+    return components
+
+
+@_kernel
+def percentile_rank(value, values):
+    """Percentage of ``values`` strictly below ``value`` (50 for an empty array)"""
+    n = values.shape[0]
+    if n == 0:
+        return 50.0
+
+    below = 0
+    for i in range(n):
+        if values[i] < value:
+            below += 1
+    return below / n * 100
+
+
+@_kernel
+def coef_of_variation(values):
+    """Sample standard deviation over the mean; 1.0 when the mean is not positive"""
+    n = values.shape[0]
+    if n < 2:
+        return 0.0
+
+    avg = 0.0
+    for i in range(n):
+        avg += values[i]
+    avg /= n
+    if avg <= 0:
+        return 1.0
+
+    sq = 0.0
+    for i in range(n):
+        sq += (values[i] - avg) ** 2
+    return (sq / (n - 1)) ** 0.5 / avg
+
+
+@_kernel
+def cagr(start_value, end_value, periods):
+    """Compound annual growth rate; 0 for a non-positive start or period"""
+    if start_value <= 0 or periods <= 0:
+        return 0.0
+    return (end_value / start_value) ** (1.0 / periods) - 1
+
+
+@_kernel
+def growth_rates(amounts):
+    """Period-over-period growth of a newest-first series, skipping non-positive bases"""
+    n = amounts.shape[0]
+    rates = np.empty(max(n - 1, 0), dtype=np.float64)
+    count = 0
+    for i in range(n - 1):
+        previous = amounts[i + 1]
+        if previous > 0:
+            rates[count] = (amounts[i] - previous) / previous
+            count += 1
+    return rates[:count]
+
+
+@_kernel
+def growth_summary(amounts):
+    """
+    Period-over-period growth (%) of an oldest-first series, skipping non-positive bases.
+    Returns (count, mean, sample standard deviation, positive count, first rate); the
+    deviation is 0 below two rates and everything is 0 when there are none.
+    """
+    n = amounts.shape[0]
+    rates = np.empty(max(n - 1, 0), dtype=np.float64)
+    count = 0
+    for i in range(1, n):
+        previous = amounts[i - 1]
+        if previous > 0:
+            rates[count] = ((amounts[i] - previous) / previous) * 100
+            count += 1
+    if count == 0:
+        return 0, 0.0, 0.0, 0, 0.0
+
+    total = 0.0
+    positives = 0
+    for i in range(count):
+        total += rates[i]
+        if rates[i] > 0:
+            positives += 1
+    mean = total / count
+
+    std = 0.0
+    if count > 1:
+        sq = 0.0
+        for i in range(count):
+            sq += (rates[i] - mean) ** 2
+        std = (sq / (count - 1)) ** 0.5
+    return count, mean, std, positives, rates[0]
+
+
+@_kernel
+def growth_rate_std(amounts):
+    """
+    Sample standard deviation of period-over-period growth for a newest-first
+    series, skipping non-positive bases; single Welford pass, NaN below two rates.
+    """
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    for i in range(amounts.shape[0] - 1):
+        previous = amounts[i + 1]
+        if previous > 0:
+            rate = (amounts[i] - previous) / previous
+            count += 1
+            delta = rate - mean
+            mean += delta / count
+            m2 += delta * (rate - mean)
+    if count < 2:
+        return np.nan
+    return (m2 / (count - 1)) ** 0.5
+
+
+@_kernel
+def pearson(x, y):
+    """
+    Pearson correlation of two equal-length arrays in a single Welford pass;
+    0 when either side is constant, too short or contains NaN.
+    """
+    n = x.shape[0]
+    if n < 2:
+        return 0.0
+
+    mx = 0.0
+    my = 0.0
+    sxx = 0.0
+    syy = 0.0
+    sxy = 0.0
+    for i in range(n):
+        if np.isnan(x[i]) or np.isnan(y[i]):
+            return 0.0
+        dx = x[i] - mx
+        mx += dx / (i + 1)
+        dy = y[i] - my
+        my += dy / (i + 1)
+        sxx += dx * (x[i] - mx)
+        syy += dy * (y[i] - my)
+        sxy += dx * (y[i] - my)
+
+    denom = (sxx * syy) ** 0.5
+    # ``not denom > 0`` also catches a NaN from non-finite inputs, which the clamp below would hide
+    if not denom > 0:
+        return 0.0
+    return max(-1.0, min(1.0, sxy / denom))
+
+
+@_kernel
+def merge_consensus(ordinals, amounts):
+    """
+    Cross-source consensus for dividend rows sorted (stably) by ex-date ordinal.
+    Returns (group starts with a trailing end offset, consensus amount, confidence,
+    sample standard deviation) per ex-date group. One row: taken as is (0.8);
+    two rows within 1% of the larger: their mean (0.95), otherwise the first (0.7);
+    three or more: the median (0.98). The deviation is 0 for a single row.
+    """
+    n = ordinals.shape[0]
+    starts = np.empty(n + 1, dtype=np.int64)
+    groups = 0
+    for i in range(n):
+        if i == 0 or ordinals[i] != ordinals[i - 1]:
+            starts[groups] = i
+            groups += 1
+    starts[groups] = n
+
+    consensus = np.empty(groups, dtype=np.float64)
+    confidence = np.empty(groups, dtype=np.float64)
+    deviation = np.zeros(groups, dtype=np.float64)
+    for g in range(groups):
+        lo = starts[g]
+        hi = starts[g + 1]
+        count = hi - lo
+        first = amounts[lo]
+        # One, two and three sources (the usual cases) use closed forms
+        if count == 1:
+            consensus[g] = first
+            confidence[g] = 0.8
+        elif count == 2:
+            second = amounts[lo + 1]
+            largest = max(first, second)
+            agrees = largest != 0 and abs(first - second) / largest < 0.01
+            consensus[g] = (first + second) * 0.5 if agrees else first
+            confidence[g] = 0.95 if agrees else 0.7
+            deviation[g] = abs(first - second) * 0.5 ** 0.5
+        elif count == 3:
+            second = amounts[lo + 1]
+            third = amounts[lo + 2]
+            total = first + second + third
+            mean = total / 3
+            consensus[g] = total - min(first, second, third) - max(first, second, third)
+            confidence[g] = 0.98
+            deviation[g] = (((first - mean) ** 2 + (second - mean) ** 2 + (third - mean) ** 2) * 0.5) ** 0.5
+        else:
+            # A provider listing the same date twice: general median and deviation
+            total = 0.0
+            for i in range(lo, hi):
+                total += amounts[i]
+            mean = total / count
+            sq = 0.0
+            for i in range(lo, hi):
+                sq += (amounts[i] - mean) ** 2
+            deviation[g] = (sq / (count - 1)) ** 0.5
+            ordered = np.sort(amounts[lo:hi])
+            middle = count // 2
+            consensus[g] = ordered[middle] if count % 2 else (ordered[middle - 1] + ordered[middle]) / 2
+            confidence[g] = 0.98
+    return starts[:groups + 1], consensus, confidence, deviation
+
+
+@_kernel
+def increase_streak(values, threshold):
+    """Consecutive increases of more than ``threshold`` at the head of a newest-first series"""
+    streak = 0
+    for i in range(values.shape[0] - 1):
+        if values[i] > values[i + 1] + threshold:
+            streak += 1
+        else:
+            break
+    return streak
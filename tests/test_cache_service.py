@@ -0,0 +1,40 @@
+import pytest
+from unittest.mock import patch
+
+from app.services.cache_service import LocalTTLCache
+
+
+class TestLocalTTLCache:
+    """Test suite for the in-process TTL cache"""
+
+    @pytest.fixture
+    def cache(self):
+        """Create a small cache for testing"""
+        return LocalTTLCache(maxsize=2, ttl=60)
+
+    def test_get_set(self, cache):
+        """Stored values are returned until they expire"""
+        cache.set('AAPL', {'sector': 'Technology'})
+        assert cache.get('AAPL') == {'sector': 'Technology'}
+        assert cache.get('MSFT') is None
+        assert cache.get('MSFT', {}) == {}
+
+    def test_expiry(self, cache):
+        """Entries are dropped once their TTL has elapsed"""
+        with patch('app.services.cache_service.time.monotonic', return_value=1000.0):
+            cache.set('AAPL', 1)
+        with patch('app.services.cache_service.time.monotonic', return_value=1059.0):
+            assert cache.get('AAPL') == 1
+        with patch('app.services.cache_service.time.monotonic', return_value=1061.0):
+            assert cache.get('AAPL') is None
+        assert len(cache) == 0
+
+    def test_evicts_oldest_when_full(self, cache):
+        """Inserting beyond maxsize evicts the oldest entry"""
+        cache.set('A', 1)
+        cache.set('B', 2)
+        cache.set('C', 3)
+        assert len(cache) == 2
+        assert cache.get('A') is None
+        assert cache.get('B') == 2
+        assert cache.get('C') == 3
@@ -0,0 +1,141 @@
+import pytest
+import numpy as np
+
+from app.utils import calculations
+
+
+class TestScoringKernels:
+    """Test suite for the dividend scoring kernels"""
+
+    @pytest.fixture
+    def growing_annuals(self):
+        """Annual dividend totals growing ~8% per year"""
+        return np.array([1.00, 1.08, 1.17, 1.26, 1.36, 1.47], dtype=np.float64)
+
+    def test_score_sustainability_bounds(self):
+        """Best and worst inputs hit the ends of the 0-100 scale"""
+        assert calculations.score_sustainability(0.30, 3.0, 4.0, 0.10) == 100
+        assert calculations.score_sustainability(1.20, 1.0, 1.0, 0.60) == 0
+
+    def test_score_sustainability_tiers(self):
+        """Each ratio lands in its expected tier"""
+        # 25 (payout) + 20 (fcf) + 15 (debt) + 8 (volatility)
+        assert calculations.score_sustainability(0.50, 1.8, 2.2, 0.30) == 68
+
+    def test_score_sustainability_band_edges(self):
+        """Payout and volatility bands are strict <, coverage bands strict >; NaN ratios score 0"""
+        # 25 (payout at 0.40) + 25 (fcf at 2.5) + 20 (debt at 3.0) + 12 (volatility at 0.15)
+        assert calculations.score_sustainability(0.40, 2.5, 3.0, 0.15) == 82
+        assert calculations.score_sustainability(0.30, np.nan, np.nan, 0.10) == 45
+        assert calculations.score_sustainability(np.nan, 3.0, 4.0, np.nan) == 55
+
+    def test_score_consistency(self, growing_annuals):
+        """Consistency needs 8+ payments and rewards non-decreasing years"""
+        assert calculations.score_consistency(growing_annuals, 7) == 0
+        assert calculations.score_consistency(growing_annuals, 24) == pytest.approx(20.0)
+
+        mixed = np.array([1.0, 0.9, 1.0, 1.1, 1.0], dtype=np.float64)
+        assert calculations.score_consistency(mixed, 20) == pytest.approx(10.0)
+
+    def test_score_growth(self, growing_annuals):
+        """Optimal 5-15% CAGR earns full points"""
+        assert calculations.score_growth(growing_annuals) == 20
+        assert calculations.score_growth(growing_annuals[:2]) == 0
+        assert calculations.score_growth(np.zeros(4)) == 0
+
+    def test_score_yield_quality(self):
+        """Stable trailing totals score higher than volatile ones"""
+        stable = np.array([2.00, 2.04, 2.08])
+        volatile = np.array([1.0, 2.0, 3.0])
+        assert calculations.score_yield_quality(stable) == 15
+        assert calculations.score_yield_quality(volatile) == 0
+        assert calculations.score_yield_quality(np.empty(0)) == 0
+
+    def test_score_quality_components(self, growing_annuals):
+        """Fused kernel matches the individual component kernels"""
+        totals = np.array([2.00, 2.04, 2.08])
+        components = calculations.score_quality(growing_annuals, 24, 2.0, 1.5, totals, 0.18, 0.4, 1.6)
+
+        assert components.shape == (5,)
+        assert components[0] == pytest.approx(calculations.score_consistency(growing_annuals, 24))
+        assert components[1] == pytest.approx(calculations.score_growth(growing_annuals))
+        assert components[2] == pytest.approx(calculations.score_coverage(2.0, 1.5))
+        assert components[3] == pytest.approx(calculations.score_yield_quality(totals))
+        assert components[4] == calculations.score_financial_strength(0.18, 0.4, 1.6) == 14
+
+    def test_percentile_and_variation(self):
+        """Percentile rank counts values strictly below; CV uses the sample deviation"""
+        values = np.array([3.0, 1.0, 2.0, 4.0])
+        assert calculations.percentile_rank(2.5, values) == 50.0
+        assert calculations.percentile_rank(1.0, values) == 0.0
+        assert calculations.percentile_rank(1.0, np.empty(0)) == 50.0
+
+        assert calculations.coef_of_variation(values) == pytest.approx(np.std(values, ddof=1) / 2.5)
+        assert calculations.coef_of_variation(np.array([-1.0, 0.5, 0.0])) == 1.0
+
+    def test_growth_rates_and_cagr(self):
+        """Growth rates skip non-positive bases; CAGR guards its inputs"""
+        rates = calculations.growth_rates(np.array([1.21, 1.1, 0.0, 1.0]))
+        assert rates.tolist() == pytest.approx([0.1, -1.0])
+        assert calculations.growth_rates(np.array([1.0])).size == 0
+
+        assert calculations.cagr(1.0, 1.21, 2) == pytest.approx(0.1)
+        assert calculations.cagr(0.0, 1.21, 2) == 0.0
+
+    def test_growth_rate_std_and_increase_streak(self):
+        """Welford growth deviation matches numpy; the streak stops at the first non-increase"""
+        amounts = np.array([1.3, 1.2, 1.0, 0.0, 1.1, 0.9])
+        rates = calculations.growth_rates(amounts)
+        assert calculations.growth_rate_std(amounts) == pytest.approx(np.std(rates, ddof=1))
+        assert np.isnan(calculations.growth_rate_std(np.array([1.1, 1.0])))
+
+        assert calculations.increase_streak(np.array([1.3, 1.2, 1.1, 1.1]), 0.0) == 2
+        assert calculations.increase_streak(np.array([1.30005, 1.3, 1.2]), 0.0001) == 0
+        assert calculations.increase_streak(np.empty(0), 0.0) == 0
+
+    def test_pearson(self):
+        """Single-pass correlation matches numpy and degrades to 0"""
+        rng = np.random.default_rng(7)
+        x = rng.normal(size=50)
+        y = 0.5 * x + rng.normal(size=50)
+        assert calculations.pearson(x, y) == pytest.approx(np.corrcoef(x, y)[0, 1])
+        assert calculations.pearson(x, x) == pytest.approx(1.0)
+
+        assert calculations.pearson(x, np.ones(50)) == 0.0
+        x[3] = np.nan
+        assert calculations.pearson(x, y) == 0.0
+        assert calculations.pearson(y, np.full(50, np.inf)) == 0.0
+
+    def test_growth_summary(self):
+        """One-pass growth summary matches the array statistics and skips zero bases"""
+        amounts = np.array([1.0, 1.1, 0.0, 0.5, 0.55, 0.5])
+        rates = np.array([10.0, -100.0, 10.0, -100 / 11])
+        count, mean, std, positives, first = calculations.growth_summary(amounts)
+
+        assert count == 4 and positives == 2
+        assert mean == pytest.approx(rates.mean())
+        assert std == pytest.approx(np.std(rates, ddof=1))
+        assert first == pytest.approx(10.0)
+        assert calculations.growth_summary(np.array([0.0, 1.0])) == (0, 0.0, 0.0, 0, 0.0)
+
+    def test_merge_consensus(self):
+        """Per-date consensus follows the row count; groups come back in ordinal order"""
+        ordinals = np.array([10, 10, 20, 30, 30, 30], dtype=np.int64)
+        amounts = np.array([0.25, 0.24, 0.50, 0.25, 0.251, 0.26])
+        starts, consensus, confidence, deviation = calculations.merge_consensus(ordinals, amounts)
+
+        assert starts.tolist() == [0, 2, 3, 6]
+        # Two rows more than 1% apart keep the first; one row is taken as is; three take the median
+        assert consensus.tolist() == pytest.approx([0.25, 0.50, 0.251])
+        assert confidence.tolist() == [0.7, 0.8, 0.98]
+        assert deviation.tolist() == pytest.approx([np.std([0.25, 0.24], ddof=1), 0.0, np.std([0.25, 0.251, 0.26], ddof=1)])
+
+        starts, consensus, confidence, _ = calculations.merge_consensus(np.array([5, 5], dtype=np.int64), np.array([1.0, 1.005]))
+        assert consensus.tolist() == pytest.approx([1.0025]) and confidence.tolist() == [0.95]
+        assert calculations.merge_consensus(np.empty(0, dtype=np.int64), np.empty(0))[0].tolist() == [0]
+
+        # Four rows (a duplicated source) fall back to the general median and deviation
+        four = np.array([1.0, 4.0, 2.0, 3.0])
+        _, consensus, confidence, deviation = calculations.merge_consensus(np.zeros(4, dtype=np.int64), four)
+        assert consensus.tolist() == [2.5] and confidence.tolist() == [0.98]
+        assert deviation.tolist() == pytest.approx([np.std(four, ddof=1)])
@@ -91,6 +91,8 @@ class TestDataProvider:
         assert data_provider._safe_float('') is None
         assert data_provider._safe_float('N/A') is None
         assert data_provider._safe_float('invalid') is None
+        assert data_provider._safe_float(42) == 42.0
+        assert data_provider._safe_float(float('nan')) is None
     
     @pytest.mark.asyncio
     async def test_parse_date(self, data_provider):
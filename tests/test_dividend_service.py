@@ -0,0 +1,727 @@
+import asyncio
+import json
+import pytest
+import numpy as np
+import pandas as pd
+from datetime import date, datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import patch, AsyncMock
+
+from app.services import dividend_service as dividend_service_module
+from app.services.dividend_service import DividendService, DividendHistory
+from app.utils.exceptions import TickerNotFoundError
+
+
+class _FakeResponse:
+    """Minimal aiohttp response returning one FRED observation per series"""
+
+    def __init__(self, series_id):
+        self.status = 200 if series_id != 'VIXCLS' else 500
+        self.series_id = series_id
+
+    async def json(self, loads=json.loads):
+        value = '.' if self.series_id == 'UNRATE' else '4.2'
+        return loads(json.dumps({'observations': [{'value': value, 'date': '2024-01-01'}]}))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+
+class _FakeSession:
+    """Minimal aiohttp session that counts how many sessions are opened"""
+    opened = 0
+    closed = False
+
+    def __init__(self, *args, **kwargs):
+        _FakeSession.opened += 1
+
+    async def close(self):
+        self.closed = True
+
+    def get(self, url, params=None):
+        return _FakeResponse(params['series_id'])
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+
+class TestDividendService:
+    """Test suite for DividendService analytics helpers"""
+
+    @pytest.fixture
+    def service(self):
+        """Create DividendService instance for testing"""
+        return DividendService()
+
+    @pytest.fixture
+    def quarterly_dividends(self):
+        """Five years of quarterly dividends, newest first"""
+        dividends = []
+        amount = 0.20
+        for year in range(2019, 2024):
+            for month in (2, 5, 8, 11):
+                dividends.append({'ex_date': date(year, month, 10), 'amount': round(amount, 4)})
+            amount *= 1.07
+        return sorted(dividends, key=lambda d: d['ex_date'], reverse=True)
+
+    def test_cross_validate_consensus(self, service):
+        """Consensus amount and confidence follow the number of agreeing sources"""
+        yf_data = [
+            {'ex_date': date(2023, 2, 10), 'amount': 0.25},
+            {'ex_date': date(2023, 5, 10), 'amount': 0.25},
+            {'ex_date': date(2023, 8, 10), 'amount': 0.25},
+        ]
+        av_data = [
+            {'ex_date': date(2023, 5, 10), 'amount': 0.251},
+            {'ex_date': date(2023, 8, 10), 'amount': 0.30},
+        ]
+        fmp_data = [
+            {'ex_date': date(2023, 2, 10), 'amount': 0.24},
+            {'ex_date': date(2023, 5, 10), 'amount': 0.26},
+            {'ex_date': date(2022, 1, 10), 'amount': 0.20},  # outside range
+        ]
+
+        merged = service._cross_validate_and_merge_dividends(
+            yf_data, av_data, fmp_data, date(2023, 1, 1), date(2023, 12, 31)
+        )
+        by_date = {d['ex_date']: d for d in merged}
+
+        assert [d['ex_date'] for d in merged] == [date(2023, 2, 10), date(2023, 5, 10), date(2023, 8, 10)]
+
+        # Two sources more than 1% apart: keep the first source
+        assert by_date[date(2023, 2, 10)]['amount'] == 0.25
+        assert by_date[date(2023, 2, 10)]['confidence_score'] == 0.7
+
+        # Three sources: median
+        assert by_date[date(2023, 5, 10)]['amount'] == 0.251
+        assert by_date[date(2023, 5, 10)]['confidence_score'] == 0.98
+        assert by_date[date(2023, 5, 10)]['source_agreement'] == 3
+        assert by_date[date(2023, 5, 10)]['amount_variance'] == pytest.approx(0.0055075705, rel=1e-6)
+
+        # Agreeing sources are listed in provider priority order
+        assert by_date[date(2023, 8, 10)]['data_sources'] == ['yahoo_finance', 'alpha_vantage']
+        assert by_date[date(2023, 5, 10)]['data_sources'] == ['yahoo_finance', 'alpha_vantage', 'fmp']
+
+    def test_cross_validate_single_source(self, service):
+        """A lone source is accepted with baseline confidence"""
+        merged = service._cross_validate_and_merge_dividends(
+            [{'ex_date': date(2023, 2, 10), 'amount': 0.25}], [], [], date(2023, 1, 1), date(2023, 12, 31)
+        )
+
+        assert merged[0]['amount'] == 0.25
+        assert merged[0]['confidence_score'] == 0.8
+        assert merged[0]['amount_variance'] == 0
+        assert service._cross_validate_and_merge_dividends([], [], [], date(2023, 1, 1), date(2023, 12, 31)) == []
+
+    def test_aggregate_annual_dividends(self, service, quarterly_dividends):
+        """Annual totals sum every payment in the year"""
+        annual = service._aggregate_annual_dividends(quarterly_dividends)
+
+        assert sorted(annual) == [2019, 2020, 2021, 2022, 2023]
+        assert annual[2019] == pytest.approx(0.80)
+        assert annual.years_asc == (2019, 2020, 2021, 2022, 2023)
+        assert annual.years_desc == (2023, 2022, 2021, 2020, 2019)
+        assert annual.values_asc[0] == pytest.approx(0.80)
+
+        from_series = service._aggregate_annual_dividends(DividendHistory(quarterly_dividends))
+        assert from_series.years_asc == annual.years_asc
+
+    def test_dividend_history_series(self, service, quarterly_dividends):
+        """Array-backed history matches the list-of-dicts results"""
+        history = DividendHistory(quarterly_dividends)
+
+        assert history.series.amounts.shape == (20,)
+        assert history.series.confidence.tolist() == [0.5] * 20
+        assert history.series.years[0] == 2023
+        assert service._ttm_dividend(history) == pytest.approx(service._ttm_dividend(list(quarterly_dividends)))
+        assert service._aggregate_annual_dividends(history) == pytest.approx(
+            service._aggregate_annual_dividends(list(quarterly_dividends))
+        )
+        assert list(service._aggregate_annual_dividends(history)) == [2023, 2022, 2021, 2020, 2019]
+
+    def test_ttm_window_by_date(self, service, quarterly_dividends):
+        """TTM sums the payments in the year up to the latest ex-date, whatever the payment frequency"""
+        monthly = [{'ex_date': date(2024, month, 1), 'amount': 0.1} for month in range(12, 0, -1)]
+        semi_annual = [{'ex_date': date(year, month, 15), 'amount': 0.5} for year in (2024, 2023) for month in (9, 3)]
+
+        assert service._ttm_dividend(monthly) == pytest.approx(1.2)
+        assert service._ttm_dividend(DividendHistory(semi_annual)) == pytest.approx(1.0)
+        assert service._ttm_dividend(quarterly_dividends) == pytest.approx(sum(d['amount'] for d in quarterly_dividends[:4]))
+        assert service._ttm_dividend([]) == 0.0
+
+        # The history sums its TTM once; quality scoring and the coverage ratios share it
+        history = DividendHistory(quarterly_dividends)
+        with patch.object(dividend_service_module.DividendSeries, 'ttm', return_value=0.9) as ttm:
+            assert service._ttm_dividend(history) == 0.9
+            assert service._compute_all_score_components(history)['ttm'] == 0.9
+        ttm.assert_called_once()
+
+    def test_payment_frequency(self, service, quarterly_dividends):
+        """Frequency is inferred from the average gap between ex-dates"""
+        assert service._determine_payment_frequency(quarterly_dividends) == 'Quarterly'
+        assert service._determine_payment_frequency(quarterly_dividends[:1]) == 'Unknown'
+        assert service._infer_frequency(30) == ('Monthly', 12)
+        assert service._infer_frequency(250) == ('Irregular', 4)
+        assert service._payment_gaps(quarterly_dividends, 2).tolist() == [92, 92]
+
+    @pytest.mark.asyncio
+    async def test_multi_source_drops_slow_provider(self, service, quarterly_dividends):
+        """A provider past its deadline is treated like a failed one and the others still merge"""
+        async def slow_fmp(ticker):
+            await asyncio.sleep(1)
+            return quarterly_dividends
+
+        with patch.object(dividend_service_module, 'DIVIDEND_PROVIDER_TIMEOUT', 0.05), \
+                patch.object(service, '_get_yfinance_dividends', AsyncMock(return_value=quarterly_dividends)), \
+                patch.object(service, '_get_alpha_vantage_dividends', AsyncMock(return_value=[])), \
+                patch.object(service, '_get_fmp_dividends', side_effect=slow_fmp):
+            merged = await service._fetch_multi_source_dividends('AAA', date(2019, 1, 1), date(2023, 12, 31))
+
+        assert len(merged) == len(quarterly_dividends)
+        assert merged[0]['ex_date'] == quarterly_dividends[0]['ex_date']
+
+    def test_annual_growth_rates_shared(self, service, quarterly_dividends):
+        """Annual totals cache their value array and YoY growth for every helper"""
+        history = DividendHistory(quarterly_dividends)
+        annual = history.annual_totals
+
+        assert annual.values_asc is annual.values_asc
+        assert annual.growth_rates is annual.growth_rates
+        assert annual.growth_rates.tolist() == pytest.approx([0.07] * 4, abs=1e-3)
+        with pytest.raises(ValueError):
+            annual.values_asc[0] = 0.0
+
+        growth = service._calculate_growth_analytics(history)
+        assert growth['average_annual_growth'] == pytest.approx(7.0, abs=0.1)
+        assert growth['growth_consistency'] == 100.0
+        assert list(growth['cagr_analysis']) == ['3y_cagr', '5y_cagr']
+        assert growth['cagr_analysis']['5y_cagr'] == pytest.approx((1.07 ** (4 / 5) - 1) * 100, abs=0.05)
+
+        patterns = service._analyze_dividend_growth_patterns(history)
+        assert patterns['cagr_analysis'] == growth['cagr_analysis']
+        assert patterns['positive_growth_years'] == patterns['total_years'] == 4
+
+    def test_quarterly_growth_for_new_payers(self, service):
+        """Quarter-over-quarter growth skips zero bases and reads the oldest-first amounts"""
+        dividends = [
+            {'ex_date': date(2024, 8, 10), 'amount': 0.22},
+            {'ex_date': date(2024, 2, 10), 'amount': 0.0},
+            {'ex_date': date(2024, 5, 10), 'amount': 0.20},
+            {'ex_date': date(2023, 11, 10), 'amount': 0.20},
+        ]
+        growth = service._calculate_quarterly_growth_for_new_payers(dividends)
+
+        # 0.20 -> 0.00 (-100%), skip the zero base, 0.20 -> 0.22 (+10%)
+        assert growth['volatility'] == pytest.approx(np.std([-100.0, 10.0], ddof=1), abs=0.01)
+        assert growth['consistency'] == 50.0
+        assert growth['trend'] == 'Declining'
+        assert growth['cagr_analysis']['quarterly_cagr'] == pytest.approx(((0.22 / 0.20) ** (1 / 3) - 1) * 100, abs=0.01)
+        assert service._calculate_quarterly_growth_for_new_payers(DividendHistory(dividends)) == growth
+
+        history = DividendHistory(dividends + [{'ex_date': date(2024, 8, 10), 'amount': 0.25}])
+        assert service._amounts_oldest_first(history).tolist() == [0.20, 0.0, 0.20, 0.22, 0.25]
+        assert service._amounts_oldest_first(history).tolist() == service._amounts_oldest_first(list(history)).tolist()
+
+    def test_per_share_coverage_share_count(self, service, quarterly_dividends):
+        """FCF and EBITDA coverage derive the share count the same way"""
+        assert service._shares_outstanding({'shares_outstanding': 5e8}) == 5e8
+        assert service._shares_outstanding({'market_cap': 1e10, 'current_price': 50.0}) == 2e8
+        assert service._shares_outstanding({'market_cap': 1e10}) == 1_000_000_000
+        # Net-income coverage never assumes a share count; unreported (None) fields are skipped
+        assert service._shares_outstanding({'market_cap': 1e10, 'current_price': 50.0}, default=0.0) == 2e8
+        assert service._shares_outstanding({'shares_outstanding': None, 'market_cap': None}, default=0.0) == 0.0
+
+        financials = {'free_cash_flow': 4e8, 'ebitda': 8e8, 'market_cap': 1e10, 'current_price': 50.0}
+        assert service._calculate_fcf_coverage_ratio(quarterly_dividends, financials, ttm=1.0) == pytest.approx(2.0)
+        assert service._calculate_ebitda_coverage_ratio(quarterly_dividends, financials, ttm=1.0) == pytest.approx(4.0)
+
+    def test_legacy_rating_tables(self, service):
+        """Table-driven legacy ratings keep each band's inclusive/exclusive edge"""
+        risk = service._assess_dividend_risk(
+            {'payout_ratio': 80, 'debt_to_equity_ratio': 2.5, 'interest_coverage_ratio': 2.0}, {}, {}
+        )
+        assert risk['dividend_risk_score'] == 1.0 + 2.5 + 1.0
+        assert risk['risk_rating'] == 'MODERATE'
+        assert risk['risk_factors'] == [
+            "Moderate payout ratio (>60%)", "Very high debt-to-equity ratio", "Moderate interest coverage concern"
+        ]
+        assert service._assess_dividend_risk({}, {}, {})['risk_factors'] == []
+
+        assert service._get_sustainability_rating(3.0, {}) == 'GOOD'
+        assert service._get_investment_recommendation(50) == 'Weak Hold'
+        assert service._assess_coverage_adequacy(3.0, 1.5) == 'Adequate Coverage'
+        assert service._assess_yield_attractiveness(5.0, 50) == 'Moderate'
+        assert service._assess_yield_attractiveness(5.0, 71) == 'Very Attractive'
+
+    def test_compute_all_score_components(self, service, quarterly_dividends):
+        """Fused aggregation agrees for plain lists and array-backed histories"""
+        plain = service._compute_all_score_components(list(quarterly_dividends))
+        fast = service._compute_all_score_components(DividendHistory(quarterly_dividends))
+
+        assert plain['n_dividends'] == fast['n_dividends'] == 20
+        assert plain['ttm'] == pytest.approx(fast['ttm'])
+        assert plain['annual_values'] == pytest.approx(fast['annual_values'])
+        assert plain['annual_values'] == pytest.approx(service._annual_values(quarterly_dividends))
+        assert plain['period_totals'] == pytest.approx(service._yield_period_totals(quarterly_dividends))
+
+    def test_zero_earnings_short_circuit(self, service, quarterly_dividends):
+        """Non-positive EPS and FCF zero the earnings-based ratios without erroring"""
+        financials = {'eps': 0, 'free_cash_flow': -1e8, 'roe': 0.05, 'ebitda': 1e9, 'total_debt': 0}
+
+        sustainability = service._calculate_sustainability_metrics(quarterly_dividends, financials)
+        assert sustainability['key_ratios']['payout_ratio'] == 0
+        assert sustainability['key_ratios']['fcf_coverage_ratio'] == 0
+
+        quality = service._calculate_professional_quality_score(quarterly_dividends, financials)
+        assert quality['components']['coverage_score'] == 0
+
+        # Providers report missing EPS / FCF as None, which scores like zero
+        missing = {**financials, 'eps': None, 'free_cash_flow': None}
+        assert service._calculate_sustainability_metrics(quarterly_dividends, missing)['key_ratios'] == sustainability['key_ratios']
+        assert service._calculate_professional_quality_score(quarterly_dividends, missing) == quality
+
+    def test_score_results_serialise_at_boundary(self, service, quarterly_dividends):
+        """Scorers return slotted result objects that serialise to the API payload"""
+        financials = {'eps': 4.0, 'free_cash_flow': 5e9, 'shares_outstanding': 1e9, 'roe': 0.18}
+
+        quality = service._quality_score(quarterly_dividends, financials)
+        assert not hasattr(quality, '__dict__')
+        assert quality.to_dict() == service._calculate_professional_quality_score(quarterly_dividends, financials)
+        aggregates = service._compute_all_score_components(quarterly_dividends)
+        assert service._quality_score(quarterly_dividends, financials, aggregates=aggregates) == quality
+        assert service._quality_score([], financials).to_dict()['rating'] == 'No Dividend Data'
+
+        sustainability = service._sustainability_analysis(quarterly_dividends, financials)
+        assert sustainability.to_dict()['key_ratios']['payout_ratio'] == round(sustainability.payout_ratio, 3)
+        assert service._sustainability_analysis(quarterly_dividends, {}) is None
+        assert service._calculate_sustainability_metrics(quarterly_dividends, {})['sustainability_rating'] == 'Unknown'
+
+    def test_annual_totals_shared(self, service, quarterly_dividends):
+        """A dividend history aggregates by year once and the metric helpers reuse it"""
+        history = DividendHistory(quarterly_dividends)
+        annual = service._aggregate_annual_dividends(history)
+
+        assert service._aggregate_annual_dividends(history) is annual
+        assert service._calculate_growth_metrics(history, annual) == service._calculate_growth_metrics(quarterly_dividends)
+        assert service._calculate_consistency_metrics(history, annual) == \
+            service._calculate_consistency_metrics(quarterly_dividends)
+
+    def test_growth_metrics_and_forecast(self, service, quarterly_dividends):
+        """Growth rates cover the periods the history spans and feed the fallback forecast"""
+        growth = service._calculate_growth_metrics(quarterly_dividends)
+
+        assert sorted(growth) == ['dividend_growth_rate_1y', 'dividend_growth_rate_3y']
+        assert growth['dividend_growth_rate_1y'] == pytest.approx(7.0, abs=0.1)
+        assert growth['dividend_growth_rate_3y'] == pytest.approx(7.0, abs=0.1)
+
+        forecast = service._generate_traditional_forecast(quarterly_dividends, {}, {}, 3)
+        assert [row['year'] for row in forecast] == [2024, 2025, 2026]
+        assert forecast[0]['growth_rate'] == pytest.approx(7.0, abs=0.1)
+
+    def test_historical_yields_from_series(self, service, quarterly_dividends):
+        """Windowed yields and trailing totals match between list and array-backed histories"""
+        history = DividendHistory(quarterly_dividends)
+
+        assert history.series.window_totals(6).shape == (2,)
+        assert service._historical_yields(history, 50.0) == pytest.approx(
+            service._historical_yields(quarterly_dividends, 50.0)
+        )
+        assert len(service._historical_yields(history, 50.0)) == 5
+        assert service._historical_yields(history, 0).size == 0
+
+        yields = sorted(service._historical_yields(history, 50.0).tolist())
+        performance = service._calculate_performance_analytics(history, 50.0)
+        assert performance['historical_yield_range'] == pytest.approx(
+            {'min': yields[0], 'max': yields[-1], 'median': yields[len(yields) // 2]}, abs=0.005
+        )
+        assert service._calculate_performance_analytics(history, 0)['historical_yield_range']['median'] == 0
+        # Percentile rank binary-searches the sorted yields and counts only values strictly below
+        sorted_yields = np.array([1.0, 2.0, 2.0, 3.0])
+        assert service._calculate_percentile(2.0, sorted_yields) == 25.0
+        assert service._calculate_percentile(3.5, sorted_yields) == 100.0
+        assert service._calculate_percentile(2.0, np.empty(0)) == 50.0
+        assert history.series.total_since(date(2023, 6, 1)) == pytest.approx(
+            sum(d['amount'] for d in quarterly_dividends[:2])
+        )
+        assert history.series.total_since(date(2030, 1, 1)) is None
+
+    def test_risk_scores_batch(self, service):
+        """Risk bands keep their strict cut-offs at the boundaries"""
+        scores = service._calculate_dividend_risk_metrics_batch(
+            np.array([0.4, 0.41, 1.0, 1.2]),
+            np.array([3.0, 2.0, 1.0, 0.5]),
+            np.array([4.0, 4.5, 5.0, 6.5])
+        )
+        assert scores.tolist() == [0, 10 + 10 + 10, 30 + 30 + 10, 40 + 40 + 20]
+
+    def test_risk_analytics_batch(self, service):
+        """Risk analytics tiers score every ticker in one pass with strict cut-offs"""
+        scores = service._calculate_risk_analytics_batch(
+            np.array([0.2, 0.5, 1.0, 1.2]),
+            np.array([3.0, 2.4, 1.0, 0.5]),
+            np.array([2.0, 3.5, 5.5, 6.5]),
+            np.array([0.1, 0.3, 0.75, 2.0])
+        )
+        assert scores.tolist() == [0, 10 + 10 + 10 + 10, 20 + 20 + 20 + 15, 100]
+
+    def test_risk_metrics_rating(self, service, quarterly_dividends):
+        """Single-ticker risk metrics grade the batch score"""
+        financials = {'eps': 4.0, 'free_cash_flow': 5e9, 'shares_outstanding': 1e9}
+        risk = service._calculate_dividend_risk_metrics(quarterly_dividends, financials, {'treasury_10y': 4.5})
+
+        assert risk['risk_score'] == 10
+        assert risk['risk_rating'] == 'Very Low'
+
+    def test_coverage_ratios_computed_once(self, service, quarterly_dividends):
+        """Shared coverage ratios are reused by the sustainability, coverage and risk analytics"""
+        financials = {'eps': 4.0, 'free_cash_flow': 5e9, 'shares_outstanding': 1e9}
+        ratios = service._coverage_ratios(quarterly_dividends, financials)
+
+        assert ratios.payout_ratio == service._calculate_payout_ratio(quarterly_dividends, financials)
+        assert ratios.fcf_coverage == service._calculate_fcf_coverage_ratio(quarterly_dividends, financials)
+        assert service._coverage_ratios(quarterly_dividends, {'eps': None, 'free_cash_flow': -1}).payout_ratio == 0
+
+        with patch.object(service, '_calculate_payout_ratio') as payout, \
+                patch.object(service, '_calculate_fcf_coverage_ratio') as fcf:
+            service._calculate_sustainability_metrics(quarterly_dividends, financials, ratios=ratios)
+            service._calculate_coverage_analytics(quarterly_dividends, financials, ratios=ratios)
+            service._calculate_risk_analytics(quarterly_dividends, financials, 4.5, ratios=ratios)
+        payout.assert_not_called()
+        fcf.assert_not_called()
+
+        with patch.object(service, '_ttm_dividend') as ttm:
+            service._calculate_valuation_analytics(quarterly_dividends, 50.0, 4.5, ttm=ratios.ttm_dividend)
+            service._calculate_performance_analytics(quarterly_dividends, 50.0, ttm=ratios.ttm_dividend)
+            service._get_current_dividend_metrics(quarterly_dividends, 50.0, ttm=ratios.ttm_dividend)
+        ttm.assert_not_called()
+
+        history = DividendHistory(quarterly_dividends)
+        assert service._compute_all_score_components(history)['annual_values'] is history.annual_totals.values_asc
+
+    @pytest.mark.asyncio
+    async def test_comprehensive_analysis_cached(self, service, quarterly_dividends):
+        """Repeat requests for the same ticker and range are served without refetching"""
+        dividend_service_module._analysis_cache.clear()
+        fetch = AsyncMock(return_value=DividendHistory(quarterly_dividends))
+
+        with patch.object(service, '_fetch_multi_source_dividends', fetch), \
+                patch.object(service, '_fetch_comprehensive_financials', AsyncMock(return_value={'eps': 4.0})), \
+                patch.object(service, '_fetch_market_data', AsyncMock(return_value={'current_price': 50.0})), \
+                patch.object(service, '_fetch_economic_context', AsyncMock(return_value={'data_source': 'fred_api'})):
+            first = await service.get_comprehensive_dividend_analysis('aaa', date(2019, 1, 1), date(2023, 12, 31))
+            again = await service.get_comprehensive_dividend_analysis('AAA', date(2019, 1, 1), date(2023, 12, 31))
+            await service.get_comprehensive_dividend_analysis('AAA', date(2020, 1, 1), date(2023, 12, 31))
+            # Each caller gets its own deep copy, so mutating a response leaves the cache intact
+            assert again == first and again is not first
+            assert again['dividend_quality_score'] is not first['dividend_quality_score']
+            again['dividend_quality_score']['quality_score'] = -1
+            third = await service.get_comprehensive_dividend_analysis('AAA', date(2019, 1, 1), date(2023, 12, 31))
+        dividend_service_module._analysis_cache.clear()
+
+        assert third == first
+        assert first['ticker'] == 'AAA'
+        assert fetch.await_count == 2
+        # Sections that were not requested share the read-only placeholders
+        assert first['forecast'] is dividend_service_module._NOT_REQUESTED_FORECAST
+        assert first['peer_benchmarking']['status'] == 'not_requested'
+
+    @pytest.mark.asyncio
+    async def test_comprehensive_analysis_overlaps_fetches(self, service, quarterly_dividends):
+        """Dividend and financial analytics run before the economic context arrives; failed fetches become empty"""
+        dividend_service_module._analysis_cache.clear()
+        economic_ready = asyncio.Event()
+        scored_before_economic = []
+
+        async def slow_economic_context():
+            await economic_ready.wait()
+            return {}
+
+        def quality_score(dividends, financials, aggregates=None):
+            scored_before_economic.append(not economic_ready.is_set())
+            economic_ready.set()
+            return {'quality_score': 50.0}
+
+        with patch.object(service, '_fetch_multi_source_dividends', AsyncMock(return_value=DividendHistory(quarterly_dividends))), \
+                patch.object(service, '_fetch_comprehensive_financials', AsyncMock(side_effect=RuntimeError('down'))), \
+                patch.object(service, '_fetch_market_data', AsyncMock(return_value={'current_price': 50.0})), \
+                patch.object(service, '_fetch_economic_context', slow_economic_context), \
+                patch.object(service, '_calculate_professional_quality_score', side_effect=quality_score) as quality:
+            analysis = await service.get_comprehensive_dividend_analysis('AAA', date(2019, 1, 1), date(2023, 12, 31))
+        # An analysis built around a failed fetch is served but not cached
+        assert dividend_service_module._analysis_cache.get(('AAA', date(2019, 1, 1), date(2023, 12, 31), False, False)) is None
+
+        assert scored_before_economic == [True]
+        assert quality.call_args.args[1] == {}
+        assert analysis['dividend_quality_score'] == {'quality_score': 50.0}
+
+    @pytest.mark.asyncio
+    async def test_comprehensive_analysis_cancels_fetches_without_dividends(self, service):
+        """Remaining fetches are cancelled once there is no dividend data to analyse"""
+        economic_cancelled = asyncio.Event()
+
+        async def hanging_economic_context():
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                economic_cancelled.set()
+                raise
+
+        with patch.object(service, '_fetch_multi_source_dividends', AsyncMock(return_value=[])), \
+                patch.object(service, '_fetch_comprehensive_financials', AsyncMock(return_value={})), \
+                patch.object(service, '_fetch_market_data', AsyncMock(return_value={})), \
+                patch.object(service, '_fetch_economic_context', hanging_economic_context):
+            with pytest.raises(TickerNotFoundError):
+                await service.get_comprehensive_dividend_analysis('NONE')
+            await asyncio.wait_for(economic_cancelled.wait(), timeout=5)
+
+    @pytest.mark.asyncio
+    async def test_fred_indicators_share_session(self, service):
+        """All FRED series are fetched through one session and unusable series are dropped"""
+        service.fred_api_key = 'test-key'
+        _FakeSession.opened = 0
+        dividend_service_module._fred_indicators_cache.clear()
+        await dividend_service_module.close_http_session()
+
+        with patch.object(dividend_service_module.aiohttp, 'ClientSession', _FakeSession):
+            indicators = await service._get_fred_economic_indicators()
+            # Later requests are served from the shared snapshot
+            assert await service._get_fred_economic_indicators() is indicators
+            # Other provider fetches on the same loop reuse the pooled session
+            assert await dividend_service_module._get_http_session() is await dividend_service_module._get_http_session()
+            await dividend_service_module.close_http_session()
+        dividend_service_module._fred_indicators_cache.clear()
+
+        assert _FakeSession.opened == 1
+        assert list(indicators) == ['treasury_10y', 'treasury_2y', 'federal_funds_rate',
+                                    'inflation_rate', 'gdp_growth']
+        assert indicators['treasury_10y'] == {'value': 4.2, 'date': '2024-01-01', 'series_id': 'GS10'}
+        # The shared snapshot is read-only all the way down
+        with pytest.raises(TypeError):
+            indicators['treasury_10y']['value'] = 0.0
+
+    @pytest.mark.asyncio
+    async def test_ticker_info_cached_read_only(self, service):
+        """Yahoo Finance info is fetched once per ticker and shared as a read-only mapping"""
+        dividend_service_module._ticker_info_cache.clear()
+        with patch.object(dividend_service_module, '_fetch_info_sync', return_value={'sector': 'Utilities'}) as fetch_info:
+            info = await service._fetch_ticker_info('aaa')
+            assert await service._fetch_ticker_info('AAA') is info
+        dividend_service_module._ticker_info_cache.clear()
+
+        assert fetch_info.call_count == 1
+        assert info['sector'] == 'Utilities'
+        with pytest.raises(TypeError):
+            info['sector'] = 'Energy'
+
+    def test_http_session_closed_on_loop_change(self):
+        """A session left over from another event loop is closed before a new one replaces it"""
+        with patch.object(dividend_service_module.aiohttp, 'ClientSession', _FakeSession):
+            first = asyncio.run(dividend_service_module._get_http_session())
+            second = asyncio.run(dividend_service_module._get_http_session())
+            asyncio.run(dividend_service_module.close_http_session())
+
+        assert second is not first
+        assert first.closed and second.closed
+
+    def test_utc_timestamp_format(self):
+        """Analysis timestamps keep the naive microsecond UTC isoformat"""
+        now = datetime(2023, 11, 14, 22, 13, 20, 750000, tzinfo=timezone.utc)
+        with patch.object(dividend_service_module, 'datetime', wraps=datetime) as clock:
+            clock.now.return_value = now
+            assert dividend_service_module._utc_timestamp() == '2023-11-14T22:13:20.750000'
+
+    def test_yf_ticker_handle_is_shared(self):
+        """Helpers reuse one yf.Ticker handle per symbol"""
+        dividend_service_module._yf_ticker_cache.clear()
+        with patch.object(dividend_service_module.yf, 'Ticker', side_effect=lambda symbol: object()) as ticker_cls:
+            first = dividend_service_module._get_yf_ticker('msft')
+            assert dividend_service_module._get_yf_ticker('MSFT') is first
+            assert ticker_cls.call_count == 1
+        dividend_service_module._yf_ticker_cache.clear()
+
+    @pytest.mark.asyncio
+    async def test_yfinance_dividends_newest_first(self, service):
+        """Dividend rows come out newest first with zero-dividend days dropped"""
+        hist = pd.DataFrame(
+            {'Close': [10.0, 10.5, 11.0], 'Dividends': [0.25, 0.0, 0.26]},
+            index=pd.DatetimeIndex(['2023-02-10', '2023-03-01', '2023-05-10'])
+        )
+        stock = SimpleNamespace(history=lambda **kwargs: hist)
+
+        with patch.object(dividend_service_module, '_get_yf_ticker', return_value=stock):
+            dividends = await service._get_yfinance_dividends('AAA', date(2023, 1, 1), date(2023, 12, 31))
+
+        assert [d['ex_date'] for d in dividends] == [date(2023, 5, 10), date(2023, 2, 10)]
+        assert [d['amount'] for d in dividends] == [0.26, 0.25]
+        assert type(dividends[0]['amount']) is float
+
+    def test_alpha_vantage_dates_parsed(self, service):
+        """Alpha Vantage monthly rows parse to dates, newest first, skipping months without a dividend"""
+        data = {'Monthly Adjusted Time Series': {
+            '2023-03-31': {'7. dividend amount': '0.2400'},
+            '2023-04-28': {'7. dividend amount': '0.0000'},
+            '2023-06-30': {'7. dividend amount': '0.2500'},
+        }}
+        dividends = service._process_av_dividend_data(data)
+
+        assert [d['ex_date'] for d in dividends] == [date(2023, 6, 30), date(2023, 3, 31)]
+        assert service._process_av_dividend_data({'Monthly Adjusted Time Series': {'2023/06/30': {'7. dividend amount': '1'}}}) == []
+
+    @pytest.mark.asyncio
+    async def test_company_financial_metrics_latest_period(self, service):
+        """Statement metrics come from the latest column; free cash flow is derived"""
+        periods = ['2023-12-31', '2022-12-31']
+        statements = {
+            'financials': pd.DataFrame({periods[0]: [100.0, 400.0], periods[1]: [90.0, 380.0]}, index=['Net Income', 'Total Revenue']),
+            'balance_sheet': pd.DataFrame(),
+            'cashflow': pd.DataFrame({periods[0]: [150.0, -40.0], periods[1]: [140.0, -35.0]},
+                                     index=['Operating Cash Flow', 'Capital Expenditures'])
+        }
+
+        with patch.object(dividend_service_module, '_fetch_statement_sync', side_effect=lambda ticker, name: statements[name]):
+            metrics = await service._get_company_financial_metrics('AAA')
+
+        assert metrics['net_income'] == 100.0
+        assert metrics['operating_income'] is None
+        assert 'total_assets' not in metrics
+        assert metrics['free_cash_flow'] == 110.0
+
+    def test_grade_lookup_boundaries(self, service, quarterly_dividends):
+        """Table-driven grades keep the original strict/inclusive cut-offs"""
+        assert service._calculate_yield_stability([2.0, 2.0, 2.0]) == 'Very Stable'
+        assert service._calculate_yield_stability([1.0, 3.0, 5.0]) == 'Very Volatile'
+        assert service._calculate_yield_stability([1.0, 2.0]) == 'Unknown'
+
+        financials = {'eps': 1.0}
+        grades = {}
+        for eps_coverage, fcf_coverage in [(3.0, 2.5), (3.0, 2.0), (2.0, 3.0), (1.6, 1.3), (1.5, 9.0)]:
+            ratios = dividend_service_module.CoverageRatios(1.0, 0.5, eps_coverage, fcf_coverage)
+            grades[(eps_coverage, fcf_coverage)] = service._analyze_dividend_coverage(quarterly_dividends, financials, ratios=ratios)['coverage_grade']
+        assert grades == {(3.0, 2.5): 'A', (3.0, 2.0): 'B', (2.0, 3.0): 'C', (1.6, 1.3): 'C', (1.5, 9.0): 'D'}
+
+        # Risk analytics bands include their upper bound: a payout of exactly 0.8 scores 20 points
+        ratios = dividend_service_module.CoverageRatios(1.0, 0.8, 0.0, 3.0)
+        risk = service._calculate_risk_analytics(quarterly_dividends, {'debt_to_equity': 0}, 3.0, ratios=ratios)
+        assert (risk['risk_score'], risk['risk_rating']) == (20, 'Very Low')
+
+        # Every factor past its top tier scores the full 25 points; coverage of exactly 1.0 is one tier lower
+        ratios = dividend_service_module.CoverageRatios(1.0, 1.01, 0.0, 0.99)
+        risk = service._calculate_risk_analytics(quarterly_dividends, {'debt_to_equity': 101}, 6.01, ratios=ratios)
+        assert (risk['risk_score'], risk['risk_rating']) == (100, 'Very High')
+        ratios = dividend_service_module.CoverageRatios(1.0, 1.01, 0.0, 1.0)
+        assert service._calculate_risk_analytics(quarterly_dividends, {'debt_to_equity': 101}, 6.01, ratios=ratios)['risk_score'] == 95
+
+    def test_coverage_analytics_grade_table(self, service):
+        """Coverage ratio grades include their lower bound and share the assessment above 2.5x"""
+        dividends = [{'ex_date': date(2024, month, 5), 'amount': 0.25} for month in (10, 7, 4, 1)]
+        ratios = dividend_service_module.CoverageRatios(1.0, 1 / 3, 3.0, 1.0)
+
+        coverage = service._calculate_coverage_analytics(dividends, {'eps': 3.0}, ratios=ratios)
+
+        assert coverage['coverage_grades']['eps_grade'] == 'A+'
+        assert coverage['coverage_grades']['fcf_grade'] == 'D'
+        assert coverage['coverage_grades']['composite_grade'] == 'A+'
+        assert coverage['coverage_assessment'].startswith('Excellent Coverage')
+        assert service.sector_benchmarks is dividend_service_module._SECTOR_BENCHMARKS
+
+    def test_consistency_streak_stops_at_cut(self, service):
+        """The increase streak counts back from the latest year and stops at the first flat or lower year"""
+        amounts = {2018: 1.0, 2019: 1.1, 2020: 1.1, 2021: 1.2, 2022: 1.3}
+        history = [{'ex_date': date(year, 6, 1), 'amount': amount} for year, amount in sorted(amounts.items(), reverse=True)]
+
+        metrics = service._calculate_consistency_metrics(history)
+
+        assert metrics['years_of_consecutive_increases'] == 2
+        assert metrics['years_of_consecutive_payments'] == 5
+        assert 0 < metrics['dividend_consistency_score'] <= 10
+
+    def test_coverage_metrics_batch(self, service):
+        """Batch ratios mask invalid denominators; the single-ticker path drops them and prefers reported payout"""
+        ratios = service._calculate_coverage_metrics_batch(
+            net_income=np.array([100.0, -5.0]), dividends_paid=np.array([-40.0, -10.0]),
+            free_cash_flow=np.array([80.0, np.nan]), total_debt=np.array([50.0, 10.0]),
+            shareholders_equity=np.array([200.0, 0.0]), operating_income=np.array([30.0, 4.0]),
+            interest_expense=np.array([5.0, 0.0])
+        )
+        assert ratios['payout_ratio'][0] == pytest.approx(40.0) and np.isnan(ratios['payout_ratio'][1])
+        assert ratios['free_cash_flow_payout_ratio'][0] == pytest.approx(50.0)
+        assert np.isnan(ratios['debt_to_equity_ratio'][1]) and np.isnan(ratios['interest_coverage_ratio'][1])
+
+        financial_metrics = {'net_income': 100.0, 'dividends_paid': -40.0, 'total_debt': 50.0, 'shareholders_equity': 200.0}
+        assert service._calculate_coverage_metrics([], financial_metrics, {'payout_ratio': 0.5}) == {
+            'payout_ratio': 50.0, 'debt_to_equity_ratio': 0.25
+        }
+
+    def test_chart_helpers_use_columns(self, service):
+        """Chart insight helpers agree with their list-based definitions"""
+        chart_data = [
+            {'dividend_yield': 3.0, 'stock_price': 50.0, 'dividend_growth': None},
+            {'dividend_yield': 2.5, 'stock_price': 60.0, 'dividend_growth': 5.0},
+            {'dividend_yield': 2.0, 'stock_price': 75.0, 'dividend_growth': 8.0},
+        ]
+
+        comparison = service._compare_current_vs_average(chart_data)
+        assert comparison['current_yield_vs_avg'] == -0.5
+        assert comparison['yield_percentile'] == 0.0
+        assert service._calculate_correlation(chart_data) < -0.9
+        assert service._calculate_growth_sustainability_score(chart_data) == 100
+
+        # Unparseable or non-finite inputs fall back to no correlation instead of raising
+        garbled = [{**row, 'stock_price': 'n/a'} for row in chart_data]
+        assert service._calculate_correlation(garbled) == 0.0
+        unbounded = [{**row, 'stock_price': float('inf')} for row in chart_data]
+        assert service._calculate_correlation(unbounded) == 0.0
+
+    @pytest.mark.asyncio
+    async def test_annual_forecast_and_aristocrat_share_annuals(self, service):
+        """Forecast growth and the aristocrat streak come from the same annual totals"""
+        history = [{'ex_date': date(year, 6, 1), 'amount': 1.0 * 1.1 ** (year - 2015)} for year in range(2023, 2014, -1)]
+        annual = service._aggregate_annual_dividends(DividendHistory(history))
+
+        assert annual.increase_streak() == 8
+        assert service._determine_aristocrat_status(history, annual)['is_dividend_aristocrat'] is False
+
+        forecasts = await service._generate_dividend_forecast('AAA', history, {}, {}, annual_dividends=annual)
+        assert [f['forecast_date'] for f in forecasts] == [date(2024, 12, 31), date(2025, 12, 31), date(2026, 12, 31)]
+        assert forecasts[0]['estimated_amount'] == pytest.approx(1.1 ** 9, abs=1e-4)
+        assert forecasts[0]['confidence_level'] == pytest.approx(0.8)
+
+    def test_current_dividend_info_last_year(self, service):
+        """Annual estimate and frequency use only payments from the last 365 days"""
+        today = date.today()
+        history = [{'ex_date': today - timedelta(days=days), 'amount': 0.5} for days in (10, 100, 190, 280, 370)]
+
+        info = service._get_current_dividend_info({'dividend_yield': 0.02}, history)
+
+        assert info['last_dividend_amount'] == 0.5
+        assert info['estimated_annual_dividend'] == pytest.approx(2.0)
+        assert info['frequency'] == dividend_service_module.DividendFrequency.QUARTERLY
+
+    def test_legacy_quality_score_batch(self, service):
+        """Table-driven 0-10 quality score keeps the band edges and caps at 10"""
+        scores = service._calculate_dividend_quality_score_batch(
+            np.array([6.0, 8.0, np.nan]), np.array([10.0, 4.0, np.nan]), np.array([60.0, 100.0, np.nan]),
+            np.array([10.0, 5.0, 0.0]), np.array([55, 10, 0]), np.array([True, False, False]), np.array([True, False, False])
+        )
+        assert scores.tolist() == [10.0, 1.5 + 1.0 + 1.0 + 1.0 + 1.0, 0.0]
+
+        analysis = {'current_dividend_yield': 3.0, 'payout_ratio': 0, 'dividend_consistency_score': 5.0}
+        assert service._calculate_dividend_quality_score(analysis) == 3.0
+
+    @pytest.mark.asyncio
+    async def test_chart_fetches_use_shared_ticker(self, service):
+        """Price history and peers come from the shared yf.Ticker handle"""
+        prices = pd.DataFrame({'Close': [50.0, 51.0]})
+        stock = SimpleNamespace(history=lambda start, end: prices, get_peers=lambda: ['BBB', 'CCC'])
+
+        with patch.object(dividend_service_module, '_get_yf_ticker', return_value=stock) as get_ticker:
+            assert await service.get_price_history('aaa', date(2024, 1, 1), date(2024, 6, 30)) is prices
+            assert await service.get_peer_tickers('aaa') == ['BBB', 'CCC']
+
+        assert [call.args for call in get_ticker.call_args_list] == [('aaa',), ('aaa',)]